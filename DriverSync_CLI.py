@@ -1,211 +1,609 @@
-"""
-----------------------------------------------------------------------------------------------------
-DriverSync
-
-Version: 0.8
-Author:  Pazzie
-Email:   cenodude@outlook.com
-Discord: cenodude#2185
-
-GitHub:  https://github.com/cenodude/DriverSync
-
-Description:
-    This script (DriverSync) helps synchronize driver-related data between iOverlay and CrewChief.
-
-Disclaimer:
-    Use this script at your own risk. The author (Pazzie) is not responsible for any damage, data 
-    loss, or other consequences resulting from the use or misuse of this script. The user assumes 
-    all risks associated with its operation. 
-
-    Furthermore, iOverlay and CrewChief are not affiliated with or endorsed by this project in any 
-    way. Any references to or integrations with iOverlay or CrewChief are solely the responsibility 
-    of the user, and neither iOverlay nor CrewChief hold any liability for its use.
-
-----------------------------------------------------------------------------------------------------
-"""
-
-from pathlib import Path
-import sys
-import time
-import argparse
-import subprocess
-import json
-
-from _driversync_logics import DriverSync
-from _backup import BackupManager
-
-ABOUT_TEXT = """
-DriverSync
-Version: 0.8
-Developed by Pazzie
-DriverSync helps synchronize data between iOverlay and CrewChief, ensuring consistency and efficiency.
-GitHub Repository: https://github.com/cenodude/DriverSync
-"""
-
-CONFIG_FILE = Path("config.json")
-LOGS_FOLDER = Path("Logs")
-BACKUP_FOLDER = Path("Backup")
-ANALYTICS_FILE = Path("analytics.json")
-
-DEFAULT_CONFIG = {
-    "ioverlay_settings_path": "",
-    "crewchief_reputations_path": "",
-    "backup_files": True,
-    "backup_retention_days": 5,
-    "minimize_to_tray": False,
-    "update_existing_entries": False,
-    "sync_behavior": "Additive Only",
-    "scheduler_interval": None,
-    "enabled_categories": {}
-}
-
-def validate_config():
-    if not CONFIG_FILE.exists():
-        raise FileNotFoundError(
-            f"Error: '{CONFIG_FILE}' is missing.\n"
-            "Please set up the configuration using the DriverSync GUI to create a valid config.json.\n"
-        )
-    try:
-        with CONFIG_FILE.open("r") as file:
-            config = json.load(file)
-            if not all(key in config for key in ["ioverlay_settings_path", "crewchief_reputations_path"]):
-                raise ValueError(
-                    "Invalid configuration. Missing required keys in config.json.\n"
-                )
-    except (json.JSONDecodeError, ValueError) as e:
-        raise ValueError(
-            f"Error: '{CONFIG_FILE}' is invalid. {e}\n"
-        )
-
-def perform_backup(synchronizer):
-    print("Creating backup...")
-    try:
-        files_to_backup = [Path(synchronizer.ioverlay_path), Path(synchronizer.crewchief_path)]
-        backup_manager = BackupManager()
-        backup_path = backup_manager.create_backup_zip(
-            files=files_to_backup, backup_folder=BACKUP_FOLDER, log_func=synchronizer.log
-        )
-        print(f"Backup created successfully: {backup_path}")
-    except Exception as e:
-        print(f"Error creating backup: {e}")
-
-def perform_sync(synchronizer):
-    print("Starting synchronization...")
-    try:
-        success, stats = synchronizer.synchronize_files(dry_run=False)
-        if success:
-            print("Synchronization completed successfully.")
-            print(f"Drivers added to iOverlay: {stats.get('added_to_ioverlay', 0)}")
-            print(f"Drivers added to CrewChief: {stats.get('added_to_crewchief', 0)}")
-        else:
-            print("Synchronization failed.")
-    except Exception as e:
-        print(f"Error during synchronization: {e}")
-
-def start_scheduler(synchronizer, interval):
-    import schedule
-
-    def job():
-        print("Running scheduled synchronization...")
-        perform_sync(synchronizer)
-
-    print(f"Starting scheduler with an interval of {interval} hour(s).")
-    schedule.every(interval).hours.do(job)
-
-    try:
-        while True:
-            schedule.run_pending()
-            time.sleep(1)
-    except KeyboardInterrupt:
-        print("Scheduler stopped.")
-
-def run_in_background(script_args):
-    script_path = sys.executable if getattr(sys, "frozen", False) else Path(__file__)
-    subprocess.Popen(
-        [str(script_path)] + script_args,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-        stdin=subprocess.DEVNULL,
-        creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-    )
-    print("DriverSync CLI is running in the background.")
-
-def reset_config():
-    """
-    Deletes the configuration file (config.json) to reset the application to its default state.
-    """
-    print("Resetting configuration...")
-    if CONFIG_FILE.exists():
-        CONFIG_FILE.unlink()
-        print("Configuration reset successfully (config.json deleted).")
-    else:
-        print("Configuration file not found. No reset needed.")
-
-def show_analytics():
-    if not ANALYTICS_FILE.exists():
-        print("No analytics data found.")
-        return
-
-    with ANALYTICS_FILE.open("r") as file:
-        analytics_data = json.load(file)
-
-    if not analytics_data:
-        print("No analytics data found.")
-        return
-
-    latest_record = analytics_data[-1]
-    print("Latest Synchronization Analytics:")
-    print(f"  Total Drivers in iOverlay: {latest_record['total_ioverlay']}")
-    print(f"  Total Drivers in CrewChief: {latest_record['total_crewchief']}")
-
-def show_about():
-    print(ABOUT_TEXT)
-
-def main():
-    parser = argparse.ArgumentParser(description="DriverSync Helper CLI", formatter_class=argparse.RawTextHelpFormatter)
-    parser.add_argument("--sync", action="store_true", help="Perform synchronization based on config.json settings.")
-    parser.add_argument("--backup", action="store_true", help="Create a backup of the iOverlay and CrewChief files.")
-    parser.add_argument("--about", action="store_true", help="Display information about DriverSync, including version and GitHub link.")
-    parser.add_argument("--scheduler", type=int, help="Run synchronization periodically at the specified interval (in hours).")
-    parser.add_argument("--background", action="store_true", help="Run the script in the background (used with --scheduler).")
-    parser.add_argument("--reset", action="store_true", help="Reset configuration.")
-    parser.add_argument("--analytics", action="store_true", help="Show analytics summary.")
-    args = parser.parse_args()
-
-    if args.reset:
-        reset_config()
-        return
-
-    if not args.about:
-        try:
-            validate_config()
-        except (FileNotFoundError, ValueError) as e:
-            print(e)
-            sys.exit(1)
-
-    if args.about:
-        show_about()
-        return
-
-    synchronizer = DriverSync(log_to_gui=lambda *args, **kwargs: None)
-
-    if args.backup:
-        perform_backup(synchronizer)
-
-    if args.sync:
-        perform_sync(synchronizer)
-
-    if args.scheduler:
-        if args.background:
-            run_in_background(["--scheduler", str(args.scheduler)])
-        else:
-            start_scheduler(synchronizer, args.scheduler)
-
-    if args.analytics:
-        show_analytics()
-
-    if not any(vars(args).values()):
-        parser.print_help()
-
-if __name__ == "__main__":
-    main()
+﻿"""
+----------------------------------------------------------------------------------------------------
+DriverSync
+
+Version: 0.8
+Author:  Pazzie
+Email:   cenodude@outlook.com
+Discord: cenodude#2185
+
+GitHub:  https://github.com/cenodude/DriverSync
+
+Description:
+    This script (DriverSync) helps synchronize driver-related data between iOverlay and CrewChief.
+
+Disclaimer:
+    Use this script at your own risk. The author (Pazzie) is not responsible for any damage, data 
+    loss, or other consequences resulting from the use or misuse of this script. The user assumes 
+    all risks associated with its operation. 
+
+    Furthermore, iOverlay and CrewChief are not affiliated with or endorsed by this project in any 
+    way. Any references to or integrations with iOverlay or CrewChief are solely the responsibility 
+    of the user, and neither iOverlay nor CrewChief hold any liability for its use.
+
+----------------------------------------------------------------------------------------------------
+"""
+
+from pathlib import Path
+import sys
+import argparse
+import json
+from datetime import datetime, time as day_time
+
+# The CLI imports no Qt. Modules only some commands need (the sync engine, backups, restore,
+# verification) are imported where they are used, and main() only builds a DriverSync for commands
+# that run in this process. Commands answered by the daemon neither import the sync engine nor
+# read the data files, so they start fast.
+from _analytics_store import open_analytics_store, AGGREGATIONS
+from _daemon import DaemonError, DriverSyncDaemon, connect_to_daemon
+from _metrics import SYNC_PHASES
+from _sync_timer import ADAPTIVE_DEFAULTS, AdaptiveSchedule, CronSchedule, IntervalSchedule
+
+ABOUT_TEXT = """
+DriverSync
+Version: 0.8
+Developed by Pazzie
+DriverSync helps synchronize data between iOverlay and CrewChief, ensuring consistency and efficiency.
+GitHub Repository: https://github.com/cenodude/DriverSync
+"""
+
+CONFIG_FILE = Path("config.json")
+LOGS_FOLDER = Path("Logs")
+BACKUP_FOLDER = Path("Backup")
+
+DEFAULT_CONFIG = {
+    "ioverlay_settings_path": "",
+    "crewchief_reputations_path": "",
+    "backup_files": True,
+    "backup_retention_days": 5,
+    "backup_codec": "zlib",
+    "backup_compression_level": 6,
+    "backup_mode": "delta",
+    "backup_full_every": 24,
+    "backup_keep_count": 0,
+    "backup_max_size_mb": 0,
+    "backup_keep_hourly": 0,
+    "backup_keep_daily": 0,
+    "backup_keep_weekly": 0,
+    "backup_verify_interval_hours": 24,
+    "backup_verify_io_mb_s": 20,
+    "analytics_retention_days": 90,
+    "minimize_to_tray": False,
+    "update_existing_entries": False,
+    "sync_behavior": "Additive Only",
+    "scheduler_interval": None,
+    "scheduler_interval_minutes": None,
+    "scheduler_cron": None,
+    "scheduler_adaptive": False,
+    "scheduler_min_minutes": 5,
+    "scheduler_max_minutes": 240,
+    "read_retry_attempts": 5,
+    "read_retry_base_ms": 100,
+    "read_retry_max_ms": 2000,
+    "enabled_categories": {}
+}
+
+def validate_config():
+    if not CONFIG_FILE.exists():
+        raise FileNotFoundError(
+            f"Error: '{CONFIG_FILE}' is missing.\n"
+            "Please set up the configuration using the DriverSync GUI to create a valid config.json.\n"
+        )
+    try:
+        with CONFIG_FILE.open("r") as file:
+            config = json.load(file)
+            if not all(key in config for key in ["ioverlay_settings_path", "crewchief_reputations_path"]):
+                raise ValueError(
+                    "Invalid configuration. Missing required keys in config.json.\n"
+                )
+    except (json.JSONDecodeError, ValueError) as e:
+        raise ValueError(
+            f"Error: '{CONFIG_FILE}' is invalid. {e}\n"
+        )
+
+def perform_backup(synchronizer):
+    from _backup import BackupManager
+
+    print("Creating backup...")
+    try:
+        files_to_backup = [Path(synchronizer.ioverlay_path), Path(synchronizer.crewchief_path)]
+        backup_manager = BackupManager()
+        backup_path = backup_manager.create_backup(
+            files=files_to_backup, backup_folder=BACKUP_FOLDER, log_func=synchronizer.log
+        )
+        print(f"Backup created successfully: {backup_path}")
+    except Exception as e:
+        print(f"Error creating backup: {e}")
+
+def create_synchronizer():
+    from _driversync_logics import DriverSync
+
+    return DriverSync(log_to_gui=lambda *args, **kwargs: None)
+
+def run_sync(synchronizer, backup_files=False):
+    """
+    Runs a synchronization. With backup_files, the files the sync is about to write are backed
+    up first; nothing is backed up when both files are already in sync.
+
+    Returns:
+        tuple: (success, stats) with the sync statistics, or the error under "error".
+    """
+    from _backup import BackupManager
+
+    try:
+        backup = None
+        if backup_files:
+            files_to_backup = [Path(synchronizer.ioverlay_path), Path(synchronizer.crewchief_path)]
+            backup = BackupManager().start_backup(files_to_backup, BACKUP_FOLDER, log_func=synchronizer.log)
+        success, stats, _ = synchronizer.synchronize_files(dry_run=False, backup=backup)
+        return success, stats
+    except Exception as e:
+        return False, {"error": str(e)}
+
+def print_sync_result(success, stats):
+    if success:
+        print("Synchronization completed successfully.")
+        print(f"Drivers added to iOverlay: {stats.get('added_to_ioverlay', 0)}")
+        print(f"Drivers added to CrewChief: {stats.get('added_to_crewchief', 0)}")
+    elif stats.get("error"):
+        print(f"Synchronization failed: {stats['error']}")
+    else:
+        print("Synchronization failed.")
+
+def perform_sync(synchronizer, backup_files=False):
+    """
+    Runs a synchronization and prints its outcome.
+
+    Returns:
+        dict or None: The sync statistics, or None if the synchronization failed.
+    """
+    print("Starting synchronization...")
+    success, stats = run_sync(synchronizer, backup_files)
+    print_sync_result(success, stats)
+    return stats if success else None
+
+def perform_profiled_sync(synchronizer, backup_files=False):
+    """
+    Runs a synchronization under cProfile and tracemalloc, prints its outcome and the hottest
+    functions, and saves the profile and top allocations to the Logs folder.
+
+    Returns:
+        dict or None: The sync statistics, or None if the synchronization failed.
+    """
+    from _profiling import SyncProfiler
+
+    profiler = SyncProfiler()
+    stats = profiler.run(perform_sync, synchronizer, backup_files)
+    print(profiler.summary())
+    print(f"Profile saved to {profiler.profile_path}; top allocations in {profiler.report_path}.")
+    return stats
+
+def show_plan(plan):
+    """
+    Print the changes a synchronization would make.
+    """
+    for change in plan["changes"]:
+        print(f"  {change['action']} ({change['source']}): {change['details']}")
+    if plan["changes"]:
+        print(f"{len(plan['changes'])} change(s) would be made.")
+    else:
+        print("Both files are in sync; a synchronization would change nothing.")
+
+def plan_sync(synchronizer):
+    """
+    Plan a synchronization without writing anything, like the daemon's plan command.
+
+    Raises:
+        ValueError: If the files could not be read or planned.
+    """
+    success, stats, preview_data = synchronizer.synchronize_files(dry_run=True)
+    if not success:
+        raise ValueError(stats.get("error", "Planning the synchronization failed"))
+    return {"stats": stats, "changes": preview_data}
+
+def run_daemon(sync_schedule=None):
+    """
+    Runs the resident daemon in this process until it is stopped with --stop or interrupted.
+    With a schedule, it synchronizes on that schedule; the next run time is saved, so a restarted
+    daemon resumes its countdown and catches up once on runs it missed.
+    """
+    daemon = DriverSyncDaemon(
+        create_synchronizer, run_sync, sync_schedule,
+        log_func=lambda message, level="info": print(message, flush=True)
+    )
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+def show_daemon_status(client):
+    status = client.request("status")
+    print(f"DriverSync daemon is running (pid {status['pid']}) since {status['started'].replace('T', ' ')}.")
+    if status["schedule"]:
+        next_run = status["next_run"].replace("T", " ") if status["next_run"] else "not scheduled"
+        print(f"Schedule: {status['schedule']}; next run: {next_run}.")
+    else:
+        print("Schedule: none (synchronizes on request only).")
+    if status["sync_running"]:
+        queued = " Another one is queued behind it." if status["sync_queued"] else ""
+        print(f"A synchronization is running now.{queued}")
+    last_sync = status["last_sync"]
+    if last_sync:
+        stats = last_sync["stats"]
+        outcome = (
+            f"+{stats.get('added_to_ioverlay', 0)} iOverlay, +{stats.get('added_to_crewchief', 0)} CrewChief"
+            if last_sync["success"] else f"failed: {stats.get('error', 'unknown error')}"
+        )
+        print(f"Synchronizations: {status['syncs']}; last at {last_sync['at'].replace('T', ' ')} ({outcome}).")
+
+def adaptive_schedule(bounds, synchronizer):
+    """
+    Build the adaptive schedule of --adaptive: MIN-MAX minutes, or the configured bounds if omitted.
+    """
+    config = synchronizer.config
+    if bounds:
+        try:
+            min_minutes, max_minutes = (int(value) for value in bounds.split("-", 1))
+        except ValueError:
+            raise ValueError("Use --adaptive MIN-MAX, e.g. --adaptive 5-240.")
+    else:
+        min_minutes = int(config.get("scheduler_min_minutes") or ADAPTIVE_DEFAULTS["scheduler_min_minutes"])
+        max_minutes = int(config.get("scheduler_max_minutes") or ADAPTIVE_DEFAULTS["scheduler_max_minutes"])
+    return AdaptiveSchedule(min_minutes, max_minutes, [synchronizer.ioverlay_path, synchronizer.crewchief_path])
+
+def run_in_background(script_args):
+    import subprocess
+
+    command = [sys.executable] if getattr(sys, "frozen", False) else [sys.executable, str(Path(__file__).resolve())]
+    subprocess.Popen(
+        command + script_args,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        stdin=subprocess.DEVNULL,
+        creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+    )
+    print("DriverSync daemon is running in the background.")
+
+def reset_config():
+    """
+    Deletes the configuration file (config.json) to reset the application to its default state.
+    """
+    print("Resetting configuration...")
+    if CONFIG_FILE.exists():
+        CONFIG_FILE.unlink()
+        print("Configuration reset successfully (config.json deleted).")
+    else:
+        print("Configuration file not found. No reset needed.")
+
+def show_analytics():
+    store = open_analytics_store()
+    latest_record = store.latest_record()
+    if not latest_record:
+        print("No analytics data found.")
+        return
+
+    totals = store.get_totals()
+    print("Latest Synchronization Analytics:")
+    print(f"  Total Drivers in iOverlay: {latest_record.get('total_ioverlay', 0)}")
+    print(f"  Total Drivers in CrewChief: {latest_record.get('total_crewchief', 0)}")
+    print(f"All-time ({totals['syncs']} synchronizations):")
+    print(f"  Drivers added to iOverlay: {totals['total_added_to_ioverlay']}")
+    print(f"  Drivers added to CrewChief: {totals['total_added_to_crewchief']}")
+
+    for granularity, title in (("day", "Daily"), ("week", "Weekly")):
+        rollups = store.get_rollups(granularity, limit=7)
+        print(f"{title} (last {len(rollups)}):")
+        for rollup in rollups:
+            print(
+                f"  {rollup['bucket']}: {rollup['syncs']} sync(s), "
+                f"+{rollup['added_to_ioverlay']} iOverlay, +{rollup['added_to_crewchief']} CrewChief"
+            )
+
+def parse_cli_datetime(value, end_of_day=False):
+    """
+    Parse a --since/--until value ("YYYY-MM-DD", "YYYY-MM-DD HH:MM" or "DD-MM-YYYY") to epoch seconds.
+    A date without a time means the start of that day, or its end when end_of_day is set.
+    """
+    for fmt in ("%Y-%m-%d %H:%M", "%d-%m-%Y %H:%M"):
+        try:
+            return int(datetime.strptime(value, fmt).timestamp())
+        except ValueError:
+            pass
+    for fmt in ("%Y-%m-%d", "%d-%m-%Y"):
+        try:
+            day = datetime.strptime(value, fmt).date()
+            return int(datetime.combine(day, day_time.max if end_of_day else day_time.min).timestamp())
+        except ValueError:
+            pass
+    raise argparse.ArgumentTypeError(f"Invalid date '{value}'. Use YYYY-MM-DD or 'YYYY-MM-DD HH:MM'.")
+
+def query_analytics(since=None, until=None, aggregations=AGGREGATIONS, as_json=False, list_records=False):
+    """
+    Query the analytics store without loading the history into memory.
+    Records are streamed one at a time; aggregations run inside SQLite.
+    """
+    store = open_analytics_store()
+
+    if list_records:
+        for record in store.iter_range(since, until):
+            if as_json:
+                print(json.dumps(record))
+            else:
+                wall_ms = (record.get("metrics") or {}).get("wall_ms")
+                duration = f", {wall_ms:.0f} ms" if wall_ms is not None else ""
+                print(
+                    f"{record.get('timestamp', '')}: +{record.get('added_to_ioverlay', 0)} iOverlay, "
+                    f"+{record.get('added_to_crewchief', 0)} CrewChief{duration}"
+                )
+        return
+
+    result = store.aggregate(aggregations, since, until, phases=SYNC_PHASES)
+    result["range"] = {
+        "since": datetime.fromtimestamp(since).isoformat() if since is not None else None,
+        "until": datetime.fromtimestamp(until).isoformat() if until is not None else None,
+    }
+
+    if as_json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"Synchronizations: {result['syncs']}")
+    for name in aggregations:
+        print(f"{name}:")
+        for field, value in result[name].items():
+            if value is not None:
+                print(f"  {field}: {round(value, 3) if isinstance(value, float) else value}")
+
+def rebuild_analytics_rollups():
+    print("Rebuilding analytics rollups...")
+    folded = open_analytics_store().rebuild_rollups()
+    print(f"Rollups rebuilt from {folded} analytics record(s).")
+
+def show_backups():
+    from _backup_restore import list_backups
+
+    backups = list_backups(BACKUP_FOLDER)
+    if not backups:
+        print(f"No backups found in '{BACKUP_FOLDER}'.")
+        return
+    print(f"{'#':>4}  {'Created':<19}  {'Size (KB)':>9}  Backup / Files")
+    for number, backup in enumerate(backups, start=1):
+        created = backup["created"].replace("T", " ")
+        print(f"{number:>4}  {created:<19}  {backup['stored_size'] / 1024:>9.1f}  {backup['name']}: {', '.join(backup['files'])}")
+
+def verify_all_backups():
+    """
+    Verifies every backup against its recorded checksums, within the configured I/O budget.
+
+    Returns:
+        bool: True if no backup is corrupted or missing.
+    """
+    from _backup_verify import VERIFY_DEFAULTS, format_problem, verify_backups
+
+    io_budget_mb_s = VERIFY_DEFAULTS["backup_verify_io_mb_s"]
+    try:
+        with CONFIG_FILE.open("r") as file:
+            io_budget_mb_s = json.load(file).get("backup_verify_io_mb_s", io_budget_mb_s)
+    except (OSError, json.JSONDecodeError):
+        pass
+
+    print(f"Verifying backups in '{BACKUP_FOLDER}' (I/O budget: {io_budget_mb_s or 'unlimited'} MB/s)...")
+    report = verify_backups(BACKUP_FOLDER, io_budget_mb_s)
+    for problem in report["missing"]:
+        print(f"  MISSING    {format_problem(problem)}")
+    for problem in report["corrupted"]:
+        print(f"  CORRUPTED  {format_problem(problem)}")
+    print(
+        f"Checked {report['checked']} backup(s), {report['objects']} object(s), "
+        f"{report['bytes_read'] / (1024 * 1024):.1f} MB in {report['seconds']} s: "
+        f"{len(report['corrupted'])} corrupted, {len(report['missing'])} missing."
+    )
+    return not report["missing"] and not report["corrupted"]
+
+def restore_backup(synchronizer, reference, file_name=None, drivers=None, diff_only=False):
+    """
+    Shows the driver-level differences between a backup and the current files, and restores
+    the backup unless diff_only is set. Restores can be limited to one file and to some drivers.
+    """
+    from _backup_restore import diff_drivers, find_backup, read_backup_file, restore_files, restore_targets
+
+    backup = find_backup(reference, BACKUP_FOLDER)
+    targets = restore_targets(backup, [synchronizer.ioverlay_path, synchronizer.crewchief_path])
+    if file_name:
+        if file_name not in targets:
+            raise ValueError(f"'{file_name}' is not in backup {backup['name']} (files: {', '.join(backup['files'])}).")
+        targets = {file_name: targets[file_name]}
+    if not targets:
+        raise ValueError(f"Backup {backup['name']} contains none of the configured files.")
+    keys = [key.strip() for key in drivers.split(",") if key.strip()] if drivers else None
+
+    print(f"Backup {backup['name']} ({backup['created'].replace('T', ' ')}):")
+    for name, target_path in targets.items():
+        backup_data = read_backup_file(backup, name, BACKUP_FOLDER)
+        current_data = target_path.read_bytes() if target_path.exists() else None
+        try:
+            differences = diff_drivers(current_data, backup_data)
+        except ValueError as e:
+            print(f"  {name}: {e}")
+            differences = None
+        if differences is not None:
+            if keys is not None:
+                differences = [difference for difference in differences if difference["key"] in keys]
+            print(f"  {name}: {len(differences)} driver(s) differ")
+            for difference in differences:
+                print(f"    {difference['action']:<8} {difference['key']:>10}  {difference['name']}")
+
+    if not diff_only:
+        restored = restore_files(backup, targets, keys=keys, backup_folder=BACKUP_FOLDER, log_func=synchronizer.log)
+        for name, count in restored.items():
+            scope = "" if count is None else f" ({count} driver(s))"
+            print(f"  Restored {name}{scope} to {targets[name]}.")
+
+def show_about():
+    print(ABOUT_TEXT)
+
+def main():
+    parser = argparse.ArgumentParser(description="DriverSync Helper CLI", formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--sync", action="store_true", help="Perform synchronization based on config.json settings.")
+    parser.add_argument("--backup", action="store_true", help="Create a backup of the iOverlay and CrewChief files.")
+    parser.add_argument("--about", action="store_true", help="Display information about DriverSync, including version and GitHub link.")
+    parser.add_argument("--scheduler", type=int, help="Run synchronization periodically at the specified interval (in hours).")
+    parser.add_argument("--every", type=int, metavar="MINUTES", help="Run synchronization periodically every MINUTES minutes.")
+    parser.add_argument("--cron", metavar="EXPRESSION", help="Run synchronization at the times of a cron expression, e.g. \"*/15 8-23 * * *\".")
+    parser.add_argument("--adaptive", nargs="?", const="", metavar="MIN-MAX", help="Run synchronization at an interval between MIN and MAX minutes that shortens while drivers change and backs off while idle (default: the configured bounds).")
+    parser.add_argument("--background", action="store_true", help="Run the daemon in the background (used with --daemon, --scheduler, --every, --cron or --adaptive).")
+    parser.add_argument("--daemon", action="store_true", help="Run the resident DriverSync daemon, optionally on a schedule. --sync, --preview, --status and --stop are answered by it.")
+    parser.add_argument("--status", action="store_true", help="Show the state of the running daemon.")
+    parser.add_argument("--stop", action="store_true", help="Stop the running daemon.")
+    parser.add_argument("--preview", action="store_true", help="Show the changes a synchronization would make, without writing anything.")
+    parser.add_argument("--profile", action="store_true", help="With --sync: run the synchronization in this process under cProfile and tracemalloc and save the profile to the Logs folder.")
+    parser.add_argument("--reset", action="store_true", help="Reset configuration.")
+    parser.add_argument("--analytics", action="store_true", help="Show analytics summary.")
+    parser.add_argument("--since", type=parse_cli_datetime, help="With --analytics: only include syncs from this date (YYYY-MM-DD [HH:MM]).")
+    parser.add_argument("--until", type=lambda value: parse_cli_datetime(value, end_of_day=True), help="With --analytics: only include syncs up to this date (YYYY-MM-DD [HH:MM]).")
+    parser.add_argument("--agg", help=f"With --analytics: comma-separated aggregations ({', '.join(AGGREGATIONS)}).")
+    parser.add_argument("--records", action="store_true", help="With --analytics: stream the individual records instead of aggregating.")
+    parser.add_argument("--json", action="store_true", help="With --analytics: print machine-readable JSON (JSON lines with --records).")
+    parser.add_argument("--rebuild-rollups", action="store_true", help="Regenerate analytics rollups from the raw analytics history.")
+    parser.add_argument("--list-backups", action="store_true", help="List the available backups, newest first.")
+    parser.add_argument("--verify-backups", action="store_true", help="Check every backup against its recorded checksums and report corrupted or missing files.")
+    parser.add_argument("--restore", metavar="BACKUP", help="Restore a backup (name, number from --list-backups, or 'latest').")
+    parser.add_argument("--file", help="With --restore: only restore this file (e.g. settings.dat).")
+    parser.add_argument("--drivers", help="With --restore: comma-separated customer ids to restore; other drivers are left unchanged.")
+    parser.add_argument("--diff", action="store_true", help="With --restore: only show the driver-level differences.")
+    args = parser.parse_args()
+
+    if args.profile and not args.sync:
+        print("--profile is used together with --sync.")
+        sys.exit(1)
+
+    if args.reset:
+        reset_config()
+        return
+
+    if args.rebuild_rollups:
+        rebuild_analytics_rollups()
+        return
+
+    if args.list_backups:
+        show_backups()
+        return
+
+    if args.verify_backups:
+        if not verify_all_backups():
+            sys.exit(1)
+        return
+
+    if args.status or args.stop:
+        client = connect_to_daemon()
+        if client is None:
+            print("DriverSync daemon is not running.")
+            sys.exit(1)
+        if args.stop:
+            print(f"Stopped the DriverSync daemon (pid {client.request('stop')['pid']}).")
+        else:
+            show_daemon_status(client)
+        return
+
+    if not args.about:
+        try:
+            validate_config()
+        except (FileNotFoundError, ValueError) as e:
+            print(e)
+            sys.exit(1)
+
+    if args.about:
+        show_about()
+        return
+
+    # A running daemon answers from its warm state and keeps syncs from different processes in one place.
+    # A profiled sync has to run in this process, so it does not go to the daemon.
+    client = connect_to_daemon() if (args.sync and not args.profile) or args.preview else None
+
+    # The local DriverSync reads and checks both data files, so it is only built for commands run here
+    runs_locally = (
+        args.restore or args.profile or (args.backup and not args.sync) or args.adaptive is not None
+        or ((args.sync or args.preview) and client is None)
+    )
+    synchronizer = create_synchronizer() if runs_locally else None
+
+    if args.restore:
+        try:
+            restore_backup(synchronizer, args.restore, args.file, args.drivers, diff_only=args.diff)
+        except (OSError, ValueError) as e:
+            print(f"Error restoring backup: {e}")
+            sys.exit(1)
+        return
+
+    # Combined with --sync, only the files the sync changes are backed up
+    if args.backup and not args.sync:
+        perform_backup(synchronizer)
+
+    if args.sync:
+        if args.profile:
+            perform_profiled_sync(synchronizer, args.backup or synchronizer.config.get("backup_files", True))
+        elif client:
+            print("Starting synchronization in the DriverSync daemon...")
+            try:
+                result = client.request("sync-now", backup=args.backup or None)
+                print_sync_result(result["success"], result["stats"])
+            except (DaemonError, OSError, EOFError) as e:
+                print(f"Error during synchronization: {e}")
+        else:
+            perform_sync(synchronizer, args.backup or synchronizer.config.get("backup_files", True))
+
+    if args.preview:
+        try:
+            plan = client.request("plan") if client else plan_sync(synchronizer)
+        except (DaemonError, OSError, EOFError, ValueError) as e:
+            print(f"Error generating preview: {e}")
+            sys.exit(1)
+        show_plan(plan)
+
+    sync_schedule = None
+    if args.scheduler or args.every is not None or args.cron or args.adaptive is not None:
+        try:
+            if args.cron:
+                sync_schedule = CronSchedule(args.cron)
+            elif args.adaptive is not None:
+                sync_schedule = adaptive_schedule(args.adaptive, synchronizer)
+            else:
+                sync_schedule = IntervalSchedule(args.every if args.every is not None else args.scheduler * 60)
+        except ValueError as e:
+            print(f"Invalid schedule: {e}")
+            sys.exit(1)
+
+    if sync_schedule is not None or args.daemon:
+        running = connect_to_daemon()
+        if running:
+            print(f"A DriverSync daemon is already running (pid {running.info['pid']}). Stop it with --stop first.")
+            sys.exit(1)
+        if args.background:
+            if args.cron:
+                schedule_args = ["--cron", args.cron]
+            elif args.adaptive is not None:
+                schedule_args = ["--adaptive", f"{sync_schedule.min_minutes}-{sync_schedule.max_minutes}"]
+            elif sync_schedule is not None:
+                schedule_args = ["--every", str(sync_schedule.minutes)]
+            else:
+                schedule_args = []
+            run_in_background(["--daemon"] + schedule_args)
+        else:
+            run_daemon(sync_schedule)
+
+    if args.analytics:
+        if any(value is not None and value is not False for value in (args.since, args.until, args.agg, args.records, args.json)):
+            aggregations = tuple(name.strip() for name in args.agg.split(",")) if args.agg else AGGREGATIONS
+            try:
+                query_analytics(args.since, args.until, aggregations, as_json=args.json, list_records=args.records)
+            except ValueError as e:
+                print(f"Error querying analytics: {e}")
+                sys.exit(1)
+        else:
+            show_analytics()
+
+    if not any(vars(args).values()):
+        parser.print_help()
+
+if __name__ == "__main__":
+    main()
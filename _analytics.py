@@ -1,89 +1,170 @@
-import sys
-from pathlib import Path
+from datetime import datetime, time
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QPushButton, QMessageBox, QTableWidget, QTableWidgetItem, QHeaderView
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QPushButton, QMessageBox, QTableView, QHeaderView,
+    QDateEdit
 )
-from PyQt5.QtCore import Qt
-import json
-from datetime import datetime
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QDate
 from _logging import log_to_gui
+from _analytics_store import open_analytics_store, record_analytics
+from _metrics import SYNC_PHASES
 
 
-def get_analytics_file_path():
+def format_metric_cells(record):
     """
-    Resolve the correct path to _analytics.json based on execution context.
+    Format the performance metrics of a record for display; empty strings when not recorded.
     """
-    try:
-        if hasattr(sys, '_MEIPASS'):  # PyInstaller temp directory
-            base_path = Path(sys._MEIPASS)  # Directory for PyInstaller resources
-        else:
-            base_path = Path(__file__).parent.resolve()  # Script's directory during development
-
-        analytics_file = base_path / "_analytics.json"
-        return analytics_file
-    except Exception as e:
-        raise RuntimeError(f"Error resolving analytics file path: {e}")
+    metrics = record.get("metrics") or {}
+    if not metrics:
+        return ["", "", "", "", "", ""]
+
+    peak_rss_kb = metrics.get("peak_rss_kb")
+    return [
+        f"{metrics.get('wall_ms', 0):.0f}",
+        f"{metrics.get('cpu_ms', 0):.0f}",
+        f"{metrics.get('bytes_read', 0) / 1024:.0f}",
+        f"{metrics.get('bytes_written', 0) / 1024:.0f}",
+        f"{peak_rss_kb / 1024:.1f}" if peak_rss_kb is not None else "",
+        f"{metrics['read_retries']} ({metrics.get('retry_wait_ms', 0):.0f} ms)" if metrics.get("read_retries") else "",
+    ]
+
+
+def format_phase_breakdown(record):
+    """
+    Build a tooltip listing wall and CPU time per sync phase.
+    """
+    phases = (record.get("metrics") or {}).get("phases", {})
+    lines = [
+        f"{name}: {phases[name]['wall_ms']:.1f} ms wall / {phases[name]['cpu_ms']:.1f} ms CPU"
+        for name in SYNC_PHASES
+        if name in phases
+    ]
+    return "\n".join(lines)
 
 
-def initialize_analytics_file():
+def format_trend(wall_ms, average):
     """
-    Ensure that _analytics.json exists and is properly initialized.
+    Compare a run's sync time with the average of the previous runs, e.g. "▲ +12%".
     """
-    try:
-        file_path = get_analytics_file_path()
-        if not file_path.exists():
-            # print(f"Creating _analytics.json at {file_path}")
-            with file_path.open("w", encoding="utf-8") as file:
-                json.dump([], file)  # Initialize with an empty list
-        return file_path
-    except Exception as e:
-        raise RuntimeError(f"Error initializing _analytics.json: {e}")
+    if wall_ms is None or not average or average <= 0:
+        return ""
+    change = (wall_ms - average) / average * 100
+    arrow = "▲" if change > 0 else "▼" if change < 0 else "="
+    return f"{arrow} {change:+.0f}%"
 
 
-
-def record_analytics(analytics_record):
+class AnalyticsTableModel(QAbstractTableModel):
     """
-    Records analytics data to _analytics.json.
+    Lazy table model over the analytics store.
+
+    Rows are fetched a page at a time as the view scrolls; sorting and date filtering are done by
+    the store's SQL queries, so opening the dialog costs one page regardless of history length.
     """
-    try:
-        # Ensure the file exists
-        file_path = initialize_analytics_file()
-
-        # Add timestamp if missing
-        if "timestamp" not in analytics_record:
-            analytics_record["timestamp"] = datetime.now().strftime("%d-%m-%Y %H:%M")
-
-        # Load existing analytics data
-        if file_path.exists():
-            with file_path.open("r", encoding="utf-8") as file:
-                analytics_data = json.load(file)
-        else:
-            analytics_data = []
-
-        # Avoid duplicates
-        if analytics_record in analytics_data:
-            # print("Duplicate analytics record. Skipping.")
-            return
+    PAGE_SIZE = 200
+
+    # (header, store column used for sorting, cell formatter)
+    COLUMNS = [
+        ("Timestamp", "ts", lambda record: record.get("timestamp", "")),
+        ("Added to iOverlay", "added_to_ioverlay", lambda record: str(record.get("added_to_ioverlay", 0))),
+        ("Added to CrewChief", "added_to_crewchief", lambda record: str(record.get("added_to_crewchief", 0))),
+        ("Total iOverlay", "total_ioverlay", lambda record: str(record.get("total_ioverlay", 0))),
+        ("Total CrewChief", "total_crewchief", lambda record: str(record.get("total_crewchief", 0))),
+        ("Sync Time (ms)", "wall_ms", lambda record: format_metric_cells(record)[0]),
+        ("CPU (ms)", "cpu_ms", lambda record: format_metric_cells(record)[1]),
+        ("Read (KB)", "bytes_read", lambda record: format_metric_cells(record)[2]),
+        ("Written (KB)", "bytes_written", lambda record: format_metric_cells(record)[3]),
+        ("Peak RSS (MB)", "peak_rss_kb", lambda record: format_metric_cells(record)[4]),
+        ("Read Retries", "read_retries", lambda record: format_metric_cells(record)[5]),
+        ("Trend", "wall_ms", lambda record: format_trend(
+            (record.get("metrics") or {}).get("wall_ms"), record.get("trend_base_ms")
+        )),
+    ]
+    SYNC_TIME_COLUMN = 5
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.order_by = "ts"
+        self.descending = False
+        self.since = None
+        self.until = None
+        self.records = []
+        self.total = 0
+        self.reload()
+
+    def reload(self):
+        """
+        Drop the loaded rows and fetch the first page for the current sort and filter.
+        """
+        self.beginResetModel()
+        try:
+            self.total = self.store.count(self.since, self.until)
+            self.records = self._fetch(0)
+        except Exception as e:
+            log_to_gui(None, f"Failed to load analytics data: {e}", level="error", to_file=True)
+            self.total = 0
+            self.records = []
+        self.endResetModel()
+
+    def _fetch(self, offset):
+        return self.store.fetch_page(
+            offset, self.PAGE_SIZE, self.order_by, self.descending, self.since, self.until
+        )
 
-        # Append the new record and save
-        analytics_data.append(analytics_record)
-        with file_path.open("w", encoding="utf-8") as file:
-            json.dump(analytics_data, file, indent=4)
+    def set_date_range(self, since=None, until=None):
+        self.since = since
+        self.until = until
+        self.reload()
 
-        # print(f"Analytics record added: {analytics_record}")
-        log_to_gui(None, f"Analytics record added: {analytics_record}", level="info", to_file=True)
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self.records) < self.total
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        page = self._fetch(len(self.records))
+        if not page:
+            self.total = len(self.records)
+            return
+        first = len(self.records)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self.records.extend(page)
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self.records[index.row()]
+        if role == Qt.DisplayRole:
+            return self.COLUMNS[index.column()][2](record)
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter  # Centralize text
+        if role == Qt.ToolTipRole and index.column() == self.SYNC_TIME_COLUMN:
+            return format_phase_breakdown(record) or None
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][0]
+        return super().headerData(section, orientation, role)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.order_by = self.COLUMNS[column][1]
+        self.descending = order == Qt.DescendingOrder
+        self.reload()
 
-    except Exception as e:
-        # print(f"Failed to record analytics: {e}")
-        log_to_gui(None, f"Failed to record analytics: {e}", level="error", to_file=True)
-        raise
 
 class AnalyticsOverviewDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Synchronization Analytics")
 
-        fixed_width = 950
+        fixed_width = 1300
         initial_height = 400
         self.resize(fixed_width, initial_height)
 
@@ -110,22 +191,21 @@ class AnalyticsOverviewDialog(QDialog):
 
         self.layout = QVBoxLayout()
 
-        self.analytics_data = self.load_analytics_data()
-        # Reformat timestamps in loaded data
-        self.analytics_data = self.reformat_timestamps(self.analytics_data)
-        self.aggregated_data = self.aggregate_analytics_data(self.analytics_data)
+        self.store = open_analytics_store()
+        self.aggregated_data = self.load_aggregated_data()
 
         self.layout.addLayout(self.create_progress_bar("Total Added to iOverlay", "total_added_to_ioverlay"))
         self.layout.addLayout(self.create_progress_bar("Total Added to CrewChief", "total_added_to_crewchief"))
         self.layout.addLayout(self.create_progress_bar("Total Drivers in iOverlay", "total_ioverlay"))
         self.layout.addLayout(self.create_progress_bar("Total Drivers in CrewChief", "total_crewchief"))
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
-            "Timestamp", "Added to iOverlay", "Added to CrewChief", "Total iOverlay", "Total CrewChief"
-        ])
-        self.populate_table(self.analytics_data)
+        self.layout.addLayout(self.create_date_filter())
+
+        self.model = AnalyticsTableModel(self.store, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.horizontalHeader().setSortIndicator(0, Qt.AscendingOrder)
+        self.table.setSortingEnabled(True)
 
         self.table.verticalHeader().setDefaultSectionSize(20)  # Reduced row height
 
@@ -187,65 +267,72 @@ class AnalyticsOverviewDialog(QDialog):
 
         return layout
 
-    def load_analytics_data(self):
+    def create_date_filter(self):
+        layout = QHBoxLayout()
+
+        today = QDate.currentDate()
+        self.from_date = QDateEdit(today.addMonths(-1))
+        self.to_date = QDateEdit(today)
+        for date_edit in (self.from_date, self.to_date):
+            date_edit.setCalendarPopup(True)
+            date_edit.setDisplayFormat("dd-MM-yyyy")
+
+        apply_button = QPushButton("Apply Filter")
+        apply_button.clicked.connect(self.apply_date_filter)
+        clear_button = QPushButton("Show All")
+        clear_button.clicked.connect(self.clear_date_filter)
+
+        layout.addWidget(QLabel("From:"))
+        layout.addWidget(self.from_date)
+        layout.addWidget(QLabel("To:"))
+        layout.addWidget(self.to_date)
+        layout.addWidget(apply_button)
+        layout.addWidget(clear_button)
+        layout.addStretch()
+        return layout
+
+    def apply_date_filter(self):
         """
-        Load analytics data from the JSON file.
+        Limit the table to the selected days (inclusive); the store does the filtering.
         """
-        try:
-            file_path = get_analytics_file_path()  # Use the helper function
-            if file_path.exists():
-                with file_path.open("r", encoding="utf-8") as file:
-                    return json.load(file)
-            return []
-        except Exception as e:
-            log_to_gui(None, f"Failed to load analytics data: {e}", level="error", to_file=True)
-            return []
+        since = datetime.combine(self.from_date.date().toPyDate(), time.min)
+        until = datetime.combine(self.to_date.date().toPyDate(), time.max)
+        self.model.set_date_range(int(since.timestamp()), int(until.timestamp()))
+        self.adjust_window_size()
+
+    def clear_date_filter(self):
+        self.model.set_date_range()
+        self.adjust_window_size()
 
-    def reformat_timestamps(self, analytics_data):
+    def refresh(self):
         """
-        Reformat timestamps in analytics data to D-M-Y HH:MM format.
+        Reload the totals and the table, for when the dialog is shown again.
         """
-        for record in analytics_data:
-            if "timestamp" in record:
-                try:
-                    timestamp_dt = datetime.strptime(record["timestamp"], "%Y-%m-%d %H:%M:%S")  # Old format
-                    record["timestamp"] = timestamp_dt.strftime("%d-%m-%Y %H:%M")  # New format
-                except ValueError:
-                    pass  # Skip if already in the correct format
-        return analytics_data
-
-    def aggregate_analytics_data(self, analytics_data):
-        return {
-            "total_added_to_ioverlay": sum(record.get("added_to_ioverlay", 0) for record in analytics_data),
-            "total_added_to_crewchief": sum(record.get("added_to_crewchief", 0) for record in analytics_data),
-            "total_ioverlay": max((record.get("total_ioverlay", 0) for record in analytics_data), default=0),
-            "total_crewchief": max((record.get("total_crewchief", 0) for record in analytics_data), default=0),
-        }
-
-    def populate_table(self, analytics_data):
-        self.table.setRowCount(len(analytics_data))
-        for row, record in enumerate(analytics_data):
-            self.add_table_row(row, record)
+        self.aggregated_data = self.load_aggregated_data()
+        self.refresh_progress_bars()
+        self.model.reload()
+        self.adjust_window_size()
 
-    def add_table_row(self, row, record):
+    def load_aggregated_data(self):
         """
-        Adds a row to the QTableWidget with all values centrally aligned.
+        Read the precomputed all-time totals from the rollups.
         """
-        items = [
-            record.get("timestamp", ""),
-            str(record.get("added_to_ioverlay", 0)),
-            str(record.get("added_to_crewchief", 0)),
-            str(record.get("total_ioverlay", 0)),
-            str(record.get("total_crewchief", 0)),
-        ]
-
-        for col, value in enumerate(items):
-            item = QTableWidgetItem(value)
-            item.setTextAlignment(Qt.AlignCenter)  # Centralize text
-            self.table.setItem(row, col, item)
+        try:
+            return self.store.get_totals()
+        except Exception as e:
+            log_to_gui(None, f"Failed to load analytics totals: {e}", level="error", to_file=True)
+            return self.empty_totals()
+
+    def empty_totals(self):
+        return {
+            "total_added_to_ioverlay": 0,
+            "total_added_to_crewchief": 0,
+            "total_ioverlay": 0,
+            "total_crewchief": 0,
+        }
 
     def adjust_window_size(self):
-        row_count = self.table.rowCount()
+        row_count = min(self.model.total, self.model.PAGE_SIZE)
         row_height = self.table.verticalHeader().defaultSectionSize()
         table_height = row_count * row_height + self.table.horizontalHeader().height()
 
@@ -258,16 +345,14 @@ class AnalyticsOverviewDialog(QDialog):
 
     def reset_analytics(self):
         """
-        Reset analytics data by deleting the JSON file.
+        Reset analytics data by clearing the analytics store.
         """
         try:
-            file_path = get_analytics_file_path()  # Use the helper function
-            if file_path.exists():
-                file_path.unlink()
-                QMessageBox.information(self, "Reset Analytics", "All analytics data has been reset.")
+            self.store.reset()
+            QMessageBox.information(self, "Reset Analytics", "All analytics data has been reset.")
 
-            self.table.setRowCount(0)
-            self.aggregated_data = self.aggregate_analytics_data([])
+            self.model.reload()
+            self.aggregated_data = self.empty_totals()
             self.refresh_progress_bars()
             self.adjust_window_size()
 
@@ -276,11 +361,11 @@ class AnalyticsOverviewDialog(QDialog):
 
     def refresh_progress_bars(self):
         """
-        Refresh the progress bars to reflect reset values.
+        Refresh the progress bars to reflect the current totals.
         """
         for key in ["total_added_to_ioverlay", "total_added_to_crewchief", "total_ioverlay", "total_crewchief"]:
             bar = getattr(self, f"{key}_bar", None)
             label = getattr(self, f"{key}_label", None)
             if bar and label:
-                bar.setValue(0)
-                label.setText("0")
+                bar.setValue(min(self.aggregated_data[key], 100))
+                label.setText(str(self.aggregated_data[key]))
@@ -0,0 +1,771 @@
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from _logging import log_to_gui
+from _metrics import SYNC_PHASES
+
+TIMESTAMP_FORMAT = "%d-%m-%Y %H:%M"
+LEGACY_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Counters that get their own column so they can be filtered and aggregated in SQL
+COUNT_FIELDS = (
+    "added_to_ioverlay",
+    "added_to_crewchief",
+    "deleted_from_ioverlay",
+    "deleted_from_crewchief",
+    "total_ioverlay",
+    "total_crewchief",
+)
+
+# Performance columns taken from a record's "metrics" entry (see _metrics.SyncMetrics)
+METRIC_FIELDS = {
+    "wall_ms": "REAL",
+    "cpu_ms": "REAL",
+    "bytes_read": "INTEGER",
+    "bytes_written": "INTEGER",
+    "peak_rss_kb": "INTEGER",
+    "read_retries": "INTEGER",
+    "retry_wait_ms": "REAL",
+}
+
+# Columns records can be sorted on, in addition to the timestamp
+SORTABLE_COLUMNS = ("ts", *COUNT_FIELDS, *METRIC_FIELDS)
+
+# Aggregations supported by AnalyticsStore.aggregate
+AGGREGATIONS = ("sum", "max", "p50", "p95")
+
+# Duration columns summarised by the percentile aggregations
+DURATION_FIELDS = ("wall_ms", "cpu_ms")
+
+# Number of earlier runs a record's sync time is compared against for its trend
+TREND_WINDOW = 10
+
+# Default number of days raw analytics records are kept before they are folded into the rollups
+DEFAULT_RETENTION_DAYS = 90
+
+# Minimum time between two background compaction runs
+COMPACTION_INTERVAL_SECONDS = 24 * 3600
+
+# Granularities maintained in the rollups table, with the bucket label for a given datetime
+ROLLUP_GRANULARITIES = {
+    "day": lambda moment: moment.strftime("%Y-%m-%d"),
+    "week": lambda moment: "{0}-W{1:02d}".format(*moment.isocalendar()[:2]),
+    "all": lambda moment: "all",
+}
+
+
+def get_user_data_dir():
+    """
+    Resolve the persistent per-user data folder for DriverSync and make sure it exists.
+    """
+    if sys.platform == "win32":
+        base_path = os.environ.get("LOCALAPPDATA") or os.environ.get("APPDATA") or Path.home()
+    elif sys.platform == "darwin":
+        base_path = Path.home() / "Library" / "Application Support"
+    else:
+        base_path = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+
+    data_dir = Path(base_path) / "DriverSync"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
+
+
+def get_analytics_base_path():
+    """
+    Resolve the folder that held the analytics files in earlier versions (bundle or script folder).
+    """
+    if hasattr(sys, '_MEIPASS'):  # PyInstaller temp directory
+        return Path(sys._MEIPASS)
+    return Path(__file__).parent.resolve()  # Script's directory during development
+
+
+def get_analytics_file_path():
+    """
+    Resolve the path to the legacy _analytics.json file.
+    """
+    try:
+        return get_analytics_base_path() / "_analytics.json"
+    except Exception as e:
+        raise RuntimeError(f"Error resolving analytics file path: {e}")
+
+
+def get_analytics_db_path():
+    """
+    Resolve the path to the _analytics.db store in the per-user data folder.
+    """
+    try:
+        return get_user_data_dir() / "_analytics.db"
+    except Exception as e:
+        raise RuntimeError(f"Error resolving analytics store path: {e}")
+
+
+def parse_timestamp(value):
+    """
+    Parse an analytics timestamp in either the current (D-M-Y HH:MM) or the legacy format.
+
+    Returns:
+        datetime or None: The parsed timestamp, or None if it cannot be parsed.
+    """
+    for fmt in (TIMESTAMP_FORMAT, LEGACY_TIMESTAMP_FORMAT):
+        try:
+            return datetime.strptime(value, fmt)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def compute_record_key(record):
+    """
+    Hash a record into a stable key. Two records get the same key exactly when they compare equal,
+    ignoring performance metrics (they differ on every run and would defeat deduplication).
+    """
+    keyed = {key: value for key, value in record.items() if key != "metrics"}
+    canonical = json.dumps(keyed, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class AnalyticsStore:
+    """
+    Append-only SQLite store for synchronization analytics.
+
+    Each record is stored once, keyed by the SHA-256 of its contents. Duplicates are rejected by
+    the unique index, so recording a sync costs one indexed insert regardless of history length.
+    Daily, weekly and all-time rollups are updated in the same transaction as the insert.
+    """
+    SCHEMA_VERSION = 3
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self._schema_ready = False
+
+    @contextmanager
+    def connect(self):
+        """
+        Open a connection, make sure the schema exists and commit on success.
+        """
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        try:
+            if not self._schema_ready:
+                self._create_schema(conn)
+                self._schema_ready = True
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _create_schema(self, conn):
+        conn.execute("PRAGMA journal_mode=WAL")
+        count_columns = ",\n".join(f"{field} INTEGER NOT NULL DEFAULT 0" for field in COUNT_FIELDS)
+        conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS records (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                record_key TEXT NOT NULL UNIQUE,
+                ts INTEGER NOT NULL,
+                timestamp TEXT NOT NULL,
+                {count_columns},
+                payload TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_records_ts ON records(ts);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS rollups (
+                granularity TEXT NOT NULL,
+                bucket TEXT NOT NULL,
+                syncs INTEGER NOT NULL DEFAULT 0,
+                added_to_ioverlay INTEGER NOT NULL DEFAULT 0,
+                added_to_crewchief INTEGER NOT NULL DEFAULT 0,
+                deleted_from_ioverlay INTEGER NOT NULL DEFAULT 0,
+                deleted_from_crewchief INTEGER NOT NULL DEFAULT 0,
+                max_total_ioverlay INTEGER NOT NULL DEFAULT 0,
+                max_total_crewchief INTEGER NOT NULL DEFAULT 0,
+                last_ts INTEGER,
+                PRIMARY KEY (granularity, bucket)
+            );
+        """)
+
+        existing_columns = {row["name"] for row in conn.execute("PRAGMA table_info(records)")}
+        for field, column_type in METRIC_FIELDS.items():
+            if field not in existing_columns:
+                conn.execute(f"ALTER TABLE records ADD COLUMN {field} {column_type}")
+
+        version = int(self.get_meta(conn, "schema_version", 1))
+        if version < 2:
+            # Rollups did not exist yet; derive them from the records already stored
+            self._rebuild_rollups(conn)
+        if version < self.SCHEMA_VERSION:
+            self.set_meta(conn, "schema_version", self.SCHEMA_VERSION)
+
+    def add_record(self, record):
+        """
+        Append a record unless an identical one is already stored.
+
+        Args:
+            record (dict): Analytics record; a timestamp is added if missing.
+
+        Returns:
+            int or None: ID of the stored record, or None if it was a duplicate.
+        """
+        with self.connect() as conn:
+            return self._insert(conn, record)
+
+    def save_metrics(self, record_id, record, metrics):
+        """
+        Store the final metrics of a run with its already stored record.
+
+        Args:
+            record_id (int): ID returned by add_record.
+            record (dict): The stored record; its "metrics" entry is replaced.
+            metrics (SyncMetrics): Metrics of the run.
+        """
+        record["metrics"] = metrics.as_dict()
+        with self.connect() as conn:
+            self._save_metrics(conn, record_id, record)
+
+    def _insert(self, conn, record):
+        if "timestamp" not in record:
+            record["timestamp"] = datetime.now().strftime(TIMESTAMP_FORMAT)
+
+        parsed = parse_timestamp(record["timestamp"])
+        if parsed is None:
+            raise ValueError(f"Unrecognized analytics timestamp: {record['timestamp']}")
+        # Store every record with the current display format
+        record["timestamp"] = parsed.strftime(TIMESTAMP_FORMAT)
+
+        record_metrics = record.get("metrics") or {}
+        columns = ["record_key", "ts", "timestamp", *COUNT_FIELDS, *METRIC_FIELDS, "payload"]
+        values = [
+            compute_record_key(record),
+            int(parsed.timestamp()),
+            record["timestamp"],
+            *(int(record.get(field, 0) or 0) for field in COUNT_FIELDS),
+            *(record_metrics.get(field) for field in METRIC_FIELDS),
+            json.dumps(record),
+        ]
+        cursor = conn.execute(
+            f"INSERT OR IGNORE INTO records ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            values,
+        )
+        if cursor.rowcount != 1:
+            return None
+
+        self._update_rollups(conn, parsed, record)
+        return cursor.lastrowid
+
+    def _save_metrics(self, conn, record_id, record):
+        """
+        Overwrite the metrics columns and payload of an already inserted record.
+        """
+        record_metrics = record.get("metrics") or {}
+        assignments = ", ".join(f"{field} = ?" for field in METRIC_FIELDS)
+        conn.execute(
+            f"UPDATE records SET {assignments}, payload = ? WHERE id = ?",
+            [*(record_metrics.get(field) for field in METRIC_FIELDS), json.dumps(record), record_id],
+        )
+
+    def _update_rollups(self, conn, moment, record):
+        """
+        Fold a single record into its daily, weekly and all-time rollup rows.
+        """
+        counts = {field: int(record.get(field, 0) or 0) for field in COUNT_FIELDS}
+        for granularity, bucket_for in ROLLUP_GRANULARITIES.items():
+            conn.execute(
+                """
+                INSERT INTO rollups (
+                    granularity, bucket, syncs,
+                    added_to_ioverlay, added_to_crewchief, deleted_from_ioverlay, deleted_from_crewchief,
+                    max_total_ioverlay, max_total_crewchief, last_ts
+                ) VALUES (?, ?, 1, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(granularity, bucket) DO UPDATE SET
+                    syncs = syncs + 1,
+                    added_to_ioverlay = added_to_ioverlay + excluded.added_to_ioverlay,
+                    added_to_crewchief = added_to_crewchief + excluded.added_to_crewchief,
+                    deleted_from_ioverlay = deleted_from_ioverlay + excluded.deleted_from_ioverlay,
+                    deleted_from_crewchief = deleted_from_crewchief + excluded.deleted_from_crewchief,
+                    max_total_ioverlay = MAX(max_total_ioverlay, excluded.max_total_ioverlay),
+                    max_total_crewchief = MAX(max_total_crewchief, excluded.max_total_crewchief),
+                    last_ts = MAX(COALESCE(last_ts, 0), excluded.last_ts)
+                """,
+                (
+                    granularity,
+                    bucket_for(moment),
+                    counts["added_to_ioverlay"],
+                    counts["added_to_crewchief"],
+                    counts["deleted_from_ioverlay"],
+                    counts["deleted_from_crewchief"],
+                    counts["total_ioverlay"],
+                    counts["total_crewchief"],
+                    int(moment.timestamp()),
+                ),
+            )
+
+    def rebuild_rollups(self):
+        """
+        Regenerate all rollups from the raw records.
+
+        Returns:
+            int: Number of records folded into the rebuilt rollups.
+        """
+        with self.connect() as conn:
+            return self._rebuild_rollups(conn)
+
+    def _rebuild_rollups(self, conn):
+        compacted_before = self.get_meta(conn, "compacted_before")
+        if compacted_before is None:
+            conn.execute("DELETE FROM rollups")
+        else:
+            # Buckets before the compaction horizon no longer have raw records; keep them as they are
+            horizon = datetime.fromtimestamp(int(compacted_before))
+            for granularity in ("day", "week"):
+                conn.execute(
+                    "DELETE FROM rollups WHERE granularity = ? AND bucket >= ?",
+                    (granularity, ROLLUP_GRANULARITIES[granularity](horizon)),
+                )
+            conn.execute("DELETE FROM rollups WHERE granularity = 'all'")
+            conn.execute(
+                """
+                INSERT INTO rollups
+                SELECT 'all', 'all', syncs, added_to_ioverlay, added_to_crewchief, deleted_from_ioverlay,
+                       deleted_from_crewchief, max_total_ioverlay, max_total_crewchief, last_ts
+                FROM rollups WHERE granularity = 'archived'
+                """
+            )
+
+        folded = 0
+        for row in conn.execute("SELECT timestamp, payload FROM records ORDER BY id"):
+            moment = parse_timestamp(row["timestamp"])
+            if moment is not None:
+                self._update_rollups(conn, moment, json.loads(row["payload"]))
+                folded += 1
+        return folded
+
+    def get_rollups(self, granularity, limit=None):
+        """
+        Return rollup rows for a granularity ("day", "week" or "all"), newest bucket first.
+        """
+        if granularity not in ROLLUP_GRANULARITIES:
+            raise ValueError(f"Unknown rollup granularity: {granularity}")
+        query = "SELECT * FROM rollups WHERE granularity = ? ORDER BY bucket DESC"
+        params = [granularity]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
+        with self.connect() as conn:
+            return [dict(row) for row in conn.execute(query, params)]
+
+    def get_totals(self):
+        """
+        Return the precomputed all-time totals shown in the analytics overview.
+        """
+        rows = self.get_rollups("all")
+        rollup = rows[0] if rows else {}
+        return {
+            "syncs": rollup.get("syncs", 0),
+            "total_added_to_ioverlay": rollup.get("added_to_ioverlay", 0),
+            "total_added_to_crewchief": rollup.get("added_to_crewchief", 0),
+            "total_ioverlay": rollup.get("max_total_ioverlay", 0),
+            "total_crewchief": rollup.get("max_total_crewchief", 0),
+        }
+
+    def latest_record(self):
+        """
+        Return the most recently stored record, or None if there is no history.
+        """
+        with self.connect() as conn:
+            row = conn.execute("SELECT payload FROM records ORDER BY id DESC LIMIT 1").fetchone()
+        return json.loads(row["payload"]) if row else None
+
+    def iter_records(self):
+        """
+        Yield stored records in insertion order without loading the whole history at once.
+        """
+        with self.connect() as conn:
+            for row in conn.execute("SELECT payload FROM records ORDER BY id"):
+                yield json.loads(row["payload"])
+
+    def count(self, since=None, until=None):
+        """
+        Count records, optionally limited to a time range (epoch seconds, inclusive).
+        """
+        where, params = self._range_clause(since, until)
+        with self.connect() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM records {where}", params).fetchone()[0]
+
+    def fetch_page(self, offset, limit, order_by="ts", descending=False, since=None, until=None):
+        """
+        Fetch one page of records, sorted and filtered by SQLite.
+
+        Each returned record carries a "trend_base_ms" entry: the average sync time of the
+        TREND_WINDOW runs before it, over the full history. It is looked up per row of the page
+        through the index on ts (which includes the id), so a page costs the same however large
+        the history is.
+
+        Args:
+            offset (int): Number of matching records to skip.
+            limit (int): Maximum number of records to return.
+            order_by (str): One of SORTABLE_COLUMNS.
+            descending (bool): Sort direction.
+            since (int, optional): Only records at or after this epoch second.
+            until (int, optional): Only records at or before this epoch second.
+        """
+        if order_by not in SORTABLE_COLUMNS:
+            raise ValueError(f"Cannot sort analytics records on: {order_by}")
+        where, params = self._range_clause(since, until)
+        direction = "DESC" if descending else "ASC"
+        order = f"ORDER BY {order_by} IS NULL, {order_by} {direction}, id {direction}"
+        query = f"""
+            SELECT payload, (
+                SELECT AVG(wall_ms) FROM records WHERE id IN (
+                    SELECT id FROM records AS previous
+                    WHERE (previous.ts, previous.id) < (page.ts, page.id)
+                    ORDER BY previous.ts DESC, previous.id DESC
+                    LIMIT {TREND_WINDOW}
+                )
+            ) AS trend_base_ms
+            FROM records AS page
+            WHERE id IN (SELECT id FROM records {where} {order} LIMIT ? OFFSET ?)
+            {order}
+        """
+        with self.connect() as conn:
+            rows = conn.execute(query, [*params, int(limit), int(offset)]).fetchall()
+
+        page = []
+        for row in rows:
+            record = json.loads(row["payload"])
+            record["trend_base_ms"] = row["trend_base_ms"]
+            page.append(record)
+        return page
+
+    def iter_range(self, since=None, until=None):
+        """
+        Stream records in chronological order, optionally limited to a time range.
+        Only the current row is held in memory.
+        """
+        where, params = self._range_clause(since, until)
+        with self.connect() as conn:
+            for row in conn.execute(f"SELECT payload FROM records {where} ORDER BY ts, id", params):
+                yield json.loads(row["payload"])
+
+    def aggregate(self, aggregations=AGGREGATIONS, since=None, until=None, phases=()):
+        """
+        Summarise records in a time range entirely inside SQLite.
+
+        Args:
+            aggregations (iterable): Any of AGGREGATIONS.
+            since (int, optional): Only records at or after this epoch second.
+            until (int, optional): Only records at or before this epoch second.
+            phases (iterable): Sync phases whose wall time is included in the percentiles.
+
+        Returns:
+            dict: {"syncs": n, "<aggregation>": {field: value}} for each requested aggregation.
+        """
+        unknown = set(aggregations) - set(AGGREGATIONS)
+        if unknown:
+            raise ValueError(f"Unknown aggregation(s): {', '.join(sorted(unknown))}")
+        unknown_phases = set(phases) - set(SYNC_PHASES)
+        if unknown_phases:
+            raise ValueError(f"Unknown sync phase(s): {', '.join(sorted(unknown_phases))}")
+
+        where, params = self._range_clause(since, until)
+        fields = [*COUNT_FIELDS, *METRIC_FIELDS]
+        result = {"syncs": self.count(since, until)}
+        with self.connect() as conn:
+            for function in ("sum", "max"):
+                if function in aggregations:
+                    select = ", ".join(f"{function.upper()}({field}) AS {field}" for field in fields)
+                    row = conn.execute(f"SELECT {select} FROM records {where}", params).fetchone()
+                    result[function] = dict(row)
+
+            for name in aggregations:
+                if not name.startswith("p"):
+                    continue
+                fraction = int(name[1:]) / 100
+                percentiles = {
+                    field: self._percentile(conn, field, fraction, where, params) for field in DURATION_FIELDS
+                }
+                for phase in phases:
+                    expression = f"json_extract(payload, '$.metrics.phases.{phase}.wall_ms')"
+                    percentiles[f"{phase}_wall_ms"] = self._percentile(conn, expression, fraction, where, params)
+                result[name] = percentiles
+        return result
+
+    def _percentile(self, conn, expression, fraction, where, params):
+        """
+        Nearest-rank percentile of an SQL expression; SQLite does the sorting.
+        """
+        condition = f"{where} AND {expression} IS NOT NULL" if where else f"WHERE {expression} IS NOT NULL"
+        count = conn.execute(f"SELECT COUNT(*) FROM records {condition}", params).fetchone()[0]
+        if not count:
+            return None
+        rank = max(1, -(-count * fraction // 1))  # ceil(count * fraction)
+        row = conn.execute(
+            f"SELECT {expression} FROM records {condition} ORDER BY {expression} LIMIT 1 OFFSET ?",
+            [*params, int(rank) - 1],
+        ).fetchone()
+        return row[0]
+
+    def _range_clause(self, since, until):
+        conditions, params = [], []
+        if since is not None:
+            conditions.append("ts >= ?")
+            params.append(int(since))
+        if until is not None:
+            conditions.append("ts <= ?")
+            params.append(int(until))
+        return ("WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+    def reset(self):
+        """
+        Delete all analytics records and their rollups.
+        """
+        with self.connect() as conn:
+            conn.execute("DELETE FROM records")
+            conn.execute("DELETE FROM rollups")
+            conn.execute("DELETE FROM meta WHERE key = 'compacted_before'")
+        self.vacuum()
+
+    def compact(self, retention_days=DEFAULT_RETENTION_DAYS, now=None):
+        """
+        Delete raw records older than the retention period.
+
+        Their contribution is already part of the daily, weekly and all-time rollups; it is also
+        added to an "archived" rollup so a later rebuild_rollups can restore the all-time totals.
+        The cutoff is aligned to the start of an ISO week, so compacted day and week buckets are
+        always complete.
+
+        Returns:
+            int: Number of records removed.
+        """
+        now = now or datetime.now()
+        cutoff_day = (now - timedelta(days=retention_days)).date()
+        cutoff_day -= timedelta(days=cutoff_day.weekday())  # Monday of that week
+        cutoff = int(datetime.combine(cutoff_day, datetime.min.time()).timestamp())
+
+        with self.connect() as conn:
+            counts = ", ".join(f"COALESCE(SUM({field}), 0)" for field in COUNT_FIELDS[:4])
+            archived = conn.execute(
+                f"""
+                SELECT COUNT(*), {counts},
+                       COALESCE(MAX(total_ioverlay), 0), COALESCE(MAX(total_crewchief), 0), MAX(ts)
+                FROM records WHERE ts < ?
+                """,
+                (cutoff,),
+            ).fetchone()
+            removed = archived[0]
+            if removed:
+                conn.execute(
+                    """
+                    INSERT INTO rollups VALUES ('archived', 'all', ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(granularity, bucket) DO UPDATE SET
+                        syncs = syncs + excluded.syncs,
+                        added_to_ioverlay = added_to_ioverlay + excluded.added_to_ioverlay,
+                        added_to_crewchief = added_to_crewchief + excluded.added_to_crewchief,
+                        deleted_from_ioverlay = deleted_from_ioverlay + excluded.deleted_from_ioverlay,
+                        deleted_from_crewchief = deleted_from_crewchief + excluded.deleted_from_crewchief,
+                        max_total_ioverlay = MAX(max_total_ioverlay, excluded.max_total_ioverlay),
+                        max_total_crewchief = MAX(max_total_crewchief, excluded.max_total_crewchief),
+                        last_ts = MAX(COALESCE(last_ts, 0), excluded.last_ts)
+                    """,
+                    tuple(archived),
+                )
+                conn.execute("DELETE FROM records WHERE ts < ?", (cutoff,))
+                previous = int(self.get_meta(conn, "compacted_before", 0))
+                self.set_meta(conn, "compacted_before", max(previous, cutoff))
+            self.set_meta(conn, "last_compaction", int(time.time()))
+
+        if removed:
+            self.vacuum()
+        return removed
+
+    def vacuum(self):
+        """
+        Return free pages to the file system and truncate the write-ahead log.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+
+    def compaction_due(self):
+        with self.connect() as conn:
+            last_compaction = int(self.get_meta(conn, "last_compaction", 0))
+        return time.time() - last_compaction >= COMPACTION_INTERVAL_SECONDS
+
+    def get_meta(self, conn, key, default=None):
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else default
+
+    def set_meta(self, conn, key, value):
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, str(value)),
+        )
+
+    def migrate_legacy_json(self, json_path):
+        """
+        One-time import of a legacy _analytics.json file into the store.
+        The legacy file is left untouched; a marker in the meta table prevents a second import.
+        Records that cannot be stored (such as an unrecognized timestamp) are skipped, so one bad
+        record does not keep the rest out or make the import run again on every use.
+
+        Returns:
+            tuple: (imported, skipped) number of records.
+
+        Raises:
+            OSError, ValueError: If the legacy file cannot be read or is not valid JSON. Nothing is
+                marked as migrated then, so a repaired file is still imported.
+        """
+        json_path = Path(json_path)
+        with self.connect() as conn:
+            if self.get_meta(conn, "legacy_json_migrated") == "1":
+                return 0, 0
+
+            imported = 0
+            skipped = 0
+            if json_path.exists():
+                with json_path.open("r", encoding="utf-8") as file:
+                    legacy_records = json.load(file)
+                for record in legacy_records if isinstance(legacy_records, list) else []:
+                    if not isinstance(record, dict):
+                        skipped += 1
+                        continue
+                    try:
+                        if self._insert(conn, record) is not None:
+                            imported += 1
+                    except (TypeError, ValueError):
+                        skipped += 1
+
+            self.set_meta(conn, "legacy_json_migrated", "1")
+            return imported, skipped
+
+
+_compaction_lock = threading.Lock()
+
+# Stores opened by this process, by database path; the legacy data is migrated when one is first opened
+_open_stores = {}
+_open_stores_lock = threading.Lock()
+
+
+def start_background_compaction(store, retention_days=DEFAULT_RETENTION_DAYS):
+    """
+    Run the retention policy on a daemon thread if it has not run in the last day.
+    At most one compaction runs at a time per process.
+
+    Returns:
+        threading.Thread or None: The started thread, or None if nothing was due.
+    """
+    if not _compaction_lock.acquire(blocking=False):
+        return None
+    try:
+        due = store.compaction_due()
+    except Exception:
+        _compaction_lock.release()
+        raise
+    if not due:
+        _compaction_lock.release()
+        return None
+
+    def run():
+        try:
+            removed = AnalyticsStore(store.db_path).compact(retention_days)
+            if removed:
+                log_to_gui(None, f"Analytics retention folded {removed} record(s) older than {retention_days} days into the rollups.", level="info", to_file=True)
+        except Exception as e:
+            log_to_gui(None, f"Analytics compaction failed: {e}", level="error", to_file=True)
+        finally:
+            _compaction_lock.release()
+
+    thread = threading.Thread(target=run, name="AnalyticsRetention", daemon=True)
+    thread.start()
+    return thread
+
+
+def migrate_legacy_store(db_path):
+    """
+    Move an _analytics.db created next to the application by earlier versions into the
+    per-user data folder, unless a store already exists there.
+    """
+    legacy_path = get_analytics_base_path() / "_analytics.db"
+    if db_path.exists() or not legacy_path.exists() or legacy_path == db_path:
+        return False
+    for suffix in ("", "-wal", "-shm"):
+        source = legacy_path.with_name(legacy_path.name + suffix)
+        if source.exists():
+            shutil.move(str(source), str(db_path.with_name(db_path.name + suffix)))
+    return True
+
+
+def open_analytics_store():
+    """
+    Open the analytics store, migrating the legacy _analytics.json on first use.
+    The legacy data is only looked for the first time a process opens the store.
+    """
+    db_path = get_analytics_db_path()
+    with _open_stores_lock:
+        store = _open_stores.get(db_path)
+        if store is None:
+            store = _open_stores[db_path] = _migrate_and_open(db_path)
+    return store
+
+
+def _migrate_and_open(db_path):
+    try:
+        if migrate_legacy_store(db_path):
+            log_to_gui(None, f"Moved analytics store to {db_path}.", level="info", to_file=True)
+    except OSError as e:
+        log_to_gui(None, f"Failed to move legacy analytics store: {e}", level="error", to_file=True)
+
+    store = AnalyticsStore(db_path)
+    try:
+        imported, skipped = store.migrate_legacy_json(get_analytics_file_path())
+        if imported:
+            log_to_gui(None, f"Migrated {imported} analytics record(s) from _analytics.json.", level="info", to_file=True)
+        if skipped:
+            log_to_gui(None, f"Skipped {skipped} unreadable analytics record(s) in _analytics.json.", level="warning", to_file=True)
+    except (OSError, ValueError) as e:
+        log_to_gui(None, f"Failed to migrate legacy analytics data: {e}", level="error", to_file=True)
+    return store
+
+
+def record_analytics(analytics_record, metrics=None, retention_days=DEFAULT_RETENTION_DAYS):
+    """
+    Records analytics data in the analytics store.
+    When metrics are given, opening the store and inserting the record are timed as the
+    "analytics" phase, the run is finished and its metrics are stored with the record.
+    Afterwards the retention policy is started in the background if it is due.
+    """
+    try:
+        with metrics.phase("analytics") if metrics is not None else nullcontext():
+            store = open_analytics_store()
+            record_id = store.add_record(analytics_record)
+        if record_id is None:
+            # Duplicate analytics record. Skipping.
+            return False
+        if metrics is not None:
+            metrics.finish()
+            store.save_metrics(record_id, analytics_record, metrics)
+
+        log_to_gui(None, f"Analytics record added: {analytics_record}", level="info", to_file=True)
+        start_background_compaction(store, retention_days)
+        return True
+
+    except Exception as e:
+        log_to_gui(None, f"Failed to record analytics: {e}", level="error", to_file=True)
+        raise
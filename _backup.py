@@ -1,110 +1,325 @@
-from pathlib import Path
-import time
-from datetime import datetime
-import zipfile
-import json
-from _logging import log_to_gui
-
-class BackupManager:
-    CONFIG_FILE = Path("config.json")
-
-    def __init__(self, log_func=None):
-        self.log_file = Path("backup.log")
-        self.log_to_gui = log_func
-
-    def log(self, message, level="info", html=False, to_gui=True):
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        entry = f"[{timestamp}] [{level.upper()}] {message}"
-
-        # Write to the log file
-        with self.log_file.open("a") as log_file:
-            log_file.write(entry + "\n")
-
-        # Send log messages to the GUI, if applicable
-        if self.log_to_gui and to_gui:
-            if html:
-                self.log_to_gui(message, level, html=True)
-            else:
-                self.log_to_gui(entry, level)
-
-    def create_backup_zip(self, files, backup_folder, log_func=None, retention_days=None):
-        """
-        Creates a backup zip file and removes old backups based on retention settings.
-
-        Args:
-            files (list): Paths to files to include in the backup.
-            backup_folder (str or Path): Destination folder for backups.
-            log_func (function, optional): Optional logging function.
-            retention_days (int, optional): Number of days to keep backups.
-        """
-        backup_folder = Path(backup_folder)
-        backup_folder.mkdir(parents=True, exist_ok=True)
-
-        # Create a unique zip file name based on the current timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_zip_path = backup_folder / f"backup_{timestamp}.zip"
-
-        try:
-            with zipfile.ZipFile(backup_zip_path, "w") as backup_zip:
-                for file_path in files:
-                    file_path = Path(file_path)
-                    if file_path.exists():
-                        backup_zip.write(file_path, arcname=file_path.name)
-                    else:
-                        if log_func:
-                            log_func(f"File not found: {file_path}", "warning")
-            if log_func:
-                log_func(f"Backup created: {backup_zip_path}", "info", to_gui=False)
-        except IOError as e:
-            raise IOError(f"Error creating backup zip: {e}")
-
-        # Handle retention policy
-        if retention_days is None:
-            retention_days = self._get_retention_days(log_func)
-        self._cleanup_old_backups(backup_folder, retention_days, log_func)
-
-        return backup_zip_path
-
-    def _cleanup_old_backups(self, backup_folder, retention_days, log_func=None):
-        """
-        Removes backups older than the specified retention period.
-
-        Args:
-            backup_folder (Path): Folder containing backup files.
-            retention_days (int): Retention period in days.
-            log_func (function): Optional logging function.
-        """
-        retention_seconds = retention_days * 86400  # Convert days to seconds
-        current_time = time.time()
-
-        for backup_file in Path(backup_folder).iterdir():
-            if backup_file.is_file():
-                file_age = current_time - backup_file.stat().st_mtime
-                if file_age > retention_seconds:
-                    backup_file.unlink()
-                    if log_func:
-                        log_func(f"Removed old backup: {backup_file}", "info")
-
-    def _get_retention_days(self, log_func=None):
-        """
-        Retrieves the retention period from the config file or defaults to 5 days.
-
-        Args:
-            log_func (function): Optional logging function.
-
-        Returns:
-            int: Retention period in days.
-        """
-        try:
-            if self.CONFIG_FILE.exists():
-                with self.CONFIG_FILE.open("r") as file:
-                    config = json.load(file)
-                    return config.get("backup_retention_days", 5)
-            else:
-                if log_func:
-                    log_func(f"Config file '{self.CONFIG_FILE}' not found. Defaulting to 5 days.", "warning", to_gui=False)
-                return 5
-        except Exception as e:
-            if log_func:
-                log_func(f"Error reading retention days: {e}", "error")
-            return 5
+from pathlib import Path
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+import json
+from _logging import log_to_gui
+from _backup_index import RETENTION_DEFAULTS
+from _backup_store import BackupStore, DEFAULT_CODEC, DEFAULT_LEVEL, DEFAULT_MODE, DEFAULT_FULL_EVERY
+from _backup_verify import VERIFY_DEFAULTS, start_background_verification
+
+class PendingBackup:
+    """
+    A backup running on the shared backup worker pool.
+
+    As soon as it is started, the pre-sync state of every file is read, hashed and compressed in
+    memory by its own worker. Nothing is written until commit() picks the files that are about
+    to change; discard() drops the snapshot when nothing will be written. wait() returns once the
+    committed objects and the manifest have been flushed to disk, so the caller can safely
+    overwrite the files. Retention and garbage collection run afterwards without being waited for.
+    """
+    MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+    _pool = None
+    _pool_lock = threading.Lock()
+    _active = 0
+    _active_lock = threading.Lock()
+
+    @classmethod
+    def pool(cls):
+        with cls._pool_lock:
+            if cls._pool is None:
+                cls._pool = ThreadPoolExecutor(max_workers=cls.MAX_WORKERS, thread_name_prefix="Backup")
+            return cls._pool
+
+    @classmethod
+    @contextmanager
+    def exclusive(cls):
+        """
+        Hold off new backups while the block runs, e.g. to delete unreferenced objects.
+        Yields False without waiting if a backup is in progress; pool workers must never
+        wait for each other here.
+        """
+        with cls._active_lock:
+            yield cls._active == 0
+
+    def __init__(self, manager, store, files, retention_days, log_func=None, metrics=None):
+        self.manager = manager
+        self.store = store
+        self.files = files
+        self.retention_days = retention_days
+        self.log_func = log_func
+        self.metrics = metrics
+        self.created = datetime.now()
+        self._manifest = None
+        self._released = False
+
+        # Counted from the start: a snapshot may reuse an existing object that must not be collected
+        with self._active_lock:
+            PendingBackup._active += 1
+        try:
+            pool = self.pool()
+            # Tasks are picked up in submission order, so the later tasks can wait for the earlier ones
+            self._previous = pool.submit(store.latest_entries, {file_path.name for file_path in files})
+            self._snapshots = [pool.submit(self._snapshot, file_path) for file_path in files]
+        except BaseException:
+            self._release()
+            raise
+
+    def _release(self):
+        with self._active_lock:
+            if not self._released:
+                self._released = True
+                PendingBackup._active -= 1
+
+    def _snapshot(self, file_path):
+        previous = self._previous.result().get(file_path.name)
+        return self.store.snapshot_file(file_path, previous, self.metrics)
+
+    def commit(self, files=None):
+        """
+        Write the backup of the given files, or of all files when omitted. Committing no files
+        is the same as discard().
+
+        Returns:
+            PendingBackup: self, so the caller can chain wait().
+        """
+        if self._manifest is not None or self._released:
+            raise RuntimeError("This backup was already committed or discarded.")
+        wanted = None if files is None else {Path(file_path) for file_path in files}
+        selected = [index for index, file_path in enumerate(self.files) if wanted is None or file_path in wanted]
+        if not selected:
+            self.discard()
+        else:
+            self._manifest = self.pool().submit(self._write_manifest, selected)
+        return self
+
+    def discard(self):
+        """
+        Drop the snapshot without writing anything. Does nothing once the backup is committed.
+        """
+        if self._manifest is None:
+            self._release()
+
+    def _write_manifest(self, selected):
+        try:
+            self.store.backup_folder.mkdir(parents=True, exist_ok=True)
+            entries = []
+            missing = []
+            for index in selected:
+                entry = self._snapshots[index].result()
+                if entry is None:
+                    missing.append(self.files[index])
+                else:
+                    entries.append(self.store.commit_entry(entry, self.metrics))
+            manifest_path = self.store.write_manifest(entries, self.created, self.metrics)
+        finally:
+            self._release()
+
+        self.pool().submit(self._finish, manifest_path, entries, missing)
+        return manifest_path
+
+    def _finish(self, manifest_path, entries, missing):
+        try:
+            self.manager._finish_backup(self.store, manifest_path, entries, missing, self.retention_days, self.log_func)
+        except Exception as e:
+            if self.log_func:
+                self.log_func(f"Error cleaning up old backups: {e}", "error")
+
+    def done(self):
+        return self._manifest is None or self._manifest.done()
+
+    def wait(self, timeout=None):
+        """
+        Block until the committed backup is durable on disk.
+
+        Returns:
+            Path or None: The manifest of the backup, or None if nothing was committed.
+        """
+        if self._manifest is None:
+            return None
+        try:
+            return self._manifest.result(timeout)
+        except (IOError, ValueError) as e:
+            raise IOError(f"Error creating backup: {e}")
+
+
+class BackupManager:
+    CONFIG_FILE = Path("config.json")
+
+    def __init__(self, log_func=None):
+        self.log_file = Path("backup.log")
+        self.log_to_gui = log_func
+
+    def log(self, message, level="info", html=False, to_gui=True):
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        entry = f"[{timestamp}] [{level.upper()}] {message}"
+
+        # Write to the log file
+        with self.log_file.open("a") as log_file:
+            log_file.write(entry + "\n")
+
+        # Send log messages to the GUI, if applicable
+        if self.log_to_gui and to_gui:
+            if html:
+                self.log_to_gui(message, level, html=True)
+            else:
+                self.log_to_gui(entry, level)
+
+    def create_backup(self, files, backup_folder, log_func=None, retention_days=None, metrics=None,
+                      codec=None, level=None, mode=None):
+        """
+        Creates a content-addressed backup of all given files and waits until it is written.
+        See start_backup for the arguments.
+
+        Returns:
+            Path: The manifest of the new backup.
+        """
+        return self.start_backup(
+            files, backup_folder, log_func=log_func, retention_days=retention_days, metrics=metrics,
+            codec=codec, level=level, mode=mode
+        ).commit().wait()
+
+    def start_backup(self, files, backup_folder, log_func=None, retention_days=None, metrics=None,
+                     codec=None, level=None, mode=None):
+        """
+        Starts a content-addressed backup on the backup worker pool and returns immediately.
+        Files are read, hashed and compressed in parallel; once the caller commits the files
+        that should be kept, their objects and the manifest are written, after which old backups
+        are removed based on retention settings.
+        Files whose content is already in the backup store are not stored again; in delta mode
+        changed files are stored as driver-level patches against the previous backup.
+
+        Args:
+            files (list): Paths to files to include in the backup.
+            backup_folder (str or Path): Destination folder for backups.
+            log_func (function, optional): Optional logging function.
+            retention_days (int, optional): Number of days to keep backups.
+            metrics (SyncMetrics, optional): Counts the bytes read and written by the backup.
+            codec (str, optional): Compression codec for new objects (none, zlib, bz2, lzma).
+            level (int, optional): Compression level 0-9.
+            mode (str, optional): "full" or "delta".
+
+        Returns:
+            PendingBackup: Call commit() (or discard()) and then wait() before changing any of the files.
+        """
+        backup_folder = Path(backup_folder)
+        config = self._load_config(log_func)
+        if codec is None:
+            codec = config.get("backup_codec", DEFAULT_CODEC)
+        if level is None:
+            level = config.get("backup_compression_level", DEFAULT_LEVEL)
+        if mode is None:
+            mode = config.get("backup_mode", DEFAULT_MODE)
+        full_every = config.get("backup_full_every", DEFAULT_FULL_EVERY)
+
+        try:
+            store = BackupStore(backup_folder, codec=codec, level=level, mode=mode, full_every=full_every)
+        except ValueError as e:
+            raise IOError(f"Error creating backup: {e}")
+        return PendingBackup(self, store, [Path(file_path) for file_path in files], retention_days, log_func, metrics)
+
+    def _finish_backup(self, store, manifest_path, entries, missing, retention_days, log_func=None):
+        if log_func:
+            for file_path in missing:
+                log_func(f"File not found: {file_path}", "warning")
+            stored = sum(entry["stored_size"] for entry in entries if entry["new"])
+            reused = sum(1 for entry in entries if not entry["new"])
+            patched = sum(1 for entry in entries if entry["new"] and entry.get("kind") == "delta")
+            log_func(
+                f"Backup created: {manifest_path} ({stored} bytes stored, {patched} driver patch(es), "
+                f"{reused} unchanged file(s) reused)",
+                "info", to_gui=False
+            )
+
+        config = self._load_config(log_func)
+
+        # Handle retention policy
+        self._cleanup_old_backups(store, retention_days, log_func, config)
+
+        # Re-check older backups now and then, throttled to the configured I/O budget
+        self.start_verification(store.backup_folder, log_func, config=config)
+
+    def start_verification(self, backup_folder, log_func=None, force=False, config=None):
+        """
+        Verifies the backups on a background thread when the scheduled check is due (see
+        backup_verify_interval_hours), or right away with force. Problems are logged.
+
+        Args:
+            config (dict, optional): Settings already loaded by the caller; read from the config file if omitted.
+
+        Returns:
+            threading.Thread or None: The verification thread, or None if nothing was started.
+        """
+        if config is None:
+            config = self._load_config(log_func)
+        interval_hours = config.get("backup_verify_interval_hours", VERIFY_DEFAULTS["backup_verify_interval_hours"])
+        io_budget_mb_s = config.get("backup_verify_io_mb_s", VERIFY_DEFAULTS["backup_verify_io_mb_s"])
+        return start_background_verification(backup_folder, interval_hours, io_budget_mb_s, log_func, force=force)
+
+    def _cleanup_old_backups(self, store, retention_days=None, log_func=None, config=None):
+        """
+        Removes the backups the retention policy no longer keeps, deciding from the backup index.
+        Only indexed backups (manifests and legacy backup zips) are ever removed.
+
+        Args:
+            store (BackupStore): Store of the backup folder.
+            retention_days (int, optional): Overrides the configured retention period in days.
+            log_func (function): Optional logging function.
+            config (dict, optional): Settings already loaded by the caller; read from the config file if omitted.
+        """
+        if config is None:
+            config = self._load_config(log_func)
+        policy = self._get_retention_policy(config)
+        if retention_days is not None:
+            policy["backup_retention_days"] = retention_days
+
+        # Objects are only deleted while no backup is being written; otherwise the next run does it
+        with PendingBackup.exclusive() as idle:
+            removed, objects_removed = store.apply_retention(policy, delete_objects=idle)
+
+        if log_func:
+            for name in removed:
+                log_func(f"Removed old backup: {store.backup_folder / name}", "info")
+            if objects_removed:
+                log_func(f"Removed {objects_removed} unreferenced backup object(s).", "info", to_gui=False)
+
+    def _get_retention_policy(self, config):
+        """
+        Retrieves the backup retention settings from the loaded config.
+
+        Args:
+            config (dict): Settings as returned by _load_config.
+
+        Returns:
+            dict: Age, count, size and GFS tier limits (see _backup_index.RETENTION_DEFAULTS).
+        """
+        return {key: config.get(key, default) for key, default in RETENTION_DEFAULTS.items()}
+
+    def _load_config(self, log_func=None):
+        """
+        Reads the config file once, so the backup settings can be looked up in the result.
+        A missing or unreadable config file gives an empty dict, so every setting falls back to its default.
+
+        Args:
+            log_func (function): Optional logging function.
+
+        Returns:
+            dict: The settings in the config file.
+        """
+        try:
+            if self.CONFIG_FILE.exists():
+                with self.CONFIG_FILE.open("r") as file:
+                    config = json.load(file)
+                if isinstance(config, dict):
+                    return config
+                raise ValueError("the config file does not contain a JSON object")
+            if log_func:
+                log_func(f"Config file '{self.CONFIG_FILE}' not found. Using the default backup settings.", "warning", to_gui=False)
+            return {}
+        except Exception as e:
+            if log_func:
+                log_func(f"Error reading backup settings: {e}", "error")
+            return {}
@@ -0,0 +1,140 @@
+import json
+
+PATCH_FORMAT = "driverpatch"
+PATCH_VERSION = 1
+
+# Where the driver list lives in each supported document, and the field holding the customer id.
+# iOverlay's settings.dat keeps drivers under modules.drivertagging.drivertag keyed by the
+# customer id in "identifier"; CrewChief's iracing_reputations.json is a list keyed by customer_id.
+DRIVER_LISTS = (
+    (("modules", "drivertagging", "drivertag"), "identifier"),
+    ((), "customer_id"),
+)
+
+
+def serialize(document):
+    """
+    Serialize a document the way DriverSync writes its files (see DriverSync.write_file).
+    """
+    return json.dumps(document, indent=4).encode("utf-8")
+
+
+def _resolve(document, path):
+    for key in path:
+        if not isinstance(document, dict):
+            return None
+        document = document.get(key)
+    return document
+
+
+def _key_map(drivers, key):
+    """
+    Map the string form of each driver's key to the driver, or None if the key is missing or not unique.
+    """
+    mapped = {}
+    for driver in drivers:
+        if not isinstance(driver, dict) or key not in driver:
+            return None
+        mapped_key = str(driver[key])
+        if mapped_key in mapped:
+            return None
+        mapped[mapped_key] = driver
+    return mapped
+
+
+def locate_drivers(document):
+    """
+    Find the driver list of a document, if every driver in it has a customer id of its own.
+
+    Returns:
+        tuple or None: (path, key, drivers) or None if the document has no driver list keyed by
+        customer id (for example because iOverlay tags a driver twice).
+    """
+    for path, key in DRIVER_LISTS:
+        drivers = _resolve(document, path)
+        if isinstance(drivers, list) and _key_map(drivers, key) is not None:
+            return path, key, drivers
+    return None
+
+
+def group_drivers(document):
+    """
+    Group the drivers of a document by customer id. Several entries may share one (iOverlay can
+    tag the same driver more than once); they are kept together. Entries without a customer id
+    are left out.
+
+    Returns:
+        tuple or None: (path, key, {customer id: [drivers]}) or None if the document has no driver list.
+    """
+    for path, key in DRIVER_LISTS:
+        drivers = _resolve(document, path)
+        if not isinstance(drivers, list):
+            continue
+        groups = {}
+        for driver in drivers:
+            if isinstance(driver, dict) and key in driver:
+                groups.setdefault(str(driver[key]), []).append(driver)
+        return path, key, groups
+    return None
+
+
+def make_patch(old_document, new_document):
+    """
+    Describe the change between two versions of a document as driver-level operations.
+
+    Returns:
+        dict or None: The patch, or None if the documents cannot be expressed as a driver patch
+        (no keyed driver list, or something outside the driver list changed).
+    """
+    old_located = locate_drivers(old_document)
+    new_located = locate_drivers(new_document)
+    if not old_located or not new_located or old_located[:2] != new_located[:2]:
+        return None
+    path, key, old_drivers = old_located
+    new_drivers = new_located[2]
+
+    old_map = _key_map(old_drivers, key)
+    new_map = _key_map(new_drivers, key)
+    patch = {
+        "format": PATCH_FORMAT,
+        "version": PATCH_VERSION,
+        "path": list(path),
+        "key": key,
+        "removed": [driver_key for driver_key in old_map if driver_key not in new_map],
+        "changed": [driver for driver_key, driver in new_map.items()
+                    if driver_key in old_map and old_map[driver_key] != driver],
+        "added": [driver for driver_key, driver in new_map.items() if driver_key not in old_map],
+    }
+
+    # Everything outside the driver list must be identical, and replaying the patch must give
+    # the new driver order; otherwise a full copy is the only faithful backup
+    if apply_patch(old_document, patch) != new_document:
+        return None
+    return patch
+
+
+def apply_patch(document, patch):
+    """
+    Return a copy of the document with a driver patch applied.
+    Changed drivers keep their position, added drivers are appended.
+    """
+    if patch.get("format") != PATCH_FORMAT:
+        raise ValueError("Not a driver patch.")
+    document = json.loads(json.dumps(document))
+    drivers = _resolve(document, patch["path"])
+    if not isinstance(drivers, list):
+        raise ValueError(f"Driver list {'/'.join(patch['path']) or '<root>'} not found.")
+
+    key = patch["key"]
+    removed = set(patch["removed"])
+    changed = {str(driver[key]): driver for driver in patch["changed"]}
+    drivers[:] = [changed.get(str(driver[key]), driver) for driver in drivers if str(driver[key]) not in removed]
+    drivers.extend(patch["added"])
+    return document
+
+
+def patch_size(patch):
+    """
+    Number of driver operations in a patch.
+    """
+    return len(patch["removed"]) + len(patch["changed"]) + len(patch["added"])
@@ -0,0 +1,216 @@
+import json
+import threading
+import zipfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+INDEX_FILE = "index.json"
+INDEX_VERSION = 1
+LEGACY_ZIP_PATTERN = "backup_*.zip"
+
+# Retention settings read from config.json, with their defaults. 0 disables a limit or tier.
+RETENTION_DEFAULTS = {
+    "backup_retention_days": 5,
+    "backup_keep_count": 0,
+    "backup_max_size_mb": 0,
+    "backup_keep_hourly": 0,
+    "backup_keep_daily": 0,
+    "backup_keep_weekly": 0,
+}
+
+# GFS tiers: keep the newest backup of each of the last N hours, days and ISO weeks
+GFS_TIERS = {
+    "backup_keep_hourly": lambda moment: moment.strftime("%Y-%m-%d %H"),
+    "backup_keep_daily": lambda moment: moment.strftime("%Y-%m-%d"),
+    "backup_keep_weekly": lambda moment: "%d-W%02d" % moment.isocalendar()[:2],
+}
+
+
+def backup_sort_key(backup):
+    """
+    Order backups by creation time, then by the counter added to backups made in the same second.
+    """
+    parts = Path(backup["name"]).stem.split("_")
+    counter = int(parts[3]) if len(parts) > 3 and parts[3].isdigit() else 0
+    return backup["created"], counter
+
+
+def plan_retention(backups, object_sizes, policy, now=None):
+    """
+    Decide which backups to remove, using only index data.
+
+    The newest backup is always kept. When any GFS tier is set, only the newest backup and the
+    backups picked by the tiers are candidates to keep. The age, count and size limits then
+    remove the oldest of those until every limit is met.
+
+    Args:
+        backups (list): Index entries, each with "name", "created" and "objects".
+        object_sizes (dict): Stored size per object hash.
+        policy (dict): Retention settings (see RETENTION_DEFAULTS).
+        now (datetime, optional): Reference time for the age limit.
+
+    Returns:
+        list: Names of the backups to remove.
+    """
+    if not backups:
+        return []
+    now = now or datetime.now()
+    policy = {**RETENTION_DEFAULTS, **policy}
+    ordered = sorted(backups, key=backup_sort_key, reverse=True)
+    newest = ordered[0]
+
+    kept = list(ordered)
+    if any(policy[tier] for tier in GFS_TIERS):
+        picked = {newest["name"]}
+        for tier, bucket_of in GFS_TIERS.items():
+            buckets = set()
+            for backup in ordered:
+                if len(buckets) >= policy[tier]:
+                    break
+                bucket = bucket_of(datetime.fromisoformat(backup["created"]))
+                if bucket not in buckets:
+                    buckets.add(bucket)
+                    picked.add(backup["name"])
+        kept = [backup for backup in ordered if backup["name"] in picked]
+
+    if policy["backup_retention_days"]:
+        cutoff = (now - timedelta(days=policy["backup_retention_days"])).isoformat(timespec="seconds")
+        kept = [backup for backup in kept if backup is newest or backup["created"] >= cutoff]
+
+    if policy["backup_keep_count"]:
+        kept = kept[:max(policy["backup_keep_count"], 1)]
+
+    if policy["backup_max_size_mb"]:
+        limit = policy["backup_max_size_mb"] * 1024 * 1024
+        while len(kept) > 1 and _stored_size(kept, object_sizes) > limit:
+            kept.pop()
+
+    kept_names = {backup["name"] for backup in kept}
+    return [backup["name"] for backup in ordered if backup["name"] not in kept_names]
+
+
+def _stored_size(backups, object_sizes):
+    objects = set()
+    size = 0
+    for backup in backups:
+        size += backup.get("size", 0)
+        objects.update(backup.get("objects", []))
+    return size + sum(object_sizes.get(digest, 0) for digest in objects)
+
+
+class BackupIndex:
+    """
+    The list of backups in a backup folder (Backup/index.json), with the objects each one uses
+    and the stored size of every object. Listing backups and applying retention only read this
+    file; the folder is walked once, to build the index when it is missing or unreadable.
+    """
+    # Index files are rewritten by backup workers and retention; one writer at a time per process
+    lock = threading.RLock()
+
+    def __init__(self, backup_folder):
+        self.backup_folder = Path(backup_folder)
+        self.path = self.backup_folder / INDEX_FILE
+
+    def load(self):
+        """
+        Read the index, building it from the backup folder if needed.
+        """
+        with self.lock:
+            try:
+                with self.path.open("r", encoding="utf-8") as file:
+                    index = json.load(file)
+                if index.get("version") == INDEX_VERSION:
+                    return index
+            except (OSError, ValueError):
+                pass
+            index = self.rebuild()
+            self.save(index)
+            return index
+
+    def save(self, index):
+        # Imported here because _backup_store imports this module
+        from _backup_store import write_file_atomic
+
+        with self.lock:
+            self.backup_folder.mkdir(parents=True, exist_ok=True)
+            write_file_atomic(self.path, json.dumps(index, indent=1).encode("utf-8"))
+
+    def backups(self):
+        """
+        Return the indexed backups, oldest first.
+        """
+        return sorted(self.load()["backups"], key=backup_sort_key)
+
+    def add_backup(self, backup, objects):
+        """
+        Add a backup to the index.
+
+        Args:
+            backup (dict): name, created, kind, size, files and objects of the backup.
+            objects (dict): codec and stored size of each object it uses, as [codec, size].
+        """
+        with self.lock:
+            index = self.load()
+            index["backups"] = [entry for entry in index["backups"] if entry["name"] != backup["name"]]
+            index["backups"].append(backup)
+            index["objects"].update(objects)
+            self.save(index)
+
+    def rebuild(self):
+        """
+        Build a fresh index by reading every manifest and legacy zip in the backup folder.
+        Objects that no manifest references are queued for deletion.
+        """
+        # Imported here because _backup_store imports this module
+        from _backup_store import (
+            BackupStore, MANIFEST_PREFIX, MANIFEST_SUFFIX, OBJECTS_FOLDER, manifest_sort_key
+        )
+
+        index = {"version": INDEX_VERSION, "backups": [], "objects": {}, "pending": []}
+        if not self.backup_folder.exists():
+            return index
+
+        objects_folder = self.backup_folder / OBJECTS_FOLDER
+        if objects_folder.exists():
+            for object_path in objects_folder.glob("*/*"):
+                digest, _, codec = object_path.name.partition(".")
+                if object_path.suffix != ".tmp":
+                    index["objects"][digest] = [codec, object_path.stat().st_size]
+
+        referenced = set()
+        manifests = sorted(self.backup_folder.glob(f"{MANIFEST_PREFIX}*{MANIFEST_SUFFIX}"), key=manifest_sort_key)
+        for manifest_path in manifests:
+            try:
+                with manifest_path.open("r", encoding="utf-8") as file:
+                    manifest = json.load(file)
+            except (OSError, ValueError):
+                continue
+            objects = sorted({digest for entry in manifest.get("files", []) for digest in BackupStore.entry_objects(entry)})
+            referenced.update(objects)
+            index["backups"].append({
+                "name": manifest_path.name,
+                "created": manifest["created"],
+                "kind": "manifest",
+                "size": manifest_path.stat().st_size,
+                "files": [entry["name"] for entry in manifest.get("files", [])],
+                "objects": objects,
+            })
+
+        for zip_path in self.backup_folder.glob(LEGACY_ZIP_PATTERN):
+            stat = zip_path.stat()
+            try:
+                with zipfile.ZipFile(zip_path) as backup_zip:
+                    files = backup_zip.namelist()
+            except (OSError, zipfile.BadZipFile):
+                files = []
+            index["backups"].append({
+                "name": zip_path.name,
+                "created": datetime.fromtimestamp(stat.st_mtime).isoformat(timespec="seconds"),
+                "kind": "zip",
+                "size": stat.st_size,
+                "files": files,
+                "objects": [],
+            })
+
+        index["pending"] = sorted(set(index["objects"]) - referenced)
+        return index
@@ -0,0 +1,249 @@
+import json
+import zipfile
+from pathlib import Path
+
+from _backup import BackupManager
+from _backup_delta import group_drivers, serialize
+from _backup_index import BackupIndex
+from _backup_store import BackupStore, write_file_atomic
+from _run_lock import SyncRunLock
+
+DEFAULT_BACKUP_FOLDER = Path("Backup")
+
+
+def list_backups(backup_folder=DEFAULT_BACKUP_FOLDER):
+    """
+    List the backups in the backup index, newest first. Each entry gets a "stored_size": the
+    bytes on disk of the backup and every object it uses (objects may be shared with other backups).
+    """
+    index = BackupIndex(backup_folder)
+    object_sizes = {digest: stored[1] for digest, stored in index.load()["objects"].items()}
+    backups = []
+    for backup in reversed(index.backups()):
+        stored_size = backup.get("size", 0) + sum(object_sizes.get(digest, 0) for digest in backup.get("objects", []))
+        backups.append({**backup, "stored_size": stored_size})
+    return backups
+
+
+def find_backup(reference, backup_folder=DEFAULT_BACKUP_FOLDER):
+    """
+    Look up a backup by name, by its number in list_backups (1 is the newest) or as "latest".
+
+    Raises:
+        ValueError: If no backup matches.
+    """
+    backups = list_backups(backup_folder)
+    if not backups:
+        raise ValueError(f"No backups found in '{backup_folder}'.")
+    if reference == "latest":
+        return backups[0]
+    if str(reference).isdigit() and 1 <= int(reference) <= len(backups):
+        return backups[int(reference) - 1]
+    for backup in backups:
+        if backup["name"] == reference or Path(backup["name"]).stem == reference:
+            return backup
+    raise ValueError(f"Backup '{reference}' not found.")
+
+
+def read_backup_file(backup, name, backup_folder=DEFAULT_BACKUP_FOLDER):
+    """
+    Read one file of a backup into memory, without extracting anything to disk.
+
+    Args:
+        backup (dict): Index entry of the backup.
+        name (str): File name inside the backup, e.g. "settings.dat".
+
+    Returns:
+        bytes: The backed-up content.
+    """
+    backup_path = Path(backup_folder) / backup["name"]
+    if backup["kind"] == "zip":
+        with zipfile.ZipFile(backup_path) as backup_zip:
+            return backup_zip.read(name)
+
+    store = BackupStore(backup_folder)
+    for entry in store.read_manifest(backup_path).get("files", []):
+        if entry["name"] == name:
+            return store.get(entry)
+    raise ValueError(f"'{name}' is not part of backup {backup['name']}.")
+
+
+def _driver_maps(current_data, backup_data):
+    try:
+        current_document = json.loads(current_data) if current_data else None
+        backup_document = json.loads(backup_data)
+    except ValueError as e:
+        raise ValueError(f"Cannot compare drivers: {e}")
+
+    backup_index = group_drivers(backup_document)
+    if backup_index is None:
+        raise ValueError("The backup does not contain a driver list.")
+    current_index = group_drivers(current_document) if current_document is not None else None
+    if current_index is None:
+        current_index = (backup_index[0], backup_index[1], {})
+    if current_index[:2] != backup_index[:2]:
+        raise ValueError("The current file and the backup key their drivers differently.")
+    return current_document, current_index, backup_index
+
+
+def diff_drivers(current_data, backup_data):
+    """
+    Compare the drivers of the current file with those of a backup, by customer id.
+    Entries sharing a customer id are compared as one group.
+
+    Args:
+        current_data (bytes or None): Current file content; None if the file is missing.
+        backup_data (bytes): Backed-up content.
+
+    Returns:
+        list: One dict per differing customer id with key, name, action ("restore" if only in the
+        backup, "remove" if only in the current file, "revert" if changed), current and backup
+        (the lists of entries with that customer id, None if there are none).
+    """
+    _, (_, _, current), (_, _, backup) = _driver_maps(current_data, backup_data)
+    differences = []
+    for driver_key, drivers in backup.items():
+        if driver_key not in current:
+            differences.append({"key": driver_key, "name": drivers[0].get("name", ""), "action": "restore",
+                                "current": None, "backup": drivers})
+        elif current[driver_key] != drivers:
+            differences.append({"key": driver_key, "name": drivers[0].get("name", ""), "action": "revert",
+                                "current": current[driver_key], "backup": drivers})
+    for driver_key, drivers in current.items():
+        if driver_key not in backup:
+            differences.append({"key": driver_key, "name": drivers[0].get("name", ""), "action": "remove",
+                                "current": drivers, "backup": None})
+    return differences
+
+
+def restore_files(backup, targets, keys=None, backup_folder=DEFAULT_BACKUP_FOLDER, log_func=None):
+    """
+    Restore files of a backup. The current files are backed up first, so a restore can be undone.
+
+    Every file is read from the backup before anything is written: the pre-restore backup runs
+    retention, which may remove the backup being restored. The files are restored under the sync
+    run lock, so no synchronization writes them meanwhile.
+
+    Args:
+        backup (dict): Index entry of the backup.
+        targets (dict): File name inside the backup -> file to restore it into.
+        keys (iterable, optional): Only restore these drivers (customer ids); the rest of the
+            current files is left as it is, and files none of them is in are not written.
+            Restores the whole files when omitted.
+        log_func (function, optional): Optional logging function.
+
+    Returns:
+        dict: File name -> number of drivers restored for a selective restore, None for a whole file.
+
+    Raises:
+        ValueError: If a synchronization is running, the drivers cannot be restored selectively, or
+            a customer id is neither in the current files nor in the backup. Nothing is written then.
+    """
+    if keys is not None:
+        keys = [str(driver_key) for driver_key in keys]
+        if not keys:
+            raise ValueError("No customer ids were given. Nothing was restored.")
+    backup_contents = {name: read_backup_file(backup, name, backup_folder) for name in targets}
+
+    run_lock = SyncRunLock()
+    if not run_lock.acquire():
+        raise ValueError("A synchronization is running. Restore the backup once it has finished.")
+    try:
+        restores = []
+        for name, target_path in targets.items():
+            target_path = Path(target_path)
+            current_data = target_path.read_bytes() if target_path.exists() else None
+            restores.append((name, target_path, current_data, *_restored_content(
+                backup_contents[name], current_data, target_path, keys
+            )))
+
+        if keys is not None:
+            matched = set().union(*(found for *_, found in restores))
+            unknown = [driver_key for driver_key in keys if driver_key not in matched]
+            if unknown:
+                raise ValueError(
+                    f"No driver with customer id {', '.join(unknown)} in {', '.join(targets)} "
+                    f"or in backup {backup['name']}. Nothing was restored."
+                )
+            restores = [restore for restore in restores if restore[-1]]
+
+        existing = [target_path for _, target_path, current_data, *_ in restores if current_data is not None]
+        if existing:
+            BackupManager().create_backup(existing, backup_folder, log_func=log_func)
+
+        restored = {}
+        for name, target_path, _, data, found in restores:
+            count = None if found is None else len(found)
+            write_file_atomic(target_path, data)
+            restored[name] = count
+            if log_func:
+                scope = "whole file" if count is None else f"{count} driver(s)"
+                log_func(f"Restored {name} ({scope}) from {backup['name']} to {target_path}.", "info")
+        return restored
+    finally:
+        run_lock.release()
+
+
+def restore_file(backup, name, target_path, keys=None, backup_folder=DEFAULT_BACKUP_FOLDER, log_func=None):
+    """
+    Restore one file of a backup; see restore_files.
+
+    Returns:
+        int or None: Number of drivers restored for a selective restore, None for a whole file.
+    """
+    return restore_files(backup, {name: target_path}, keys, backup_folder, log_func)[name]
+
+
+def _restored_content(backup_data, current_data, target_path, keys):
+    """
+    Put the backed-up entries of the given customer ids in place of the current ones. All entries
+    sharing a customer id are replaced together, at the position of the first current one; drivers
+    only in the backup are appended.
+
+    Returns:
+        tuple: (content to write, customer ids found in the current file or the backup), or
+        (backup content, None) for the whole file.
+    """
+    if keys is None:
+        return backup_data, None
+
+    current_document, (path, key, current), (_, _, backup_drivers) = _driver_maps(current_data, backup_data)
+    found = set(keys) & (current.keys() | backup_drivers.keys())
+    if not found:
+        return None, found
+    if current_document is None:
+        raise ValueError(f"{target_path} does not exist; restore the whole file instead.")
+
+    drivers = current_document
+    for part in path:
+        drivers = drivers[part]
+    restored = []
+    placed = set()
+    for driver in drivers:
+        driver_key = str(driver[key]) if isinstance(driver, dict) and key in driver else None
+        if driver_key not in found:
+            restored.append(driver)
+        elif driver_key not in placed:
+            restored.extend(backup_drivers.get(driver_key, []))
+            placed.add(driver_key)
+    for driver_key in dict.fromkeys(keys):
+        if driver_key in found and driver_key not in placed:
+            restored.extend(backup_drivers[driver_key])
+            placed.add(driver_key)
+    drivers[:] = restored
+    return serialize(current_document), found
+
+
+def restore_targets(backup, paths):
+    """
+    Pair every file of a backup with the file it should be restored to.
+
+    Args:
+        backup (dict): Index entry of the backup.
+        paths (list): The files DriverSync currently synchronizes.
+
+    Returns:
+        dict: File name in the backup -> target path; files without a current counterpart are left out.
+    """
+    current = {Path(path).name: Path(path) for path in paths if path}
+    return {name: current[name] for name in backup.get("files", []) if name in current}
@@ -0,0 +1,424 @@
+import bz2
+import hashlib
+import json
+import lzma
+import os
+import tempfile
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+from _backup_delta import apply_patch, make_patch, serialize
+from _backup_index import BackupIndex, backup_sort_key, plan_retention
+
+# Compression codecs available for backup objects: name -> (compress, decompress)
+CODECS = {
+    "none": (lambda data, level: data, lambda data: data),
+    "zlib": (lambda data, level: zlib.compress(data, level), zlib.decompress),
+    "bz2": (lambda data, level: bz2.compress(data, max(level, 1)), bz2.decompress),
+    "lzma": (lambda data, level: lzma.compress(data, preset=level), lzma.decompress),
+}
+DEFAULT_CODEC = "zlib"
+DEFAULT_LEVEL = 6
+
+# Backup modes: "full" stores every changed file as a whole object, "delta" stores driver-level
+# patches against the previous backup and a new full baseline every DEFAULT_FULL_EVERY backups
+BACKUP_MODES = ("full", "delta")
+DEFAULT_MODE = "delta"
+DEFAULT_FULL_EVERY = 24
+
+MANIFEST_VERSION = 1
+MANIFEST_PREFIX = "backup_"
+MANIFEST_SUFFIX = ".json"
+OBJECTS_FOLDER = "objects"
+
+
+def compress(data, codec=DEFAULT_CODEC, level=DEFAULT_LEVEL):
+    """
+    Compress bytes with the given codec. Levels are clamped to 0-9.
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Unknown backup codec '{codec}'. Choose from: {', '.join(CODECS)}")
+    return CODECS[codec][0](data, min(max(int(level), 0), 9))
+
+
+def decompress(data, codec):
+    if codec not in CODECS:
+        raise ValueError(f"Unknown backup codec '{codec}'.")
+    return CODECS[codec][1](data)
+
+
+def write_file_atomic(path, data):
+    """
+    Write bytes to a temporary file next to path, flush it to disk and move it into place, so
+    readers never see a partially written object or manifest and a finished write survives a crash.
+    Each writer uses its own temporary file, so concurrent writers of the same object do not clash.
+    """
+    path = Path(path)
+    handle, temp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+
+
+def manifest_sort_key(manifest_path):
+    """
+    Sort manifests by creation time, then by the counter added for backups made in the same second.
+    """
+    parts = Path(manifest_path).stem[len(MANIFEST_PREFIX):].split("_")
+    counter = int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else 0
+    return "_".join(parts[:2]), counter
+
+
+class BackupStore:
+    """
+    Content-addressed backup storage.
+
+    Every backed-up file is stored once as a compressed object named after the SHA-256 of its
+    content (objects/<ab>/<sha256>.<codec>). Each backup is a small JSON manifest in the backup
+    folder that lists the files it contains and the objects holding their content, so backing up
+    an unchanged file only costs a manifest entry.
+
+    In delta mode a changed file is stored as a driver patch (see _backup_delta) on top of the
+    previous backup of that file. A delta entry names its full baseline object and every patch
+    since then, so each manifest can be restored on its own.
+
+    Backups are listed and retired through the BackupIndex instead of by scanning the folder.
+    """
+
+    def __init__(self, backup_folder, codec=DEFAULT_CODEC, level=DEFAULT_LEVEL, mode=DEFAULT_MODE,
+                 full_every=DEFAULT_FULL_EVERY):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown backup codec '{codec}'. Choose from: {', '.join(CODECS)}")
+        if mode not in BACKUP_MODES:
+            raise ValueError(f"Unknown backup mode '{mode}'. Choose from: {', '.join(BACKUP_MODES)}")
+        self.backup_folder = Path(backup_folder)
+        self.objects_folder = self.backup_folder / OBJECTS_FOLDER
+        self.codec = codec
+        self.level = level
+        self.mode = mode
+        self.full_every = max(int(full_every), 1)
+        self.index = BackupIndex(self.backup_folder)
+
+    def object_path(self, digest, codec):
+        return self.objects_folder / digest[:2] / f"{digest}.{codec}"
+
+    def find_object(self, digest):
+        """
+        Find a stored object by content hash, whatever codec it was written with.
+
+        Returns:
+            tuple or None: (path, codec) of the object, or None if it is not stored.
+        """
+        for codec in CODECS:
+            path = self.object_path(digest, codec)
+            if path.exists():
+                return path, codec
+        return None
+
+    def stage(self, data):
+        """
+        Hash and compress content without writing it. Unless an object with the same hash is
+        already stored, the compressed bytes and their object hash are kept in "_payload" and
+        "_object" for commit_object.
+
+        Returns:
+            dict: sha256, size, codec and stored_size of the object, plus "new" telling
+            whether it has to be written.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        existing = self.find_object(digest)
+        if existing:
+            path, codec = existing
+            return {"sha256": digest, "size": len(data), "codec": codec,
+                    "stored_size": path.stat().st_size, "new": False}
+
+        stored = compress(data, self.codec, self.level)
+        return {"sha256": digest, "size": len(data), "codec": self.codec,
+                "stored_size": len(stored), "new": True, "_payload": stored, "_object": digest}
+
+    def commit_object(self, staged):
+        """
+        Write the object of a staged entry, if it has one, and return the entry without payload.
+        """
+        staged = dict(staged)
+        payload = staged.pop("_payload", None)
+        digest = staged.pop("_object", None)
+        if payload is not None:
+            path = self.object_path(digest, staged["codec"])
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                write_file_atomic(path, payload)
+        return staged
+
+    def read_object(self, digest, name):
+        found = self.find_object(digest)
+        if not found:
+            raise FileNotFoundError(f"Backup object {digest} for {name} is missing.")
+        path, codec = found
+        return decompress(path.read_bytes(), codec)
+
+    def get(self, entry):
+        """
+        Read the content of a manifest entry, replaying its patches for delta entries,
+        and check it against its hash.
+        """
+        if entry.get("kind") == "delta":
+            document = json.loads(self.read_object(entry["base"], entry["name"]))
+            for patch_digest in entry["patches"]:
+                document = apply_patch(document, json.loads(self.read_object(patch_digest, entry["name"])))
+            data = serialize(document)
+        else:
+            data = self.read_object(entry["sha256"], entry["name"])
+        if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+            raise ValueError(f"Backup of {entry['name']} ({entry['sha256']}) is corrupted.")
+        return data
+
+    @staticmethod
+    def entry_objects(entry):
+        """
+        Return the hashes of all objects a manifest entry needs.
+        """
+        if entry.get("kind") == "delta":
+            return [entry["base"], *entry["patches"]]
+        return [entry["sha256"]]
+
+    def latest_entries(self, names):
+        """
+        Find the most recent manifest entry for each of the given file names.
+        """
+        found = {}
+        for manifest_path in reversed(list(self.iter_manifests())):
+            try:
+                manifest = self.read_manifest(manifest_path)
+            except (OSError, ValueError):
+                continue
+            for entry in manifest.get("files", []):
+                if entry["name"] in names and entry["name"] not in found:
+                    found[entry["name"]] = entry
+            if len(found) == len(names):
+                break
+        return found
+
+    def _delta_entry(self, previous, data, digest):
+        """
+        Build a delta entry for data on top of the previous entry of the same file.
+
+        Returns:
+            dict or None: The entry, or None if a full copy should be stored instead.
+        """
+        patches = previous.get("patches", [])
+        if len(patches) >= self.full_every:
+            return None
+        try:
+            old_document = json.loads(self.get(previous))
+            new_document = json.loads(data)
+        except (OSError, ValueError):
+            return None
+        if serialize(new_document) != data:
+            # Not in DriverSync's own formatting; a replayed patch could not reproduce it byte for byte
+            return None
+        patch = make_patch(old_document, new_document)
+        if patch is None:
+            return None
+        patch_data = json.dumps(patch, separators=(",", ":")).encode("utf-8")
+        if len(patch_data) * 2 > len(data):
+            return None
+
+        staged = self.stage(patch_data)
+        return {
+            **staged,
+            "sha256": digest,
+            "size": len(data),
+            "kind": "delta",
+            "base": previous["base"] if previous.get("kind") == "delta" else previous["sha256"],
+            "patches": [*patches, staged["sha256"]],
+        }
+
+    def prepare_file(self, data, previous=None):
+        """
+        Stage the content of one file and return its manifest entry (without name and source).
+        Nothing is written until the entry is passed to commit_object.
+        Unchanged content reuses the previous entry, so a delta chain is not extended.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        if previous and previous["sha256"] == digest:
+            entry = {key: value for key, value in previous.items() if key not in ("name", "source")}
+            return {**entry, "new": False}
+        if self.mode == "delta" and previous:
+            entry = self._delta_entry(previous, data, digest)
+            if entry:
+                return entry
+        return {**self.stage(data), "kind": "full"}
+
+    def new_manifest_path(self, created):
+        stem = f"{MANIFEST_PREFIX}{created.strftime('%Y%m%d_%H%M%S')}"
+        path = self.backup_folder / f"{stem}{MANIFEST_SUFFIX}"
+        # Continue after the newest indexed backup of the same second, so names of removed
+        # backups are never reused for newer ones
+        same_second = [backup_sort_key(backup)[1] for backup in self.index.backups()
+                       if backup["name"].startswith(stem)]
+        counter = max(same_second) + 1 if same_second else 1
+        if same_second:
+            path = self.backup_folder / f"{stem}_{counter}{MANIFEST_SUFFIX}"
+        while path.exists():
+            path = self.backup_folder / f"{stem}_{counter}{MANIFEST_SUFFIX}"
+            counter += 1
+        return path
+
+    def snapshot_file(self, file_path, previous=None, metrics=None):
+        """
+        Read one file and stage its content in memory. Safe to call for several files in parallel.
+        The returned entry is written by commit_object; an entry that is never committed leaves
+        nothing behind.
+
+        Args:
+            file_path (str or Path): File to back up.
+            previous (dict, optional): Latest manifest entry of this file, used for delta backups.
+            metrics (SyncMetrics, optional): Counts the bytes read.
+
+        Returns:
+            dict or None: The staged manifest entry, or None if the file does not exist.
+        """
+        file_path = Path(file_path)
+        try:
+            data = file_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        entry = self.prepare_file(data, previous)
+        if metrics:
+            metrics.add_read(len(data))
+        return {"name": file_path.name, "source": str(file_path), **entry}
+
+    def commit_entry(self, entry, metrics=None):
+        """
+        Write the object of a staged manifest entry and return the entry ready for the manifest.
+        """
+        committed = self.commit_object(entry)
+        if metrics and committed["new"]:
+            metrics.add_written(committed["stored_size"])
+        return committed
+
+    def create_backup(self, files, metrics=None):
+        """
+        Back up the given files into the store and write a manifest for them.
+        Missing files are left out of the manifest.
+
+        Args:
+            files (list): Paths of the files to back up.
+            metrics (SyncMetrics, optional): Counts the bytes read and written.
+
+        Returns:
+            tuple: (manifest path, list of manifest entries, list of missing files)
+        """
+        self.backup_folder.mkdir(parents=True, exist_ok=True)
+        created = datetime.now()
+        entries = []
+        missing = []
+        files = [Path(file_path) for file_path in files]
+        previous_entries = self.latest_entries({file_path.name for file_path in files})
+
+        for file_path in files:
+            entry = self.snapshot_file(file_path, previous_entries.get(file_path.name), metrics)
+            if entry is None:
+                missing.append(file_path)
+            else:
+                entries.append(self.commit_entry(entry, metrics))
+
+        manifest_path = self.write_manifest(entries, created, metrics)
+        return manifest_path, entries, missing
+
+    def write_manifest(self, entries, created, metrics=None):
+        """
+        Write the manifest of a backup once all of its files are stored.
+
+        Returns:
+            Path: The manifest path.
+        """
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "created": created.isoformat(timespec="seconds"),
+            "files": [{key: value for key, value in entry.items() if key != "new"} for entry in entries],
+        }
+        manifest_data = json.dumps(manifest, indent=4).encode("utf-8")
+        manifest_path = self.new_manifest_path(created)
+        write_file_atomic(manifest_path, manifest_data)
+        if metrics:
+            metrics.add_written(len(manifest_data))
+
+        digests = sorted({digest for entry in entries for digest in self.entry_objects(entry)})
+        known = self.index.load()["objects"]
+        objects = {}
+        for digest in digests:
+            if digest not in known:
+                found = self.find_object(digest)
+                if found:
+                    objects[digest] = [found[1], found[0].stat().st_size]
+        self.index.add_backup({
+            "name": manifest_path.name,
+            "created": manifest["created"],
+            "kind": "manifest",
+            "size": len(manifest_data),
+            "files": [entry["name"] for entry in entries],
+            "objects": digests,
+        }, objects)
+        return manifest_path
+
+    def read_manifest(self, manifest_path):
+        with Path(manifest_path).open("r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def iter_manifests(self):
+        """
+        Yield the manifest paths of the indexed backups, oldest first.
+        """
+        for backup in self.index.backups():
+            if backup["kind"] == "manifest":
+                yield self.backup_folder / backup["name"]
+
+    def apply_retention(self, policy, delete_objects=True, now=None):
+        """
+        Remove the backups the retention policy no longer keeps, and the objects only they used.
+
+        Args:
+            policy (dict): Retention settings (see _backup_index.RETENTION_DEFAULTS).
+            delete_objects (bool): When False, unused objects are only queued in the index and
+                deleted by a later run (used while another backup may still reference them).
+            now (datetime, optional): Reference time for the age limit.
+
+        Returns:
+            tuple: (names of the removed backups, number of objects deleted)
+        """
+        with self.index.lock:
+            index = self.index.load()
+            object_sizes = {digest: stored[1] for digest, stored in index["objects"].items()}
+            remove = set(plan_retention(index["backups"], object_sizes, policy, now))
+            removed = [backup for backup in index["backups"] if backup["name"] in remove]
+            index["backups"] = [backup for backup in index["backups"] if backup["name"] not in remove]
+
+            referenced = {digest for backup in index["backups"] for digest in backup["objects"]}
+            unused = (set(index["pending"]) | {digest for backup in removed for digest in backup["objects"]}) - referenced
+            deletable = unused if delete_objects else set()
+            index["pending"] = sorted(unused - deletable)
+            codecs = {digest: index["objects"].pop(digest, [None])[0] for digest in deletable}
+
+            # Save the index first: a crash afterwards leaves unlisted files, never listed backups that are gone
+            self.index.save(index)
+
+        for backup in removed:
+            (self.backup_folder / backup["name"]).unlink(missing_ok=True)
+        for digest, codec in codecs.items():
+            if codec in CODECS:
+                self.object_path(digest, codec).unlink(missing_ok=True)
+            else:
+                found = self.find_object(digest)
+                if found:
+                    found[0].unlink()
+        return [backup["name"] for backup in removed], len(codecs)
@@ -0,0 +1,293 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from _backup_index import BackupIndex
+from _backup_store import BackupStore, CODECS, decompress, write_file_atomic
+
+VERIFY_FILE = "verify.json"
+VERIFY_VERSION = 1
+CHUNK_SIZE = 1024 * 1024
+
+# Verification settings read from config.json, with their defaults. An interval of 0 disables
+# the scheduled check; the I/O budget caps the read rate of all verifier threads together.
+VERIFY_DEFAULTS = {
+    "backup_verify_interval_hours": 24,
+    "backup_verify_io_mb_s": 20,
+}
+
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+_verify_lock = threading.Lock()
+
+
+class IOBudget:
+    """
+    Token bucket shared by the verifier threads. Reading more than the budget allows makes the
+    reading thread sleep, so a verification never reads faster than bytes_per_second overall.
+    """
+
+    def __init__(self, bytes_per_second):
+        self.rate = bytes_per_second
+        self.available = bytes_per_second
+        self.updated = time.monotonic()
+        self.consumed = 0
+        self.lock = threading.Lock()
+
+    def consume(self, size):
+        with self.lock:
+            self.consumed += size
+            if not self.rate:
+                return
+            now = time.monotonic()
+            self.available = min(self.rate, self.available + (now - self.updated) * self.rate)
+            self.updated = now
+            self.available -= size
+            delay = -self.available / self.rate if self.available < 0 else 0
+        if delay:
+            time.sleep(delay)
+
+
+def load_verify_state(backup_folder):
+    """
+    Read the result of the last verification, or an empty state if there is none.
+    """
+    path = Path(backup_folder) / VERIFY_FILE
+    try:
+        with path.open("r", encoding="utf-8") as file:
+            state = json.load(file)
+        if state.get("version") == VERIFY_VERSION:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {"version": VERIFY_VERSION, "last_run": None, "zip_checksums": {}}
+
+
+def verification_due(backup_folder, interval_hours):
+    """
+    Whether the scheduled verification should run: it is enabled and the last run is older than the interval.
+    """
+    if not interval_hours:
+        return False
+    last_run = load_verify_state(backup_folder).get("last_run")
+    if not last_run:
+        return True
+    return datetime.now() - datetime.fromisoformat(last_run) >= timedelta(hours=interval_hours)
+
+
+def _verify_object(store, digest, codec, budget):
+    """
+    Check that a stored object decompresses to content with its hash.
+
+    Returns:
+        tuple: (status, message) where status is "ok", "missing" or "corrupted".
+    """
+    path = store.object_path(digest, codec) if codec in CODECS else None
+    if path is None or not path.exists():
+        found = store.find_object(digest)
+        if not found:
+            return "missing", f"object {digest} is missing"
+        path, codec = found
+    try:
+        payload = path.read_bytes()
+        budget.consume(len(payload))
+        data = decompress(payload, codec)
+    except Exception as e:
+        return "corrupted", f"object {digest} is unreadable: {e}"
+    if hashlib.sha256(data).hexdigest() != digest:
+        return "corrupted", f"object {digest} does not match its checksum"
+    return "ok", ""
+
+
+def _verify_zip(zip_path, recorded, budget):
+    """
+    Read every member of a legacy backup zip, which checks its CRC, and hash it.
+
+    Returns:
+        tuple: (problems, checksums) with problems as (status, file, message) and the SHA-256 of each member.
+    """
+    if not zip_path.exists():
+        return [("missing", None, "backup file is missing")], {}
+    problems = []
+    checksums = {}
+    try:
+        with zipfile.ZipFile(zip_path) as backup_zip:
+            for info in backup_zip.infolist():
+                digest = hashlib.sha256()
+                try:
+                    with backup_zip.open(info) as member:
+                        for chunk in iter(lambda: member.read(CHUNK_SIZE), b""):
+                            budget.consume(len(chunk))
+                            digest.update(chunk)
+                except (OSError, zipfile.BadZipFile, zlib.error) as e:
+                    problems.append(("corrupted", info.filename, f"unreadable: {e}"))
+                    continue
+                checksums[info.filename] = digest.hexdigest()
+                if info.filename in recorded and recorded[info.filename] != checksums[info.filename]:
+                    problems.append(("corrupted", info.filename, "does not match the checksum recorded earlier"))
+    except (OSError, zipfile.BadZipFile) as e:
+        problems.append(("corrupted", None, f"not a readable zip file: {e}"))
+    return problems, checksums
+
+
+def verify_backups(backup_folder, io_budget_mb_s=VERIFY_DEFAULTS["backup_verify_io_mb_s"], workers=MAX_WORKERS,
+                   log_func=None):
+    """
+    Verify every indexed backup against the checksums recorded when it was written.
+
+    Manifests list the SHA-256 of each file they contain and objects are named after the hash of
+    their content, so each object is read, decompressed and hashed once, however many backups
+    share it. Legacy zips are checked against their CRCs; the SHA-256 of their members is recorded
+    the first time and compared on later runs. Objects and zips are checked in parallel.
+
+    Args:
+        backup_folder (str or Path): The backup folder.
+        io_budget_mb_s (float): Maximum read rate of the verification in MB/s; 0 for no limit.
+        workers (int): Number of verifier threads.
+        log_func (function, optional): Optional logging function.
+
+    Returns:
+        dict: checked (number of backups), objects, bytes_read, and the missing and corrupted
+        problems, each as {"backup", "file", "error"}.
+    """
+    backup_folder = Path(backup_folder)
+    started = time.perf_counter()
+    store = BackupStore(backup_folder)
+    index = BackupIndex(backup_folder)
+    state = load_verify_state(backup_folder)
+    budget = IOBudget(io_budget_mb_s * 1024 * 1024)
+    backups = index.backups()
+    object_codecs = {digest: stored[0] for digest, stored in index.load()["objects"].items()}
+
+    problems = []
+    users = {}
+    for backup in backups:
+        if backup["kind"] != "manifest":
+            continue
+        try:
+            manifest = store.read_manifest(backup_folder / backup["name"])
+        except FileNotFoundError:
+            problems.append(("missing", backup["name"], None, "backup manifest is missing"))
+            continue
+        except (OSError, ValueError) as e:
+            problems.append(("corrupted", backup["name"], None, f"manifest is unreadable: {e}"))
+            continue
+        for entry in manifest.get("files", []):
+            for digest in BackupStore.entry_objects(entry):
+                users.setdefault(digest, []).append((backup["name"], entry["name"]))
+
+    zip_backups = [backup for backup in backups if backup["kind"] == "zip"]
+    with ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="BackupVerify") as pool:
+        object_results = {
+            digest: pool.submit(_verify_object, store, digest, object_codecs.get(digest), budget)
+            for digest in users
+        }
+        zip_results = {
+            backup["name"]: pool.submit(
+                _verify_zip, backup_folder / backup["name"], state["zip_checksums"].get(backup["name"], {}), budget
+            )
+            for backup in zip_backups
+        }
+
+        for digest, result in object_results.items():
+            status, message = result.result()
+            if status != "ok":
+                problems.extend((status, backup_name, file_name, message) for backup_name, file_name in users[digest])
+
+        zip_checksums = {}
+        for backup_name, result in zip_results.items():
+            zip_problems, checksums = result.result()
+            problems.extend((status, backup_name, file_name, message) for status, file_name, message in zip_problems)
+            if checksums:
+                zip_checksums[backup_name] = {**checksums, **state["zip_checksums"].get(backup_name, {})}
+
+    # Backups removed by retention while the verification ran are not problems
+    indexed = {backup["name"] for backup in index.backups()}
+    report = {
+        "checked": len(backups),
+        "objects": len(users),
+        "bytes_read": budget.consumed,
+        "seconds": round(time.perf_counter() - started, 2),
+        "missing": [],
+        "corrupted": [],
+    }
+    for status, backup_name, file_name, message in problems:
+        if backup_name in indexed:
+            report[status].append({"backup": backup_name, "file": file_name, "error": message})
+
+    state.update({
+        "last_run": datetime.now().isoformat(timespec="seconds"),
+        "zip_checksums": zip_checksums,
+        "missing": report["missing"],
+        "corrupted": report["corrupted"],
+    })
+    write_file_atomic(backup_folder / VERIFY_FILE, json.dumps(state, indent=1).encode("utf-8"))
+
+    if log_func:
+        log_verify_report(report, log_func)
+    return report
+
+
+def format_problem(problem):
+    location = f"{problem['backup']}: {problem['file']}" if problem["file"] else problem["backup"]
+    return f"{location} ({problem['error']})"
+
+
+def log_verify_report(report, log_func):
+    """
+    Log the outcome of a verification, one line per problem.
+    """
+    for problem in report["missing"]:
+        log_func(f"Backup verification: missing {format_problem(problem)}", "warning")
+    for problem in report["corrupted"]:
+        log_func(f"Backup verification: corrupted {format_problem(problem)}", "error")
+    if report["missing"] or report["corrupted"]:
+        log_func(
+            f"Backup verification found {len(report['corrupted'])} corrupted and {len(report['missing'])} missing file(s) "
+            f"in {report['checked']} backup(s).", "error"
+        )
+    else:
+        log_func(
+            f"Verified {report['checked']} backup(s) ({report['objects']} object(s), "
+            f"{report['bytes_read'] / (1024 * 1024):.1f} MB) in {report['seconds']} s: all intact.", "info"
+        )
+
+
+def start_background_verification(backup_folder, interval_hours, io_budget_mb_s, log_func=None, force=False):
+    """
+    Verify the backups on a daemon thread if the last verification is older than interval_hours,
+    or right away with force. At most one verification runs at a time per process.
+
+    Returns:
+        threading.Thread or None: The started thread, or None if nothing was due.
+    """
+    if not _verify_lock.acquire(blocking=False):
+        return None
+    try:
+        due = force or verification_due(backup_folder, interval_hours)
+    except Exception:
+        _verify_lock.release()
+        raise
+    if not due:
+        _verify_lock.release()
+        return None
+
+    def run():
+        try:
+            verify_backups(backup_folder, io_budget_mb_s, log_func=log_func)
+        except Exception as e:
+            if log_func:
+                log_func(f"Backup verification failed: {e}", "error")
+        finally:
+            _verify_lock.release()
+
+    thread = threading.Thread(target=run, name="BackupVerify", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,314 @@
+import json
+import os
+import secrets
+import threading
+from datetime import datetime
+from multiprocessing.connection import AuthenticationError, Client, Listener
+from pathlib import Path
+
+from _analytics_store import get_user_data_dir
+from _sync_queue import SyncQueue
+from _sync_timer import ScheduleTimer, count_changed_drivers, file_fingerprint
+
+DAEMON_FILE = "daemon.json"
+DAEMON_SOCKET = "daemon.sock"
+# The daemon runs the CLI's schedule, so it keeps the CLI scheduler's saved next run
+DAEMON_STATE_FILE = "cli_scheduler.json"
+COMMANDS = ("sync-now", "status", "plan", "stop")
+
+# Unix socket paths longer than this are rejected by the OS; such setups use TCP loopback instead
+MAX_SOCKET_PATH = 100
+
+
+class DaemonError(Exception):
+    """
+    The daemon could not carry out a command.
+    """
+
+
+def daemon_info_path():
+    return get_user_data_dir() / DAEMON_FILE
+
+
+def open_listener(authkey):
+    """
+    Open the control channel: a named pipe on Windows, a Unix socket elsewhere, and a TCP
+    socket on the loopback interface if neither can be used.
+
+    Returns:
+        tuple: (listener, family) with the family name used by multiprocessing.connection.
+    """
+    if os.name == "nt":
+        try:
+            address = rf"\\.\pipe\DriverSync-{secrets.token_hex(8)}"
+            return Listener(address, "AF_PIPE", authkey=authkey), "AF_PIPE"
+        except OSError:
+            pass
+    elif hasattr(os, "getuid"):
+        socket_path = get_user_data_dir() / DAEMON_SOCKET
+        if len(str(socket_path)) <= MAX_SOCKET_PATH:
+            try:
+                # Left behind by a daemon that did not shut down cleanly
+                socket_path.unlink()
+            except FileNotFoundError:
+                pass
+            try:
+                return Listener(str(socket_path), "AF_UNIX", authkey=authkey), "AF_UNIX"
+            except OSError:
+                pass
+    return Listener(("127.0.0.1", 0), "AF_INET", authkey=authkey), "AF_INET"
+
+
+class DaemonClient:
+    """
+    Sends commands to a running daemon, one connection per command.
+    """
+
+    def __init__(self, info):
+        self.info = info
+        self.family = info["family"]
+        self.address = tuple(info["address"]) if self.family == "AF_INET" else info["address"]
+        self.authkey = bytes.fromhex(info["authkey"])
+
+    def request(self, command, **args):
+        """
+        Send a command and wait for its result.
+
+        Raises:
+            DaemonError: If the daemon reports that the command failed.
+            OSError: If the daemon cannot be reached.
+        """
+        with Client(self.address, self.family, authkey=self.authkey) as connection:
+            connection.send({"command": command, "args": args})
+            reply = connection.recv()
+        if not reply.get("ok"):
+            raise DaemonError(reply.get("error", "Unknown error"))
+        return reply.get("result")
+
+
+def connect_to_daemon():
+    """
+    Find the running daemon of this user.
+
+    Returns:
+        DaemonClient or None: A client for the daemon, or None if no daemon answers.
+    """
+    try:
+        info = json.loads(daemon_info_path().read_text(encoding="utf-8"))
+        client = DaemonClient(info)
+        client.request("status")
+        return client
+    except (OSError, EOFError, ValueError, KeyError, DaemonError, AuthenticationError):
+        return None
+
+
+class DriverSyncDaemon:
+    """
+    Long-lived headless DriverSync process with a local control channel.
+
+    The daemon keeps the modules, the configuration and the last plan loaded, so commands from the
+    CLI (sync-now, status, plan, stop) are answered without starting a new interpreter. It can run
+    a synchronization schedule as well. The channel address and a random key are written to
+    daemon.json in the per-user data folder; only clients that can read that file can connect.
+    """
+
+    def __init__(self, synchronizer_factory, sync_func, sync_schedule=None, log_func=None):
+        """
+        Args:
+            synchronizer_factory (function): Creates a DriverSync; called again when config.json changes.
+            sync_func (function): sync_func(synchronizer, backup_files) runs a sync and returns (success, stats).
+            sync_schedule (optional): IntervalSchedule, CronSchedule or AdaptiveSchedule to run syncs on.
+            log_func (function, optional): Optional logging function.
+        """
+        self.synchronizer_factory = synchronizer_factory
+        self.sync_func = sync_func
+        self.schedule = sync_schedule
+        self.log_func = log_func
+        self.authkey = secrets.token_bytes(32)
+        self.listener = None
+        self.family = None
+        self.timer = None
+        self.started = None
+        self.syncs = 0
+        self.last_sync = None
+        self.sync_running = False
+        # sync-now requests and scheduled runs share one queue, so overlapping triggers merge
+        self.queue = SyncQueue(
+            lambda backup_files: self._run_sync(self.synchronizer(), backup_files), name="DaemonSyncQueue",
+            log_func=log_func
+        )
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._synchronizer = None
+        self._config_stamp = None
+        self._plan_cache = None
+
+    def serve_forever(self):
+        """
+        Publish the control channel and answer commands until stop() is called.
+        """
+        self.listener, self.family = open_listener(self.authkey)
+        self.started = datetime.now()
+        self._write_info()
+        self._log(f"DriverSync daemon listening on {self.listener.address} (pid {os.getpid()}).", "info")
+
+        if self.schedule is not None:
+            self.timer = ScheduleTimer(
+                self._scheduled_sync, self.schedule, name="DaemonScheduler", log_func=self.log_func,
+                state_path=get_user_data_dir() / DAEMON_STATE_FILE
+            )
+            self._log(f"Synchronizing {self.schedule.describe()}.", "info")
+            self.timer.start()
+
+        try:
+            while not self._stopping.is_set():
+                try:
+                    connection = self.listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    continue
+                threading.Thread(target=self._handle, args=(connection,), name="DaemonRequest", daemon=True).start()
+        finally:
+            if self.timer:
+                self.timer.stop()
+            self.listener.close()
+            self._remove_info()
+            self._log("DriverSync daemon stopped.", "info")
+
+    def stop(self):
+        """
+        Stop answering commands; serve_forever() returns once the listener wakes up.
+        """
+        if self._stopping.is_set():
+            return
+        self._stopping.set()
+        # accept() is not interrupted by closing the listener on every platform; a connection wakes it
+        try:
+            Client(self.listener.address, self.family, authkey=self.authkey).close()
+        except (OSError, EOFError, AuthenticationError):
+            pass
+
+    def _handle(self, connection):
+        stop_after = False
+        with connection:
+            try:
+                request = connection.recv()
+                command = request.get("command")
+                if command not in COMMANDS:
+                    raise DaemonError(f"Unknown command '{command}'. Use one of: {', '.join(COMMANDS)}.")
+                result = getattr(self, "command_" + command.replace("-", "_"))(**request.get("args", {}))
+                reply = {"ok": True, "result": result}
+                stop_after = command == "stop"
+            except Exception as e:
+                reply = {"ok": False, "error": str(e)}
+            try:
+                connection.send(reply)
+            except (OSError, EOFError):
+                pass
+        if stop_after:
+            self.stop()
+
+    def synchronizer(self):
+        """
+        The daemon's DriverSync, recreated when config.json has changed since it was loaded.
+        """
+        with self._lock:
+            config_file = Path(self._synchronizer.config_file) if self._synchronizer else None
+            stamp = file_fingerprint(config_file) if config_file else None
+            if self._synchronizer is None or stamp != self._config_stamp:
+                self._synchronizer = self.synchronizer_factory()
+                self._config_stamp = file_fingerprint(self._synchronizer.config_file)
+                self._plan_cache = None
+            return self._synchronizer
+
+    def command_sync_now(self, backup=None):
+        if backup is None:
+            backup = self.synchronizer().config.get("backup_files", True)
+        return self.queue.request(backup).result()
+
+    def command_plan(self):
+        """
+        The changes a sync would make. The plan is kept until the files or the configuration change.
+        """
+        synchronizer = self.synchronizer()
+        key = [file_fingerprint(synchronizer.ioverlay_path), file_fingerprint(synchronizer.crewchief_path)]
+        cached = self._plan_cache
+        if cached and cached["key"] == key:
+            return {**cached["plan"], "cached": True}
+
+        success, stats, preview_data = synchronizer.synchronize_files(dry_run=True)
+        if not success:
+            raise DaemonError(stats.get("error", "Planning the synchronization failed"))
+        plan = {"stats": stats, "changes": preview_data}
+        self._plan_cache = {"key": key, "plan": plan}
+        return {**plan, "cached": False}
+
+    def command_status(self):
+        next_run = self.timer.next_run if self.timer else None
+        return {
+            "pid": os.getpid(),
+            "started": self.started.isoformat(timespec="seconds"),
+            "uptime_s": round((datetime.now() - self.started).total_seconds()),
+            "schedule": self.schedule.describe() if self.schedule is not None else None,
+            "next_run": next_run.isoformat(timespec="seconds") if next_run else None,
+            "sync_running": self.sync_running,
+            "sync_queued": self.queue.pending,
+            "syncs": self.syncs,
+            "last_sync": self.last_sync,
+        }
+
+    def command_stop(self):
+        return {"pid": os.getpid()}
+
+    def _run_sync(self, synchronizer, backup_files):
+        self.sync_running = True
+        try:
+            success, stats = self.sync_func(synchronizer, backup_files)
+        finally:
+            self.sync_running = False
+        self.syncs += 1
+        self._plan_cache = None
+        self.last_sync = {
+            "at": datetime.now().isoformat(timespec="seconds"),
+            "success": success,
+            "stats": stats,
+        }
+        return self.last_sync
+
+    def _scheduled_sync(self):
+        result = self.queue.request(self.synchronizer().config.get("backup_files", True)).result()
+        if result["success"] and hasattr(self.schedule, "record_run"):
+            interval = self.schedule.record_run(count_changed_drivers(result["stats"]))
+            self._log(f"Next run in {interval} minute(s).", "info")
+            self.timer.reschedule()
+
+    def _write_info(self):
+        address = self.listener.address
+        info = {
+            "pid": os.getpid(),
+            "family": self.family,
+            "address": list(address) if isinstance(address, tuple) else address,
+            "authkey": self.authkey.hex(),
+            "started": self.started.isoformat(timespec="seconds"),
+        }
+        # Created readable by this user only, as the key grants control over the daemon
+        path = daemon_info_path()
+        temp_path = path.with_suffix(".tmp")
+        descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump(info, file)
+        os.replace(temp_path, path)
+
+    def _remove_info(self):
+        """
+        Remove daemon.json, unless a newer daemon has replaced it meanwhile.
+        """
+        path = daemon_info_path()
+        try:
+            if json.loads(path.read_text(encoding="utf-8")).get("pid") == os.getpid():
+                path.unlink()
+        except (OSError, ValueError):
+            pass
+
+    def _log(self, message, level):
+        if self.log_func:
+            self.log_func(message, level)
@@ -0,0 +1,129 @@
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Phases of a synchronization run, in the order they normally happen
+SYNC_PHASES = ("read", "parse", "plan", "backup", "write", "analytics")
+
+
+def get_peak_rss_kb():
+    """
+    Return the peak resident set size of this process in kilobytes, or None if unavailable.
+    """
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return None
+            return counters.PeakWorkingSetSize // 1024
+
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS reports bytes, Linux reports kilobytes
+        return peak // 1024 if sys.platform == "darwin" else peak
+    except Exception:
+        return None
+
+
+class SyncMetrics:
+    """
+    Collects wall and CPU time per synchronization phase, plus bytes read and written, and the
+    retries of reads that caught a source file mid-write with the time they cost.
+    Time spent in a phase that is entered more than once is accumulated.
+    Byte counters may be updated from worker threads (see BackupManager.start_backup).
+
+    The run's own wall and CPU time are measured from the moment the metrics are created until
+    finish() is called, so they include the time between phases. CPU time comes from
+    time.process_time(), which counts every thread of the process: the figures for the run and
+    for each phase include work done meanwhile by other threads, such as the backup workers or
+    the GUI.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        self.wall_ms = None
+        self.cpu_ms = None
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.read_retries = 0
+        self.retry_wait_ms = 0.0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time the enclosed block as part of the given phase.
+        """
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield self
+        finally:
+            timings = self.phases.setdefault(name, {"wall_ms": 0.0, "cpu_ms": 0.0})
+            timings["wall_ms"] += (time.perf_counter() - wall_start) * 1000
+            timings["cpu_ms"] += (time.process_time() - cpu_start) * 1000
+
+    def finish(self):
+        """
+        Mark the end of the run. Later calls keep the first end.
+        """
+        if self.wall_ms is None:
+            self.wall_ms = (time.perf_counter() - self.wall_start) * 1000
+            self.cpu_ms = (time.process_time() - self.cpu_start) * 1000
+
+    def add_read(self, byte_count):
+        with self._lock:
+            self.bytes_read += byte_count
+
+    def add_written(self, byte_count):
+        with self._lock:
+            self.bytes_written += byte_count
+
+    def add_retry(self, lost_ms):
+        with self._lock:
+            self.read_retries += 1
+            self.retry_wait_ms += lost_ms
+
+    def as_dict(self):
+        """
+        Return the collected metrics as a JSON-serializable dict.
+        Before finish() is called, the run's wall and CPU time are those up to now.
+        """
+        phases = {
+            name: {key: round(value, 3) for key, value in timings.items()}
+            for name, timings in self.phases.items()
+        }
+        wall_ms = self.wall_ms if self.wall_ms is not None else (time.perf_counter() - self.wall_start) * 1000
+        cpu_ms = self.cpu_ms if self.cpu_ms is not None else (time.process_time() - self.cpu_start) * 1000
+        return {
+            "wall_ms": round(wall_ms, 3),
+            "cpu_ms": round(cpu_ms, 3),
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "read_retries": self.read_retries,
+            "retry_wait_ms": round(self.retry_wait_ms, 3),
+            "peak_rss_kb": get_peak_rss_kb(),
+            "phases": phases,
+        }
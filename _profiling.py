@@ -0,0 +1,130 @@
+import cProfile
+import os
+import pstats
+import secrets
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+PROFILE_FOLDER = "Logs"
+TOP_ENTRIES = 20
+# Frames kept per allocation; one is enough to attribute memory to a source line
+TRACEMALLOC_FRAMES = 1
+
+
+def new_run_id():
+    """
+    Returns:
+        str: A run ID such as 20261018_154210_3fa9, sortable by time and unique per run.
+    """
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{secrets.token_hex(2)}"
+
+
+class SyncProfiler:
+    """
+    Runs one synchronization under cProfile and tracemalloc and saves what they found.
+
+    Two files are written to the Logs folder, named after the run ID:
+        profile_<run id>.prof  The cProfile data, for pstats, snakeviz and similar tools.
+        profile_<run id>.txt   The hottest functions by own time and the lines that allocated most.
+
+    Profiling only happens for syncs that are wrapped in a SyncProfiler, and this module is only
+    imported when profiling is switched on, so normal syncs run without any of its overhead.
+    cProfile records the thread that calls run(); tracemalloc sees the allocations of all threads,
+    including the backup workers.
+    """
+
+    def __init__(self, folder=PROFILE_FOLDER, top=TOP_ENTRIES, run_id=None):
+        self.folder = Path(folder)
+        self.top = top
+        self.run_id = run_id or new_run_id()
+        self.profile_path = self.folder / f"profile_{self.run_id}.prof"
+        self.report_path = self.folder / f"profile_{self.run_id}.txt"
+        self.elapsed_ms = 0.0
+        self.peak_memory_kb = 0
+        self.hot_functions = []
+        self.allocations = []
+
+    def run(self, func, *args, **kwargs):
+        """
+        Call func(*args, **kwargs) under the profilers and save the results, also if func raises.
+
+        Returns:
+            The result of func.
+        """
+        # Someone may already trace allocations (PYTHONTRACEMALLOC); leave their tracing running
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        tracemalloc.reset_peak()
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.disable()
+            self.elapsed_ms = (time.perf_counter() - started) * 1000
+            snapshot = tracemalloc.take_snapshot()
+            self.peak_memory_kb = tracemalloc.get_traced_memory()[1] // 1024
+            if not was_tracing:
+                tracemalloc.stop()
+            self._collect(profiler, snapshot)
+            self.save(profiler)
+
+    def _collect(self, profiler, snapshot):
+        stats = pstats.Stats(profiler)
+        rows = []
+        for (file_name, line, function), (_, calls, own_time, total_time, _) in stats.stats.items():
+            rows.append({
+                "function": function,
+                # cProfile files built-in functions under "~"
+                "location": "built-in" if file_name == "~" else f"{os.path.basename(file_name)}:{line}",
+                "calls": calls,
+                "own_ms": own_time * 1000,
+                "total_ms": total_time * 1000,
+            })
+        rows.sort(key=lambda row: row["own_ms"], reverse=True)
+        self.hot_functions = rows[:self.top]
+
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        self.allocations = [
+            {
+                "location": f"{os.path.basename(statistic.traceback[0].filename)}:{statistic.traceback[0].lineno}",
+                "size_kb": statistic.size / 1024,
+                "count": statistic.count,
+            }
+            for statistic in snapshot.statistics("lineno")[:self.top]
+        ]
+
+    def save(self, profiler):
+        self.folder.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(self.profile_path))
+        with open(self.report_path, "w", encoding="utf-8") as report:
+            report.write(self.summary() + "\n\n")
+            report.write(f"Top {len(self.allocations)} allocations still held at the end of the run:\n")
+            for allocation in self.allocations:
+                report.write(
+                    f"{allocation['size_kb']:10.1f} KiB {allocation['count']:>8} block(s)  {allocation['location']}\n"
+                )
+
+    def summary(self):
+        """
+        Returns:
+            str: The run ID, duration and peak memory, followed by the hottest functions.
+        """
+        lines = [
+            f"Profile {self.run_id}: {self.elapsed_ms:.0f} ms, peak traced memory {self.peak_memory_kb} KiB.",
+            f"Top {len(self.hot_functions)} functions by own time:",
+            f"{'own ms':>10} {'total ms':>10} {'calls':>8}  function",
+        ]
+        for row in self.hot_functions:
+            lines.append(
+                f"{row['own_ms']:10.1f} {row['total_ms']:10.1f} {row['calls']:>8}  {row['function']} ({row['location']})"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,106 @@
+import json
+import os
+import random
+import re
+import time
+
+# Read retry settings read from config.json, with their defaults: the number of retries after the
+# first read, and the base and cap in milliseconds of the exponential backoff between them.
+READ_RETRY_DEFAULTS = {
+    "read_retry_attempts": 5,
+    "read_retry_base_ms": 100,
+    "read_retry_max_ms": 2000,
+}
+
+# What may follow the position of a JSON error in a document that was cut off: nothing, or the
+# start of a number or of true/false/null
+PARTIAL_TOKEN = re.compile(r"[\w.+-]*")
+
+
+class PartialFileError(ValueError):
+    """
+    A file was read while another program (CrewChief, iOverlay) was still writing it, or while
+    it was locked. Reading it again a little later normally succeeds.
+    """
+
+
+def is_truncated_json(error):
+    """
+    Whether a JSON error means the document ended early rather than that it is malformed.
+    """
+    if error.msg.startswith("Unterminated string"):
+        return True
+    return PARTIAL_TOKEN.fullmatch(error.doc[error.pos:].strip()) is not None
+
+
+def read_json_once(path, metrics):
+    """
+    Read and parse a JSON file once, timing the read and parse phases.
+
+    Raises:
+        PartialFileError: If the file changed size while it was read, is locked, or its JSON is cut off.
+    """
+    try:
+        with metrics.phase("read"):
+            before = os.stat(path)
+            with open(path, "rb") as file:
+                raw = file.read()
+            after = os.stat(path)
+    except PermissionError as e:
+        # Windows refuses to open a file another program holds open for writing
+        raise PartialFileError(f"{path} is locked: {e}") from e
+    metrics.add_read(len(raw))
+    if len(raw) != after.st_size or (before.st_size, before.st_mtime_ns) != (after.st_size, after.st_mtime_ns):
+        raise PartialFileError(f"{path} changed while it was read")
+
+    with metrics.phase("parse"):
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError as e:
+            if is_truncated_json(e):
+                raise PartialFileError(f"{path} ends in the middle of its JSON ({e})") from e
+            raise
+        except UnicodeDecodeError as e:
+            if e.end >= len(e.object):
+                raise PartialFileError(f"{path} ends in the middle of a character") from e
+            raise
+
+
+def read_json_with_retry(path, metrics, attempts=READ_RETRY_DEFAULTS["read_retry_attempts"],
+                         base_ms=READ_RETRY_DEFAULTS["read_retry_base_ms"],
+                         max_ms=READ_RETRY_DEFAULTS["read_retry_max_ms"], log_func=None):
+    """
+    Read a JSON file, retrying while it is caught mid-write.
+
+    Only partially written or locked files are retried; a missing file or malformed JSON fails
+    right away. The wait before retry n is between half and all of min(max_ms, base_ms * 2**n),
+    so the wait grows exponentially while readers that collided do not retry in lockstep.
+    Retries and the time they cost (failed reads plus waits) are counted in the metrics.
+
+    Args:
+        path (str or Path): The JSON file.
+        metrics (SyncMetrics): Metrics to record the read, parse and retries in.
+        attempts (int): Number of retries after the first read.
+        base_ms (float): Backoff of the first retry in milliseconds.
+        max_ms (float): Longest backoff in milliseconds.
+        log_func (function, optional): Optional logging function.
+
+    Returns:
+        The parsed JSON.
+
+    Raises:
+        PartialFileError: If the file was still incomplete after the last retry.
+    """
+    for attempt in range(attempts + 1):
+        started = time.perf_counter()
+        try:
+            return read_json_once(path, metrics)
+        except PartialFileError as e:
+            if attempt == attempts:
+                raise
+            backoff = min(max_ms, base_ms * 2 ** attempt) / 1000
+            delay = backoff / 2 + random.uniform(0, backoff / 2)
+            if log_func:
+                log_func(f"{e}; retrying in {delay * 1000:.0f} ms ({attempt + 1}/{attempts}).", "warning")
+            time.sleep(delay)
+            metrics.add_retry((time.perf_counter() - started) * 1000)
@@ -0,0 +1,235 @@
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMessageBox, QTableWidget, QTableWidgetItem,
+    QHeaderView, QComboBox, QAbstractItemView
+)
+from PyQt5.QtCore import Qt
+from _backup_restore import (
+    DEFAULT_BACKUP_FOLDER, diff_drivers, list_backups, read_backup_file, restore_file, restore_targets
+)
+
+
+def format_driver(drivers):
+    """
+    Summarize the entries of one customer id for the diff table.
+    """
+    if not drivers:
+        return ""
+    return "; ".join(
+        ", ".join(f"{key}: {value}" for key, value in driver.items() if key not in ("customer_id", "identifier"))
+        for driver in drivers
+    )
+
+
+class RestoreDialog(QDialog):
+    """
+    Lists the indexed backups and shows, per file, which drivers differ from the current files.
+    Chosen drivers or a whole file can be restored; backups are read in memory, never extracted.
+    """
+    ACTION_LABELS = {
+        "restore": "Only in backup",
+        "remove": "Only in current file",
+        "revert": "Changed since backup",
+    }
+
+    def __init__(self, synchronizer, parent=None, backup_folder=DEFAULT_BACKUP_FOLDER):
+        super().__init__(parent)
+        self.synchronizer = synchronizer
+        self.backup_folder = backup_folder
+        self.parent_app = parent
+        self.backups = []
+        self.differences = []
+
+        self.setWindowTitle("Restore Backup")
+        self.resize(1000, 600)
+        self.setStyleSheet("""
+            QDialog {
+                background: qlineargradient(
+                    x1: 0, y1: 0, x2: 1, y2: 1,
+                    stop: 0 #e0f7ff, stop: 1 #ffffff
+                );
+                border-radius: 10px;
+            }
+            QLabel {
+                font-size: 14px;
+                color: #333333;
+            }
+        """)
+
+        self.layout = QVBoxLayout()
+
+        self.layout.addWidget(QLabel("Backups"))
+        self.backup_table = QTableWidget(0, 3)
+        self.backup_table.setHorizontalHeaderLabels(["Created", "Files", "Size (KB)"])
+        self.backup_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.backup_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.backup_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.backup_table.verticalHeader().setDefaultSectionSize(20)
+        self.backup_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.backup_table.itemSelectionChanged.connect(self.load_files)
+        self.layout.addWidget(self.backup_table, stretch=1)
+
+        file_layout = QHBoxLayout()
+        file_layout.addWidget(QLabel("File:"))
+        self.file_combo = QComboBox()
+        self.file_combo.currentIndexChanged.connect(self.load_diff)
+        file_layout.addWidget(self.file_combo, stretch=1)
+        self.summary_label = QLabel("")
+        file_layout.addWidget(self.summary_label)
+        self.layout.addLayout(file_layout)
+
+        self.diff_table = QTableWidget(0, 5)
+        self.diff_table.setHorizontalHeaderLabels(["Customer ID", "Name", "Difference", "Current", "Backup"])
+        self.diff_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.diff_table.verticalHeader().setDefaultSectionSize(20)
+        header = self.diff_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(3, QHeaderView.Stretch)
+        header.setSectionResizeMode(4, QHeaderView.Stretch)
+        self.layout.addWidget(self.diff_table, stretch=2)
+
+        button_layout = QHBoxLayout()
+        select_all_button = QPushButton("Select All")
+        select_all_button.clicked.connect(lambda: self.set_all_checked(True))
+        button_layout.addWidget(select_all_button)
+        select_none_button = QPushButton("Select None")
+        select_none_button.clicked.connect(lambda: self.set_all_checked(False))
+        button_layout.addWidget(select_none_button)
+        button_layout.addStretch()
+        self.restore_selected_button = QPushButton("Restore Selected Drivers")
+        self.restore_selected_button.clicked.connect(self.restore_selected)
+        button_layout.addWidget(self.restore_selected_button)
+        self.restore_file_button = QPushButton("Restore Whole File")
+        self.restore_file_button.clicked.connect(self.restore_whole_file)
+        button_layout.addWidget(self.restore_file_button)
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(close_button)
+        self.layout.addLayout(button_layout)
+
+        self.setLayout(self.layout)
+        self.load_backups()
+
+    def log(self, message, level="info", to_gui=True, **kwargs):
+        if to_gui and self.parent_app and hasattr(self.parent_app, "log_to_gui"):
+            self.parent_app.log_to_gui(message, level)
+
+    def load_backups(self):
+        try:
+            self.backups = list_backups(self.backup_folder)
+        except (OSError, ValueError) as e:
+            self.backups = []
+            QMessageBox.critical(self, "Restore Backup", f"Failed to read the backup index: {e}")
+
+        self.backup_table.setRowCount(len(self.backups))
+        for row, backup in enumerate(self.backups):
+            for column, text in enumerate((
+                backup["created"].replace("T", " "),
+                ", ".join(backup["files"]),
+                f"{backup['stored_size'] / 1024:.1f}",
+            )):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignCenter)
+                self.backup_table.setItem(row, column, item)
+        if self.backups:
+            self.backup_table.selectRow(0)
+        else:
+            self.load_files()
+
+    def selected_backup(self):
+        rows = self.backup_table.selectionModel().selectedRows()
+        return self.backups[rows[0].row()] if rows else None
+
+    def targets(self, backup):
+        return restore_targets(backup, [self.synchronizer.ioverlay_path, self.synchronizer.crewchief_path])
+
+    def load_files(self):
+        backup = self.selected_backup()
+        self.file_combo.blockSignals(True)
+        self.file_combo.clear()
+        if backup:
+            self.file_combo.addItems(list(self.targets(backup)))
+        self.file_combo.blockSignals(False)
+        self.load_diff()
+
+    def load_diff(self):
+        backup = self.selected_backup()
+        name = self.file_combo.currentText()
+        self.differences = []
+        message = ""
+        if backup and name:
+            target_path = self.targets(backup)[name]
+            try:
+                backup_data = read_backup_file(backup, name, self.backup_folder)
+                current_data = target_path.read_bytes() if target_path.exists() else None
+                self.differences = diff_drivers(current_data, backup_data)
+                message = f"{len(self.differences)} driver(s) differ"
+            except (OSError, ValueError) as e:
+                message = str(e)
+        elif backup:
+            message = "This backup contains none of the configured files."
+
+        self.summary_label.setText(message)
+        self.diff_table.setRowCount(len(self.differences))
+        for row, difference in enumerate(self.differences):
+            key_item = QTableWidgetItem(difference["key"])
+            key_item.setFlags(key_item.flags() | Qt.ItemIsUserCheckable)
+            key_item.setCheckState(Qt.Unchecked)
+            self.diff_table.setItem(row, 0, key_item)
+            self.diff_table.setItem(row, 1, QTableWidgetItem(difference["name"]))
+            self.diff_table.setItem(row, 2, QTableWidgetItem(self.ACTION_LABELS[difference["action"]]))
+            self.diff_table.setItem(row, 3, QTableWidgetItem(format_driver(difference["current"])))
+            self.diff_table.setItem(row, 4, QTableWidgetItem(format_driver(difference["backup"])))
+
+        has_file = bool(backup and name)
+        self.restore_selected_button.setEnabled(bool(self.differences))
+        self.restore_file_button.setEnabled(has_file)
+
+    def set_all_checked(self, checked):
+        state = Qt.Checked if checked else Qt.Unchecked
+        for row in range(self.diff_table.rowCount()):
+            self.diff_table.item(row, 0).setCheckState(state)
+
+    def checked_keys(self):
+        return [
+            self.diff_table.item(row, 0).text()
+            for row in range(self.diff_table.rowCount())
+            if self.diff_table.item(row, 0).checkState() == Qt.Checked
+        ]
+
+    def restore_selected(self):
+        keys = self.checked_keys()
+        if not keys:
+            QMessageBox.information(self, "Restore Backup", "Select the drivers to restore first.")
+            return
+        self.restore(keys)
+
+    def restore_whole_file(self):
+        self.restore(None)
+
+    def restore(self, keys):
+        backup = self.selected_backup()
+        name = self.file_combo.currentText()
+        target_path = self.targets(backup)[name]
+        scope = f"{len(keys)} driver(s) in {name}" if keys else f"the whole of {name}"
+        answer = QMessageBox.question(
+            self, "Restore Backup",
+            f"Restore {scope} from the backup of {backup['created'].replace('T', ' ')}?\n"
+            "The current file is backed up first.",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if answer != QMessageBox.Yes:
+            return
+
+        try:
+            restore_file(backup, name, target_path, keys=keys, backup_folder=self.backup_folder, log_func=self.log)
+        except (OSError, ValueError) as e:
+            self.log(f"Failed to restore {name}: {e}", "error")
+            QMessageBox.critical(self, "Restore Backup", f"Failed to restore {name}: {e}")
+            return
+
+        # The pre-restore backup is now the newest one; keep the restored backup selected
+        self.load_backups()
+        for row, listed in enumerate(self.backups):
+            if listed["name"] == backup["name"]:
+                self.backup_table.selectRow(row)
+                break
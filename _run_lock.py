@@ -0,0 +1,82 @@
+import os
+import threading
+import time
+
+from _analytics_store import get_user_data_dir
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+RUN_LOCK_FILE = "sync.lock"
+RETRY_SECONDS = 0.1
+
+
+class SyncRunLock:
+    """
+    Makes sure only one synchronization writes the iOverlay and CrewChief files at a time, across
+    the threads of this process (GUI, scheduler) and across processes (GUI and CLI). The
+    cross-process part is an OS lock on a file in the per-user data folder; it is released
+    automatically if the process dies.
+    """
+    # Shared by all instances: the OS lock is per process on some platforms, so threads need their own
+    _thread_lock = threading.Lock()
+
+    def __init__(self, path=None):
+        self.path = path or get_user_data_dir() / RUN_LOCK_FILE
+        self._file = None
+
+    def acquire(self, timeout=0):
+        """
+        Take the lock, waiting up to timeout seconds.
+
+        Returns:
+            bool: True if the lock was taken.
+        """
+        deadline = time.monotonic() + timeout
+        acquired = self._thread_lock.acquire(timeout=timeout) if timeout > 0 else self._thread_lock.acquire(False)
+        if not acquired:
+            return False
+        try:
+            lock_file = open(self.path, "a+b")
+        except OSError:
+            self._thread_lock.release()
+            raise
+        while True:
+            try:
+                self._lock_file(lock_file)
+                self._file = lock_file
+                return True
+            except OSError:
+                if time.monotonic() >= deadline:
+                    lock_file.close()
+                    self._thread_lock.release()
+                    return False
+                time.sleep(RETRY_SECONDS)
+
+    def release(self):
+        if self._file is None:
+            return
+        try:
+            self._unlock_file(self._file)
+        finally:
+            self._file.close()
+            self._file = None
+            self._thread_lock.release()
+
+    @staticmethod
+    def _lock_file(lock_file):
+        if os.name == "nt":
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    @staticmethod
+    def _unlock_file(lock_file):
+        if os.name == "nt":
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
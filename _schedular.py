@@ -1,148 +1,220 @@
-import threading
-import schedule
-import time
-from datetime import datetime
-from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QSpinBox, QPushButton, QHBoxLayout
-from PyQt5.QtCore import Qt
-from _logging import log_to_gui
-
-class DriverSyncScheduler:
-
-    def __init__(self, synchronizer, log_to_gui, parent=None):
-        self.synchronizer = synchronizer
-        self.log_to_gui = log_to_gui
-        self.scheduler_thread = None
-        self.running = False
-        self.interval_hours = None
-        self.parent = parent
-
-    def start_scheduler(self, interval_hours):
-        """
-        Start the scheduler to run the synchronization task at specified intervals.
-
-        Args:
-            interval_hours (int): The interval in hours for the scheduler.
-        """
-        if self.running:
-            self.log_to_gui("Scheduler is already running.", "info")
-            return
-
-        self.log_to_gui(f"Starting scheduler to run every {interval_hours} hour(s)...", "info")
-
-        # Store the interval for later use
-        self.interval_hours = interval_hours
-
-        # Clear existing scheduled tasks to prevent duplicate jobs
-        schedule.clear()
-
-        # Schedule the synchronization task
-        schedule.every(interval_hours).hours.do(self.run_synchronization)
-
-        # Start the scheduler in a separate thread
-        self.running = True
-        self.scheduler_thread = threading.Thread(target=self.run_scheduler, daemon=True)
-        self.scheduler_thread.start()
-
-    def run_synchronization(self):
-        """
-        Perform the synchronization task and log the results.
-        """
-        self.log_to_gui(f"Starting synchronization at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}...", "info")
-        try:
-            success, stats = self.synchronizer.synchronize_files(dry_run=False)
-            if success:
-                self.log_to_gui("Scheduled synchronization completed successfully!", "success")
-            else:
-                self.log_to_gui("Scheduled synchronization failed.", "error")
-        except Exception as e:
-            self.log_to_gui(f"Error during synchronization: {e}", "error")
-
-    def run_scheduler(self):
-        """
-        Run the scheduler in a loop to check and execute pending tasks.
-        """
-        try:
-            while self.running:
-                schedule.run_pending()
-                time.sleep(1)  # Prevent high CPU usage
-        except Exception as e:
-            self.log_to_gui(f"Scheduler encountered an error: {e}", "error")
-        finally:
-            self.log_to_gui("Scheduler stopped.", "info")
-
-    def stop_scheduler(self):
-        if not self.running:
-            self.log_to_gui("Scheduler is not running.", "info")
-            return
-
-        self.log_to_gui("Stopping scheduler...", "info")
-        self.running = False
-        schedule.clear()
-
-    def show_settings_dialog(self):
-        dialog = SchedulerSettingsDialog(self.interval_hours, self.parent)
-        if dialog.exec():
-            new_interval = dialog.get_interval()
-            if new_interval != self.interval_hours:
-                self.stop_scheduler()
-                self.start_scheduler(new_interval)
-
-class SchedulerSettingsDialog(QDialog):
-    """
-    Dialog to configure scheduler settings, such as interval hours.
-    """
-    def __init__(self, current_interval, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Scheduler Settings")
-        self.resize(400, 200)
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 #e0f7ff, stop: 1 #ffffff
-                );
-                border-radius: 10px;
-            }
-            QLabel {
-                font-size: 14px;
-                color: #333333;
-            }
-            QListWidget {
-                background-color: white;
-                border: 1px solid #dddddd;
-                border-radius: 6px;
-                font-size: 14px;
-                color: #333333;
-            }
-        """)
-
-        # Main layout
-        layout = QVBoxLayout()
-
-        # Interval input
-        layout.addWidget(QLabel("Set Scheduler Interval (in hours):", alignment=Qt.AlignCenter))
-        self.interval_input = QSpinBox()
-        self.interval_input.setRange(1, 24)
-        self.interval_input.setValue(self.current_interval or 1)
-        layout.addWidget(self.interval_input, alignment=Qt.AlignCenter)
-
-        # Buttons
-        button_layout = QHBoxLayout()
-        save_button = QPushButton("Save")
-        save_button.clicked.connect(self.accept)
-        cancel_button = QPushButton("Cancel")
-        cancel_button.clicked.connect(self.reject)
-        button_layout.addWidget(save_button)
-        button_layout.addWidget(cancel_button)
-        layout.addLayout(button_layout)
-
-        self.setLayout(layout)
-
-    def get_interval(self):
-        """
-        Get the interval entered by the user.
-
-        Returns:
-            int: The interval in hours.
-        """
-        return self.interval_input.value()
+﻿from datetime import datetime, timedelta
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QSpinBox, QPushButton, QHBoxLayout, QLineEdit, QMessageBox
+from PyQt5.QtCore import Qt, QObject, pyqtSignal
+from _analytics_store import get_user_data_dir
+from _logging import log_to_gui
+from _sync_timer import CronSchedule, IntervalSchedule, ScheduleTimer, count_changed_drivers
+
+SCHEDULER_STATE_FILE = "scheduler.json"
+
+class DriverSyncScheduler(QObject):
+    """
+    The single owner of the GUI's synchronization schedule. It keeps the next run time on its
+    timer thread and emits sync_due when a run is due; the application performs the sync on its
+    own thread, where the synchronizer's run lock keeps it from overlapping any other sync.
+    Every change of the schedule is published through state_changed; the countdown label and
+    the tray only observe it. The next run time is saved, so a restart resumes the countdown
+    and runs missed while DriverSync was closed lead to one catch-up run.
+    """
+    # Emitted on the timer thread; connected slots run on the GUI thread
+    sync_due = pyqtSignal()
+    state_changed = pyqtSignal()
+
+    def __init__(self, synchronizer, log_to_gui, parent=None):
+        super().__init__()
+        self.synchronizer = synchronizer
+        self.log_to_gui = log_to_gui
+        self.timer = ScheduleTimer(
+            self.run_synchronization, name="DriverSyncScheduler", log_func=log_to_gui,
+            state_path=get_user_data_dir() / SCHEDULER_STATE_FILE
+        )
+        self.running = False
+        self.paused = False
+        self.paused_remaining = None
+        self.schedule = None
+        self.parent_window = parent
+
+    def start_scheduler(self, schedule):
+        """
+        Start the scheduler to run the synchronization task on a schedule.
+        Starting a running scheduler applies the new schedule.
+
+        Args:
+            schedule (IntervalSchedule, CronSchedule or AdaptiveSchedule): When to synchronize.
+        """
+        self.log_to_gui(f"Starting scheduler to run {schedule.describe()}...", "info")
+
+        # Store the schedule for later use
+        self.schedule = schedule
+
+        # The timer thread sleeps until the next run is due; stop() wakes it up right away
+        self.running = True
+        self.paused = False
+        self.paused_remaining = None
+        self.timer.start(schedule)
+        self.state_changed.emit()
+
+    def run_synchronization(self):
+        """
+        Called on the timer thread when a run is due; hands the sync to the application.
+        """
+        self.log_to_gui("Scheduled synchronization is due.", "info")
+        self.sync_due.emit()
+        self.state_changed.emit()
+
+    def record_run(self, details):
+        """
+        Let an adaptive schedule learn from a finished scheduled sync and move the next run accordingly.
+
+        Args:
+            details (dict or None): The sync statistics, or None if the sync failed.
+        """
+        if details is None or not hasattr(self.schedule, "record_run"):
+            return
+        previous = self.schedule.interval_minutes
+        interval = self.schedule.record_run(count_changed_drivers(details))
+        if interval != previous:
+            self.log_to_gui(f"Adaptive scheduler: next run in {interval} minute(s) (was {previous}).", "info")
+        self.timer.reschedule()
+        self.state_changed.emit()
+
+    def stop_scheduler(self, forget=False):
+        """
+        Stop the scheduler. The next run time is kept for the next start (so closing DriverSync
+        does not reset the countdown) unless forget is set, e.g. when the scheduler is disabled.
+        """
+        if not self.running:
+            self.log_to_gui("Scheduler is not running.", "info")
+            return
+
+        self.log_to_gui("Stopping scheduler...", "info")
+        self.running = False
+        self.paused = False
+        self.paused_remaining = None
+        self.timer.stop(forget=forget)
+        self.log_to_gui("Scheduler stopped.", "info")
+        self.state_changed.emit()
+
+    def pause(self):
+        """
+        Hold the countdown; resume() continues it with the time that was left.
+        """
+        if not self.running or self.paused:
+            return
+        next_run = self.timer.next_run
+        self.paused_remaining = (next_run - datetime.now()).total_seconds() if next_run else None
+        self.paused = True
+        self.timer.stop()
+        self.log_to_gui("Scheduler paused.", "warning")
+        self.state_changed.emit()
+
+    def resume(self):
+        if not self.running or not self.paused:
+            return
+        self.paused = False
+        first_run = datetime.now() + timedelta(seconds=max(0, self.paused_remaining or 0))
+        self.timer.start(self.schedule, first_run=first_run)
+        self.paused_remaining = None
+        self.log_to_gui("Scheduler resumed.", "info")
+        self.state_changed.emit()
+
+    def next_run(self):
+        """
+        Time of the next scheduled run, or None when the scheduler is stopped or paused.
+        """
+        return self.timer.next_run if self.running and not self.paused else None
+
+    def remaining_seconds(self):
+        """
+        Seconds until the next run; for a paused scheduler, the time that was left when it was paused.
+        """
+        if self.paused:
+            return self.paused_remaining
+        next_run = self.next_run()
+        return max(0.0, (next_run - datetime.now()).total_seconds()) if next_run else None
+
+    def show_settings_dialog(self):
+        dialog = SchedulerSettingsDialog(self.schedule, self.parent_window)
+        if dialog.exec():
+            schedule = dialog.get_schedule()
+            if self.schedule is None or schedule.describe() != self.schedule.describe():
+                self.start_scheduler(schedule)
+
+class SchedulerSettingsDialog(QDialog):
+    """
+    Dialog to configure the synchronization schedule: an interval in minutes or a cron expression.
+    """
+    def __init__(self, current_schedule, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Scheduler Settings")
+        self.resize(400, 200)
+        self.setStyleSheet("""
+            QDialog {
+                background: qlineargradient(
+                    x1: 0, y1: 0, x2: 1, y2: 1,
+                    stop: 0 #e0f7ff, stop: 1 #ffffff
+                );
+                border-radius: 10px;
+            }
+            QLabel {
+                font-size: 14px;
+                color: #333333;
+            }
+            QListWidget {
+                background-color: white;
+                border: 1px solid #dddddd;
+                border-radius: 6px;
+                font-size: 14px;
+                color: #333333;
+            }
+        """)
+
+        # Main layout
+        layout = QVBoxLayout()
+
+        # Interval input
+        layout.addWidget(QLabel("Set Scheduler Interval (in minutes):", alignment=Qt.AlignCenter))
+        self.interval_input = QSpinBox()
+        self.interval_input.setRange(1, 7 * 24 * 60)
+        self.interval_input.setValue(current_schedule.minutes if isinstance(current_schedule, IntervalSchedule) else 60)
+        layout.addWidget(self.interval_input, alignment=Qt.AlignCenter)
+
+        # Cron input; overrides the interval when filled in
+        layout.addWidget(QLabel("Or a cron expression (minute hour day month weekday):", alignment=Qt.AlignCenter))
+        self.cron_input = QLineEdit(current_schedule.expression if isinstance(current_schedule, CronSchedule) else "")
+        self.cron_input.setPlaceholderText("e.g. */15 8-23 * * *")
+        layout.addWidget(self.cron_input)
+
+        # Buttons
+        button_layout = QHBoxLayout()
+        save_button = QPushButton("Save")
+        save_button.clicked.connect(self.validate_and_accept)
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(save_button)
+        button_layout.addWidget(cancel_button)
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+
+    def validate_and_accept(self):
+        try:
+            self.get_schedule()
+        except ValueError as e:
+            QMessageBox.warning(self, "Scheduler Settings", str(e))
+            return
+        self.accept()
+
+    def get_schedule(self):
+        """
+        Get the schedule entered by the user.
+
+        Returns:
+            CronSchedule or IntervalSchedule: The cron expression if one was entered, otherwise the interval.
+
+        Raises:
+            ValueError: If the cron expression is invalid.
+        """
+        if self.cron_input.text().strip():
+            return CronSchedule(self.cron_input.text())
+        return IntervalSchedule(self.interval_input.value())
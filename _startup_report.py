@@ -0,0 +1,48 @@
+import time
+
+
+class StartupReport:
+    """
+    Timings of the GUI start-up, from loading DriverSync.py until the main window is first painted.
+
+    Each mark closes a phase that began at the previous mark (or at the start), so the report
+    shows where the time before the first paint went.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.marks = []
+
+    def mark(self, phase):
+        """
+        Record the end of a start-up phase.
+
+        Args:
+            phase (str): Name of the phase that just finished.
+        """
+        self.marks.append((phase, time.perf_counter()))
+
+    def phases(self):
+        """
+        Returns:
+            list: (phase, milliseconds) for every phase, in order.
+        """
+        phases = []
+        previous = self.started
+        for phase, at in self.marks:
+            phases.append((phase, (at - previous) * 1000))
+            previous = at
+        return phases
+
+    def total_ms(self):
+        if not self.marks:
+            return 0.0
+        return (self.marks[-1][1] - self.started) * 1000
+
+    def summary(self):
+        """
+        Returns:
+            str: One line with the total time and the time per phase.
+        """
+        details = ", ".join(f"{phase} {ms:.0f} ms" for phase, ms in self.phases())
+        return f"Started in {self.total_ms():.0f} ms until first paint ({details})."
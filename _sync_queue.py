@@ -0,0 +1,96 @@
+import threading
+from concurrent.futures import Future
+
+
+class SyncQueue:
+    """
+    Single-consumer run queue for synchronizations.
+
+    Every trigger (Sync Now, the scheduler, the daemon's sync-now) asks the queue for a run and
+    gets a Future for its outcome. One worker thread runs the syncs one after the other. Requests
+    that arrive while a sync is running are merged into a single follow-up run, which starts after
+    the current one and so sees the files as they are then; all of them share that run's Future.
+    A burst of requests therefore costs at most two syncs: the one running and one follow-up.
+
+    The Futures are shared between the callers of a merged run, so they should not be cancelled.
+    """
+
+    def __init__(self, run, name="SyncQueue", log_func=None):
+        """
+        Args:
+            run (function): run(backup_files) performs one synchronization and returns its result.
+            name (str): Name of the worker thread.
+            log_func (function, optional): Optional logging function.
+        """
+        self.run = run
+        self.name = name
+        self.log_func = log_func
+        self.requests = 0
+        self.runs = 0
+        self._lock = threading.Lock()
+        self._pending = None
+        self._pending_backup = False
+        self._worker = None
+
+    @property
+    def busy(self):
+        """
+        Whether a sync is running or queued.
+        """
+        with self._lock:
+            return self._worker is not None
+
+    @property
+    def pending(self):
+        """
+        Whether a follow-up run is queued behind the running one.
+        """
+        with self._lock:
+            return self._pending is not None
+
+    def request(self, backup_files=False):
+        """
+        Ask for a synchronization.
+
+        Args:
+            backup_files (bool): Back up the files the sync writes. A merged run backs up if any
+                of its requests asked for it.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the result of the run that serves this request.
+        """
+        with self._lock:
+            self.requests += 1
+            merged = self._pending is not None
+            if merged:
+                self._pending_backup = self._pending_backup or backup_files
+            else:
+                self._pending = Future()
+                self._pending_backup = backup_files
+            future = self._pending
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._consume, name=self.name, daemon=True)
+                self._worker.start()
+
+        if merged and self.log_func:
+            self.log_func("A synchronization is already queued; this request will be served by it.", "info")
+        return future
+
+    def _consume(self):
+        while True:
+            with self._lock:
+                future, backup_files = self._pending, self._pending_backup
+                self._pending = None
+                if future is None:
+                    self._worker = None
+                    return
+                self.runs += 1
+
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = self.run(backup_files)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
@@ -0,0 +1,392 @@
+import json
+import os
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Waits are measured on a monotonic clock, which may not advance while the computer sleeps;
+# re-reading the wall clock at least this often keeps a long wait from overshooting a run.
+MAX_SLEEP_SECONDS = 3600
+
+# Minutes, hours, day of month, month, day of week (0 or 7 is Sunday)
+CRON_FIELDS = (("minute", 0, 59), ("hour", 0, 23), ("day", 1, 31), ("month", 1, 12), ("weekday", 0, 7))
+CRON_SEARCH_DAYS = 366 * 8
+
+# Adaptive schedule: bounds in minutes, how many runs of history it keeps, how many drivers
+# make a run count as a burst (straight to the shortest interval), and how many idle runs in a
+# row it takes before the interval starts backing off
+ADAPTIVE_DEFAULTS = {
+    "scheduler_min_minutes": 5,
+    "scheduler_max_minutes": 240,
+}
+ADAPTIVE_HISTORY_RUNS = 12
+ADAPTIVE_BURST_DRIVERS = 5
+ADAPTIVE_IDLE_RUNS_BEFORE_BACKOFF = 2
+
+
+class IntervalSchedule:
+    """
+    Runs every N minutes, counted from the previous run.
+    """
+
+    def __init__(self, minutes):
+        if minutes < 1:
+            raise ValueError("The interval must be at least one minute.")
+        self.minutes = minutes
+
+    def next_after(self, moment):
+        return moment + timedelta(minutes=self.minutes)
+
+    def describe(self):
+        if self.minutes % 60 == 0:
+            return f"every {self.minutes // 60} hour(s)"
+        return f"every {self.minutes} minute(s)"
+
+
+def file_fingerprint(path):
+    """
+    Cheap change marker of a file: its size and modification time, or None if it does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def count_changed_drivers(stats):
+    """
+    Number of drivers a sync added or removed, from its statistics.
+    """
+    return sum(stats.get(key, 0) for key in (
+        "added_to_ioverlay", "added_to_crewchief", "deleted_from_ioverlay", "deleted_from_crewchief"
+    ))
+
+
+class AdaptiveSchedule:
+    """
+    Runs at an interval that follows how busy the driver lists are. After each run the interval
+    is halved if the run changed drivers or if the synchronized files were modified since the
+    previous run, and goes straight to the minimum if the run changed many drivers. After a few
+    idle runs in a row it doubles with every further idle run, up to the maximum.
+    """
+
+    def __init__(self, min_minutes, max_minutes, paths=()):
+        if min_minutes < 1 or max_minutes < min_minutes:
+            raise ValueError("The adaptive interval needs 1 <= minimum <= maximum minutes.")
+        self.min_minutes = min_minutes
+        self.max_minutes = max_minutes
+        self.paths = [str(path) for path in paths if path]
+        self.interval_minutes = min_minutes
+        self.history = deque(maxlen=ADAPTIVE_HISTORY_RUNS)
+        self.fingerprints = None
+
+    def next_after(self, moment):
+        return moment + timedelta(minutes=self.interval_minutes)
+
+    def describe(self):
+        return f"adaptively every {self.min_minutes}-{self.max_minutes} minute(s)"
+
+    def record_run(self, changed_drivers):
+        """
+        Adapt the interval to the outcome of a run.
+
+        Args:
+            changed_drivers (int): Number of drivers the run added, changed or removed.
+
+        Returns:
+            int: The new interval in minutes.
+        """
+        # Fingerprints are taken after the run, so the sync's own writes do not count as activity
+        fingerprints = {path: file_fingerprint(path) for path in self.paths}
+        files_changed = self.fingerprints is not None and fingerprints != self.fingerprints
+        self.fingerprints = fingerprints
+        self.history.append([changed_drivers, files_changed])
+
+        if changed_drivers >= ADAPTIVE_BURST_DRIVERS:
+            interval = self.min_minutes
+        elif changed_drivers or files_changed:
+            interval = self.interval_minutes / 2
+        elif self.idle_runs() > ADAPTIVE_IDLE_RUNS_BEFORE_BACKOFF:
+            interval = self.interval_minutes * 2
+        else:
+            interval = self.interval_minutes
+        self.interval_minutes = max(self.min_minutes, min(self.max_minutes, round(interval)))
+        return self.interval_minutes
+
+    def idle_runs(self):
+        """
+        Number of runs in a row, up to the latest, that changed nothing.
+        """
+        idle = 0
+        for changed_drivers, files_changed in reversed(self.history):
+            if changed_drivers or files_changed:
+                break
+            idle += 1
+        return idle
+
+    def get_state(self):
+        return {
+            "interval_minutes": self.interval_minutes,
+            "history": list(self.history),
+            "fingerprints": self.fingerprints,
+        }
+
+    def set_state(self, state):
+        self.interval_minutes = max(self.min_minutes, min(self.max_minutes, state.get("interval_minutes", self.min_minutes)))
+        self.history.clear()
+        self.history.extend(state.get("history", []))
+        self.fingerprints = state.get("fingerprints")
+
+
+def parse_cron_field(text, name, low, high):
+    """
+    Parse one cron field: *, a number, a range a-b, a step */n or a-b/n, or a comma-separated list of those.
+
+    Returns:
+        set: The values the field matches.
+    """
+    values = set()
+    for part in text.split(","):
+        base, _, step = part.partition("/")
+        try:
+            step = int(step) if step else 1
+            if base == "*":
+                first, last = low, high
+            elif "-" in base:
+                first, last = (int(value) for value in base.split("-", 1))
+            else:
+                first = int(base)
+                last = high if step != 1 or "/" in part else first
+        except ValueError:
+            raise ValueError(f"Invalid cron {name} '{part}'.")
+        if step < 1 or not low <= first <= last <= high:
+            raise ValueError(f"Cron {name} '{part}' is out of range ({low}-{high}).")
+        values.update(range(first, last + 1, step))
+    return values
+
+
+class CronSchedule:
+    """
+    Runs at the times matched by a five-field cron expression (minute hour day month weekday).
+    As in cron, when both day and weekday are restricted a time matching either one runs.
+    """
+
+    def __init__(self, expression):
+        fields = expression.split()
+        if len(fields) != len(CRON_FIELDS):
+            raise ValueError("A cron expression needs five fields: minute hour day month weekday.")
+        self.expression = " ".join(fields)
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            parse_cron_field(text, name, low, high) for text, (name, low, high) in zip(fields, CRON_FIELDS)
+        )
+        self.weekdays = {weekday % 7 for weekday in weekdays}
+        self.any_day = fields[2] == "*"
+        self.any_weekday = fields[4] == "*"
+        # Rejects expressions that can never run, such as February 31st
+        self.next_after(datetime.now())
+
+    def _day_matches(self, moment):
+        day = moment.day in self.days
+        weekday = (moment.weekday() + 1) % 7 in self.weekdays
+        if not self.any_day and not self.any_weekday:
+            return day or weekday
+        return day and weekday
+
+    def next_after(self, moment):
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=CRON_SEARCH_DAYS)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                candidate = (candidate.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression '{self.expression}' never runs.")
+
+    def describe(self):
+        return f"cron '{self.expression}'"
+
+
+def schedule_from_config(config):
+    """
+    Build the configured synchronization schedule: scheduler_cron if set, otherwise the adaptive
+    schedule if scheduler_adaptive is on, otherwise scheduler_interval_minutes, otherwise the
+    hours in the older scheduler_interval setting.
+
+    Returns:
+        IntervalSchedule, CronSchedule or None: None when the scheduler is off.
+
+    Raises:
+        ValueError: If the cron expression is invalid.
+    """
+    if config.get("scheduler_cron"):
+        return CronSchedule(config["scheduler_cron"])
+    if config.get("scheduler_adaptive"):
+        return AdaptiveSchedule(
+            int(config.get("scheduler_min_minutes") or ADAPTIVE_DEFAULTS["scheduler_min_minutes"]),
+            int(config.get("scheduler_max_minutes") or ADAPTIVE_DEFAULTS["scheduler_max_minutes"]),
+            [config.get("ioverlay_settings_path"), config.get("crewchief_reputations_path")],
+        )
+    if config.get("scheduler_interval_minutes"):
+        return IntervalSchedule(int(config["scheduler_interval_minutes"]))
+    if config.get("scheduler_interval"):
+        return IntervalSchedule(int(config["scheduler_interval"]) * 60)
+    return None
+
+
+class ScheduleTimer:
+    """
+    Runs a job on a schedule. Between runs the timer thread blocks on a condition until the next
+    run is due, so it does not poll, and it wakes up immediately on stop() or a new start().
+
+    With a state file, the next run time is saved whenever it changes, so a restart continues the
+    countdown instead of starting over. Runs missed while the program was not running, or while
+    the computer slept, are collapsed into a single catch-up run as soon as the timer is running.
+    """
+
+    def __init__(self, job, schedule=None, name="Scheduler", log_func=None, state_path=None):
+        self.job = job
+        self.schedule = schedule
+        self.name = name
+        self.log_func = log_func
+        self.state_path = Path(state_path) if state_path else None
+        self._condition = threading.Condition()
+        self._generation = 0
+        self._running = False
+        self._next_run = None
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._running
+
+    @property
+    def next_run(self):
+        """
+        Time of the next run, or None if the timer is stopped.
+        """
+        with self._condition:
+            return self._next_run if self._running else None
+
+    def start(self, schedule=None, first_run=None):
+        """
+        Start the timer on a daemon thread. The first run is first_run if given, otherwise the
+        saved next run time of the same schedule, otherwise the schedule's next time from now.
+        Starting a running timer replaces its schedule.
+        """
+        with self._condition:
+            generation = self._activate(schedule, first_run)
+        self._thread = threading.Thread(target=self._run, args=(generation,), name=self.name, daemon=True)
+        self._thread.start()
+
+    def run(self, schedule=None):
+        """
+        Run the timer on the calling thread until stop() is called.
+        """
+        with self._condition:
+            generation = self._activate(schedule, None)
+        self._run(generation)
+
+    def reschedule(self):
+        """
+        Recompute the next run from now, e.g. after an adaptive schedule changed its interval.
+        """
+        with self._condition:
+            if not self._running:
+                return
+            self._set_next_run(self.schedule.next_after(datetime.now()))
+            self._condition.notify_all()
+
+    def stop(self, forget=False):
+        """
+        Stop the timer. A job that is running is finished, but no further run starts.
+        The saved next run time is kept for the next start unless forget is set.
+        """
+        with self._condition:
+            self._generation += 1
+            self._running = False
+            self._next_run = None
+            self._condition.notify_all()
+        if forget and self.state_path:
+            try:
+                self.state_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _activate(self, schedule, first_run):
+        if schedule is not None:
+            self.schedule = schedule
+        now = datetime.now()
+        if first_run is None:
+            first_run = self._load_next_run()
+            if first_run is not None and first_run <= now:
+                self._log(f"Missed the scheduled run of {first_run:%Y-%m-%d %H:%M}; running once to catch up.", "info")
+        if first_run is None:
+            first_run = self.schedule.next_after(now)
+        # A new generation retires any thread of an earlier start, even one that has not woken up yet
+        self._generation += 1
+        self._running = True
+        self._set_next_run(first_run)
+        self._condition.notify_all()
+        return self._generation
+
+    def _run(self, generation):
+        while True:
+            with self._condition:
+                while self._generation == generation:
+                    remaining = (self._next_run - datetime.now()).total_seconds()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(min(remaining, MAX_SLEEP_SECONDS))
+                if self._generation != generation:
+                    return
+                # Scheduled from now: any runs missed meanwhile are covered by this one
+                self._set_next_run(self.schedule.next_after(datetime.now()))
+
+            try:
+                self.job()
+            except Exception as e:
+                self._log(f"Scheduled job failed: {e}", "error")
+
+    def _set_next_run(self, next_run):
+        self._next_run = next_run
+        if not self.state_path:
+            return
+        try:
+            state = {
+                "schedule": self.schedule.describe(),
+                "next_run": next_run.isoformat(timespec="seconds"),
+            }
+            if hasattr(self.schedule, "get_state"):
+                state["policy"] = self.schedule.get_state()
+            self.state_path.write_text(json.dumps(state), encoding="utf-8")
+        except OSError as e:
+            self._log(f"Failed to save the next scheduled run: {e}", "warning")
+
+    def _load_next_run(self):
+        """
+        The saved next run time, if it was saved for the current schedule. The saved state of an
+        adaptive schedule is restored along with it.
+        """
+        if not self.state_path:
+            return None
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+            if state.get("schedule") == self.schedule.describe():
+                if "policy" in state and hasattr(self.schedule, "set_state"):
+                    self.schedule.set_state(state["policy"])
+                return datetime.fromisoformat(state["next_run"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _log(self, message, level):
+        if self.log_func:
+            self.log_func(message, level)
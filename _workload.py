@@ -0,0 +1,224 @@
+import argparse
+import json
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+IOVERLAY_FILE = "settings.dat"
+CREWCHIEF_FILE = "iracing_reputations.json"
+
+# Category names as users create them; CrewChief is the one DriverSync adds itself
+CATEGORY_NAMES = ["Dirty", "Clean", "Fast", "Slow", "Friend", "Rookie", "Aggressive", "Team", "Blocker", "Wrecker"]
+CAR_CLASSES = ["", "", "", "GT3 Class", "GT4 Class", "LMP2", "Porsche 911 GT3 Cup", "Mazda MX-5 Cup", "Dallara F3"]
+COMMENTS = ["", "", "Added from iOverlay", "Dive bomber", "Clean racer", "Brake checks", "Ignores blue flags"]
+SYLLABLES = ["an", "ber", "car", "de", "el", "fi", "gar", "hen", "is", "jo", "ka", "lo", "mar", "ne", "ol",
+             "pe", "qui", "ro", "sen", "ta", "ul", "va", "wil", "xe", "yo", "zu", "ä", "é", "ø", "ñ"]
+# Identifiers iOverlay and CrewChief files turn out to contain besides valid customer ids
+INVALID_IDENTIFIERS = ["", "n/a", "unknown", "12a34", " 4711 ", "-5", "0x1F", "1e6"]
+INVALID_CUSTOMER_IDS = ["", "n/a", None, -1, 0, "12a34", 3.5]
+# Customer ids are drawn from this range, like iRacing's
+CUSTOMER_ID_RANGE = (10000, 1500000)
+# Dates in the CrewChief file are spread over the years before this day, so a seed always gives the same file
+REFERENCE_DATE = date(2025, 1, 1)
+
+
+class WorkloadGenerator:
+    """
+    Writes synthetic iOverlay settings.dat and CrewChief iracing_reputations.json files, to measure
+    and tune DriverSync on large inputs.
+
+    The driver count is the number of distinct drivers over both files. The overlap ratio is the
+    share of them that is in both files; the others are split evenly between iOverlay only and
+    CrewChief only. On top of that, duplicate_rate adds that share of extra entries that repeat a
+    driver already in the same file, and invalid_id_rate replaces that share of the identifiers with
+    ones that are not customer ids. Name lengths follow a normal distribution. The same parameters
+    and seed always produce the same files.
+    """
+
+    def __init__(self, drivers=1000, overlap=0.5, duplicate_rate=0.0, invalid_id_rate=0.0,
+                 name_length_mean=14, name_length_sd=4, categories=5, module_data_kb=0, seed=None):
+        """
+        Args:
+            drivers (int): Number of distinct drivers over both files.
+            overlap (float): Share of the drivers that is in both files (0-1).
+            duplicate_rate (float): Extra entries per file, as a share of its drivers, repeating a driver (0-1).
+            invalid_id_rate (float): Share of the entries per file given an invalid identifier (0-1).
+            name_length_mean (float): Mean length of a driver name in characters.
+            name_length_sd (float): Standard deviation of the name length.
+            categories (int): Number of iOverlay tag categories, including CrewChief.
+            module_data_kb (int): Approximate size of the unrelated iOverlay module data in KiB.
+            seed (int, optional): Seed for the random generator; None gives different files every run.
+
+        Raises:
+            ValueError: If a parameter is out of range.
+        """
+        for name, rate in (("overlap", overlap), ("duplicate_rate", duplicate_rate), ("invalid_id_rate", invalid_id_rate)):
+            if not 0 <= rate <= 1:
+                raise ValueError(f"{name} must be between 0 and 1, not {rate}")
+        if drivers < 0 or module_data_kb < 0:
+            raise ValueError("drivers and module_data_kb cannot be negative")
+        if categories < 1:
+            raise ValueError("At least one category (CrewChief) is needed")
+        if name_length_mean < 1 or name_length_sd < 0:
+            raise ValueError("name_length_mean must be at least 1 and name_length_sd cannot be negative")
+        if drivers > CUSTOMER_ID_RANGE[1] - CUSTOMER_ID_RANGE[0]:
+            raise ValueError(f"At most {CUSTOMER_ID_RANGE[1] - CUSTOMER_ID_RANGE[0]} drivers can be generated")
+
+        self.drivers = drivers
+        self.overlap = overlap
+        self.duplicate_rate = duplicate_rate
+        self.invalid_id_rate = invalid_id_rate
+        self.name_length_mean = name_length_mean
+        self.name_length_sd = name_length_sd
+        self.categories = categories
+        self.module_data_kb = module_data_kb
+        self.seed = seed
+
+    def generate(self):
+        """
+        Generate the contents of both files.
+
+        Returns:
+            tuple: (ioverlay_data, crewchief_data) as written to settings.dat and iracing_reputations.json.
+        """
+        rng = random.Random(self.seed)
+
+        customer_ids = rng.sample(range(*CUSTOMER_ID_RANGE), self.drivers)
+        people = [(customer_id, self._name(rng)) for customer_id in customer_ids]
+        shared = round(self.drivers * self.overlap)
+        ioverlay_only = (self.drivers - shared + 1) // 2
+        ioverlay_people = people[:shared + ioverlay_only]
+        crewchief_people = people[:shared] + people[shared + ioverlay_only:]
+
+        tagcategories = self._categories(rng)
+        category_ids = [category["id"] for category in tagcategories]
+        drivertags = [
+            {"id": 0, "identifier": str(customer_id), "name": name, "tagId": rng.choice(category_ids)}
+            for customer_id, name in ioverlay_people
+        ]
+        drivertags = self._add_duplicates(rng, drivertags, lambda tag: {**tag, "tagId": rng.choice(category_ids)})
+        self._invalidate(rng, drivertags, "identifier", INVALID_IDENTIFIERS)
+        for tag_id, tag in enumerate(drivertags, start=1):
+            tag["id"] = tag_id
+
+        crewchief_data = [self._reputation(rng, customer_id, name) for customer_id, name in crewchief_people]
+        crewchief_data = self._add_duplicates(
+            rng, crewchief_data, lambda entry: self._reputation(rng, entry["customer_id"], entry["name"])
+        )
+        self._invalidate(rng, crewchief_data, "customer_id", INVALID_CUSTOMER_IDS)
+
+        rng.shuffle(drivertags)
+        rng.shuffle(crewchief_data)
+        modules = self._module_data(rng)
+        modules["drivertagging"] = {"tagcategory": tagcategories, "drivertag": drivertags}
+        return {"modules": modules}, crewchief_data
+
+    def write(self, folder):
+        """
+        Generate both files and write them to a folder, formatted as DriverSync writes them.
+
+        Args:
+            folder (str or Path): Folder to write settings.dat and iracing_reputations.json to.
+
+        Returns:
+            dict: The paths written and the number of entries and bytes per file.
+        """
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        ioverlay_data, crewchief_data = self.generate()
+        summary = {}
+        for file_name, data, entries in (
+            (IOVERLAY_FILE, ioverlay_data, ioverlay_data["modules"]["drivertagging"]["drivertag"]),
+            (CREWCHIEF_FILE, crewchief_data, crewchief_data),
+        ):
+            path = folder / file_name
+            payload = json.dumps(data, indent=4).encode("utf-8")
+            path.write_bytes(payload)
+            summary[file_name] = {"path": str(path), "entries": len(entries), "bytes": len(payload)}
+        return summary
+
+    def _name(self, rng):
+        length = max(2, min(64, round(rng.gauss(self.name_length_mean, self.name_length_sd))))
+        letters = ""
+        while len(letters) < length:
+            letters += rng.choice(SYLLABLES)
+        letters = letters[:length]
+        if length < 5:
+            return letters.capitalize()
+        # First and last name; the space is never the first or last character
+        split = rng.randint(2, length - 3)
+        return f"{letters[:split].capitalize()} {letters[split + 1:].capitalize()}"
+
+    def _categories(self, rng):
+        names = CATEGORY_NAMES[:self.categories - 1]
+        names += [f"Category {number}" for number in range(len(names) + 1, self.categories)]
+        names.append("CrewChief")
+        return [
+            {"id": category_id, "name": name, "color": f"#{rng.randrange(0x1000000):06X}"}
+            for category_id, name in enumerate(names, start=1)
+        ]
+
+    def _reputation(self, rng, customer_id, name):
+        return {
+            "customer_id": customer_id,
+            "name": name,
+            "date": (REFERENCE_DATE - timedelta(days=rng.randrange(3 * 365))).isoformat(),
+            "carClass": rng.choice(CAR_CLASSES),
+            "comment": rng.choice(COMMENTS),
+        }
+
+    def _add_duplicates(self, rng, entries, copy):
+        if not entries:
+            return entries
+        duplicates = [copy(rng.choice(entries)) for _ in range(round(len(entries) * self.duplicate_rate))]
+        return entries + duplicates
+
+    def _invalidate(self, rng, entries, key, invalid_values):
+        for entry in rng.sample(entries, round(len(entries) * self.invalid_id_rate)):
+            entry[key] = rng.choice(invalid_values)
+
+    def _module_data(self, rng):
+        """
+        Settings of other iOverlay modules, which DriverSync has to read and write back unchanged.
+        """
+        modules = {}
+        size = 0
+        while size < self.module_data_kb * 1024:
+            name = f"overlay{len(modules) + 1}"
+            modules[name] = {
+                "enabled": rng.random() < 0.5,
+                "position": {"x": rng.randrange(3840), "y": rng.randrange(2160)},
+                "opacity": round(rng.random(), 2),
+                "columns": [
+                    {"id": column, "width": rng.randrange(20, 200), "visible": rng.random() < 0.8}
+                    for column in range(rng.randrange(5, 30))
+                ],
+            }
+            size += len(json.dumps(modules[name], indent=4))
+        return modules
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write synthetic settings.dat and iracing_reputations.json files.")
+    parser.add_argument("folder", help="Folder to write the files to.")
+    parser.add_argument("--drivers", type=int, default=1000, help="Number of distinct drivers over both files.")
+    parser.add_argument("--overlap", type=float, default=0.5, help="Share of the drivers in both files (0-1).")
+    parser.add_argument("--duplicates", type=float, default=0.0, help="Share of extra entries repeating a driver (0-1).")
+    parser.add_argument("--invalid-ids", type=float, default=0.0, help="Share of entries with an invalid identifier (0-1).")
+    parser.add_argument("--name-length", type=float, default=14, help="Mean length of driver names.")
+    parser.add_argument("--name-length-sd", type=float, default=4, help="Standard deviation of the name length.")
+    parser.add_argument("--categories", type=int, default=5, help="Number of tag categories, including CrewChief.")
+    parser.add_argument("--module-data-kb", type=int, default=0, help="Approximate KiB of unrelated iOverlay module data.")
+    parser.add_argument("--seed", type=int, help="Seed, to generate the same files again.")
+    args = parser.parse_args()
+
+    try:
+        generator = WorkloadGenerator(
+            drivers=args.drivers, overlap=args.overlap, duplicate_rate=args.duplicates,
+            invalid_id_rate=args.invalid_ids, name_length_mean=args.name_length, name_length_sd=args.name_length_sd,
+            categories=args.categories, module_data_kb=args.module_data_kb, seed=args.seed
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    for file_name, details in generator.write(args.folder).items():
+        print(f"{details['path']}: {details['entries']} entries, {details['bytes'] / 1024:.0f} KiB")